@@ -1,3 +1,4 @@
 from .framework import CollisionFramework, Collidable
+from .grid import OccupancyGrid
 
-__all__ = ['CollisionFramework', 'Collidable']
+__all__ = ['CollisionFramework', 'Collidable', 'OccupancyGrid']
@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+import math
+import numpy as np
 
 
 class Collidable(ABC):
@@ -19,13 +21,95 @@ class Collidable(ABC):
         """
         pass
 
+    def check_collision_batch(self, xs, zs, radii):
+        """
+        Verifica vários pontos de uma vez.
+
+        A implementação padrão chama check_collision para cada ponto;
+        subclasses podem sobrescrever com uma versão vetorizada.
+
+        Args:
+            xs: Array NumPy de coordenadas X
+            zs: Array NumPy de coordenadas Z
+            radii: Array NumPy de raios (mesmo formato de xs)
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde há colisão
+        """
+        return np.fromiter(
+            (self.check_collision(x, z, r) for x, z, r in zip(xs, zs, radii)),
+            dtype=bool, count=len(xs)
+        )
+
+    # Passo usado pela implementação genérica de raycast
+    RAYCAST_STEP = 0.05
+
+    def raycast(self, origin_x, origin_z, dir_x, dir_z, max_distance, radius=0.0):
+        """
+        Encontra o primeiro ponto em que um círculo percorrendo um raio colide.
+
+        A implementação padrão avança em passos de RAYCAST_STEP usando
+        check_collision; subclasses podem sobrescrever com uma versão analítica.
+
+        Args:
+            origin_x: Coordenada X da origem
+            origin_z: Coordenada Z da origem
+            dir_x: Componente X da direção (unitária)
+            dir_z: Componente Z da direção (unitária)
+            max_distance: Distância máxima do raio
+            radius: Raio do círculo
+
+        Returns:
+            tuple: (distância, (nx, nz)) do impacto, ou None
+        """
+        distance = 0.0
+        while distance <= max_distance:
+            if self.check_collision(origin_x + dir_x * distance, origin_z + dir_z * distance, radius):
+                return distance, (-dir_x, -dir_z)
+            distance += self.RAYCAST_STEP
+        return None
+
+    def get_bounds(self):
+        """
+        Obtém a caixa delimitadora alinhada aos eixos do objeto no plano XZ.
+
+        Objetos que retornam None não são indexados espacialmente e são
+        verificados em todas as consultas.
+
+        Returns:
+            tuple: (min_x, min_z, max_x, max_z) ou None
+        """
+        return None
+
 
 class CollisionFramework:
     """Framework para gerenciar detecção de colisão no jogo."""
 
-    def __init__(self):
-        """Inicializa o framework de colisão."""
+    def __init__(self, cell_size=5.0):
+        """
+        Inicializa o framework de colisão.
+
+        Args:
+            cell_size: Tamanho das células da grade espacial (igual ao
+                       MazeFramework.cell_size para alinhar com o labirinto)
+        """
         self.collidables = []
+        self.cell_size = cell_size
+
+        # Grade espacial uniforme: (célula_x, célula_z) -> lista de colidíveis
+        self._grid = {}
+        self._cells_by_collidable = {}
+        # Colidíveis sem caixa delimitadora (sempre verificados)
+        self._unbounded = []
+
+    def _cell_range(self, min_x, min_z, max_x, max_z):
+        """Converte uma caixa delimitadora em intervalo de células da grade."""
+        size = self.cell_size
+        min_cx = math.floor(min_x / size)
+        min_cz = math.floor(min_z / size)
+        max_cx = max(min_cx, math.ceil(max_x / size) - 1)
+        max_cz = max(min_cz, math.ceil(max_z / size) - 1)
+        return min_cx, min_cz, max_cx, max_cz
 
     def add_collidable(self, collidable):
         """
@@ -38,6 +122,19 @@ class CollisionFramework:
             raise TypeError("Object must inherit from Collidable")
         self.collidables.append(collidable)
 
+        bounds = collidable.get_bounds()
+        if bounds is None:
+            self._unbounded.append(collidable)
+            return
+
+        min_cx, min_cz, max_cx, max_cz = self._cell_range(*bounds)
+        cells = []
+        for cx in range(min_cx, max_cx + 1):
+            for cz in range(min_cz, max_cz + 1):
+                self._grid.setdefault((cx, cz), []).append(collidable)
+                cells.append((cx, cz))
+        self._cells_by_collidable[id(collidable)] = cells
+
     def remove_collidable(self, collidable):
         """
         Remove um objeto colidível do sistema de colisão.
@@ -48,6 +145,36 @@ class CollisionFramework:
         if collidable in self.collidables:
             self.collidables.remove(collidable)
 
+        if collidable in self._unbounded:
+            self._unbounded.remove(collidable)
+
+        for cell in self._cells_by_collidable.pop(id(collidable), []):
+            bucket = self._grid[cell]
+            bucket.remove(collidable)
+            if not bucket:
+                del self._grid[cell]
+
+    def _candidates(self, x, z, radius):
+        """
+        Obtém os colidíveis que podem intersectar o círculo consultado.
+
+        Apenas as células da grade cobertas pelo círculo são visitadas.
+        """
+        min_cx = math.floor((x - radius) / self.cell_size)
+        max_cx = math.floor((x + radius) / self.cell_size)
+        min_cz = math.floor((z - radius) / self.cell_size)
+        max_cz = math.floor((z + radius) / self.cell_size)
+
+        yield from self._unbounded
+
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cz in range(min_cz, max_cz + 1):
+                for collidable in self._grid.get((cx, cz), ()):
+                    if id(collidable) not in seen:
+                        seen.add(id(collidable))
+                        yield collidable
+
     def check_collision(self, x, z, radius=0.5):
         """
         Verifica se uma posição colide com qualquer objeto colidível registrado.
@@ -60,11 +187,96 @@ class CollisionFramework:
         Returns:
             bool: True se colisão detectada, False caso contrário
         """
-        for collidable in self.collidables:
+        for collidable in self._candidates(x, z, radius):
             if collidable.check_collision(x, z, radius):
                 return True
         return False
 
+    def check_collision_batch(self, xs, zs, radius=0.5):
+        """
+        Verifica várias posições de uma vez em uma passagem vetorizada.
+
+        Args:
+            xs: Sequência ou array de coordenadas X
+            zs: Sequência ou array de coordenadas Z
+            radius: Raio de colisão (escalar ou array do mesmo tamanho)
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde há colisão
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        zs = np.asarray(zs, dtype=np.float64).ravel()
+        radii = np.broadcast_to(np.asarray(radius, dtype=np.float64), xs.shape)
+        mask = np.zeros(xs.shape, dtype=bool)
+        if xs.size == 0:
+            return mask
+
+        for collidable in self._batch_candidates(xs, zs, radii):
+            pending = ~mask
+            if not pending.any():
+                break
+            mask[pending] = collidable.check_collision_batch(xs[pending], zs[pending], radii[pending])
+        return mask
+
+    def _batch_candidates(self, xs, zs, radii):
+        """Obtém os colidíveis nas células cobertas pelo conjunto de consultas."""
+        min_cx = math.floor((xs - radii).min() / self.cell_size)
+        max_cx = math.floor((xs + radii).max() / self.cell_size)
+        min_cz = math.floor((zs - radii).min() / self.cell_size)
+        max_cz = math.floor((zs + radii).max() / self.cell_size)
+
+        yield from self._unbounded
+
+        # Percorre o menor entre o retângulo de células e as células ocupadas
+        if (max_cx - min_cx + 1) * (max_cz - min_cz + 1) > len(self._grid):
+            cells = [cell for cell in self._grid
+                     if min_cx <= cell[0] <= max_cx and min_cz <= cell[1] <= max_cz]
+        else:
+            cells = [(cx, cz) for cx in range(min_cx, max_cx + 1)
+                     for cz in range(min_cz, max_cz + 1)]
+
+        seen = set()
+        for cell in cells:
+            for collidable in self._grid.get(cell, ()):
+                if id(collidable) not in seen:
+                    seen.add(id(collidable))
+                    yield collidable
+
+    def raycast(self, origin, direction, max_distance, radius=0.0):
+        """
+        Lança um raio no plano XZ contra todos os objetos colidíveis.
+
+        Args:
+            origin: Origem (x, z) do raio
+            direction: Direção (x, z) do raio (não precisa ser unitária)
+            max_distance: Distância máxima do raio
+            radius: Raio do círculo que percorre o raio
+
+        Returns:
+            tuple: (distância, (nx, nz)) do impacto mais próximo, ou None
+        """
+        origin_x, origin_z = float(origin[0]), float(origin[1])
+        length = math.hypot(direction[0], direction[1])
+        if length < 1e-12 or max_distance < 0:
+            return None
+        dir_x = direction[0] / length
+        dir_z = direction[1] / length
+
+        # Candidatos nas células cobertas pelo segmento do raio
+        end_x = origin_x + dir_x * max_distance
+        end_z = origin_z + dir_z * max_distance
+        candidates = self._batch_candidates(
+            np.array([origin_x, end_x]), np.array([origin_z, end_z]), np.array([radius, radius])
+        )
+
+        best = None
+        for collidable in candidates:
+            limit = best[0] if best is not None else max_distance
+            hit = collidable.raycast(origin_x, origin_z, dir_x, dir_z, limit, radius)
+            if hit is not None and (best is None or hit[0] < best[0]):
+                best = hit
+        return best
+
     def get_colliding_objects(self, x, z, radius=0.5):
         """
         Obtém todos os objetos que colidem com a posição fornecida.
@@ -78,7 +290,7 @@ class CollisionFramework:
             list: Lista de objetos Collidable em colisão
         """
         colliding = []
-        for collidable in self.collidables:
+        for collidable in self._candidates(x, z, radius):
             if collidable.check_collision(x, z, radius):
                 colliding.append(collidable)
         return colliding
@@ -0,0 +1,239 @@
+"""
+Colisão por grade de ocupação construída diretamente da grade do labirinto.
+
+Cada célula '#' é um quadrado sólido de lado cell_size, no mesmo sistema de
+coordenadas de MazeFramework.get_world_position. Uma consulta examina apenas
+as células sobrepostas pelo círculo, independentemente do tamanho do labirinto.
+"""
+
+import math
+import numpy as np
+from .framework import Collidable
+from .raycast import ray_box
+
+
+class OccupancyGrid(Collidable):
+    """Colidível único que representa todas as paredes de um labirinto."""
+
+    def __init__(self, occupancy, cell_size=5.0):
+        """
+        Inicializa a grade de ocupação.
+
+        Args:
+            occupancy: Array booleano (linhas, colunas), True = parede sólida
+            cell_size: Tamanho de cada célula da grade
+        """
+        self.occupancy = np.asarray(occupancy, dtype=bool)
+        self.cell_size = cell_size
+        self.rows, self.cols = self.occupancy.shape
+
+        # Canto mínimo (x, z) da célula (0, 0) no mundo
+        self.origin_x = -(self.cols / 2 + 0.5) * cell_size
+        self.origin_z = -(self.rows / 2 + 0.5) * cell_size
+
+    @classmethod
+    def from_grid(cls, grid, cell_size=5.0):
+        """
+        Constrói a grade de ocupação a partir de uma grade ASCII de labirinto.
+
+        Args:
+            grid: Lista 2D de caracteres ('#' = parede)
+            cell_size: Tamanho de cada célula da grade
+
+        Returns:
+            OccupancyGrid: Nova grade de ocupação
+        """
+        occupancy = np.array([[cell == '#' for cell in row] for row in grid], dtype=bool)
+        return cls(occupancy.reshape(len(grid), -1), cell_size)
+
+    def world_to_cell(self, x, z):
+        """
+        Converte coordenadas do mundo para a célula da grade que as contém.
+
+        Returns:
+            tuple: (linha, coluna), possivelmente fora dos limites da grade
+        """
+        col = math.floor((x - self.origin_x) / self.cell_size)
+        row = math.floor((z - self.origin_z) / self.cell_size)
+        return row, col
+
+    def is_wall(self, row, col):
+        """Verifica se uma célula é parede (células fora da grade são livres)."""
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return bool(self.occupancy[row, col])
+        return False
+
+    def check_collision(self, x, z, radius=0.5):
+        """
+        Verifica se um círculo colide com alguma célula sólida.
+
+        Args:
+            x: Coordenada X do ponto
+            z: Coordenada Z do ponto
+            radius: Raio de colisão ao redor do ponto
+
+        Returns:
+            bool: True se colisão detectada, False caso contrário
+        """
+        size = self.cell_size
+
+        # Intervalo de células sobrepostas pelo quadrado que envolve o círculo
+        min_col = max(0, math.floor((x - radius - self.origin_x) / size))
+        max_col = min(self.cols - 1, math.floor((x + radius - self.origin_x) / size))
+        min_row = max(0, math.floor((z - radius - self.origin_z) / size))
+        max_row = min(self.rows - 1, math.floor((z + radius - self.origin_z) / size))
+        if min_col > max_col or min_row > max_row:
+            return False
+
+        block = self.occupancy[min_row:max_row + 1, min_col:max_col + 1]
+        if not block.any():
+            return False
+
+        # Distância do ponto a cada coluna/linha de células (0 se dentro)
+        cols = np.arange(min_col, max_col + 1)
+        rows = np.arange(min_row, max_row + 1)
+        cell_min_x = self.origin_x + cols * size
+        cell_min_z = self.origin_z + rows * size
+        dx = np.maximum(np.maximum(cell_min_x - x, x - (cell_min_x + size)), 0.0)
+        dz = np.maximum(np.maximum(cell_min_z - z, z - (cell_min_z + size)), 0.0)
+
+        distance_squared = dz[:, None] ** 2 + dx[None, :] ** 2
+        return bool((block & (distance_squared < radius * radius)).any())
+
+    def check_collision_batch(self, xs, zs, radii):
+        """
+        Verifica vários círculos contra a grade de forma vetorizada.
+
+        Para cada deslocamento dentro da maior janela de células consultada,
+        todas as consultas são testadas em conjunto.
+
+        Args:
+            xs: Array NumPy de coordenadas X
+            zs: Array NumPy de coordenadas Z
+            radii: Array NumPy de raios
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde há colisão
+        """
+        size = self.cell_size
+        min_col = np.floor((xs - radii - self.origin_x) / size).astype(np.int64)
+        max_col = np.floor((xs + radii - self.origin_x) / size).astype(np.int64)
+        min_row = np.floor((zs - radii - self.origin_z) / size).astype(np.int64)
+        max_row = np.floor((zs + radii - self.origin_z) / size).astype(np.int64)
+
+        mask = np.zeros(xs.shape, dtype=bool)
+        if xs.size == 0:
+            return mask
+
+        span_cols = int((max_col - min_col).max()) + 1
+        span_rows = int((max_row - min_row).max()) + 1
+        radius_squared = radii * radii
+
+        for row_offset in range(span_rows):
+            rows = min_row + row_offset
+            for col_offset in range(span_cols):
+                cols = min_col + col_offset
+                valid = ((rows <= max_row) & (cols <= max_col) &
+                         (rows >= 0) & (rows < self.rows) &
+                         (cols >= 0) & (cols < self.cols))
+                valid[valid] = self.occupancy[rows[valid], cols[valid]]
+                if not valid.any():
+                    continue
+
+                cell_min_x = self.origin_x + cols * size
+                cell_min_z = self.origin_z + rows * size
+                dx = np.maximum(np.maximum(cell_min_x - xs, xs - (cell_min_x + size)), 0.0)
+                dz = np.maximum(np.maximum(cell_min_z - zs, zs - (cell_min_z + size)), 0.0)
+                mask |= valid & (dx * dx + dz * dz < radius_squared)
+
+        return mask
+
+    def _cell_bounds(self, row, col):
+        """Obtém a caixa (min_x, min_z, max_x, max_z) de uma célula."""
+        min_x = self.origin_x + col * self.cell_size
+        min_z = self.origin_z + row * self.cell_size
+        return (min_x, min_z, min_x + self.cell_size, min_z + self.cell_size)
+
+    def raycast(self, origin_x, origin_z, dir_x, dir_z, max_distance, radius=0.0):
+        """
+        Lança um raio pela grade usando travessia DDA.
+
+        Percorre apenas as células cruzadas pelo raio, testando as paredes a
+        até ceil(radius / cell_size) células de distância de cada uma.
+
+        Args:
+            origin_x: Coordenada X da origem
+            origin_z: Coordenada Z da origem
+            dir_x: Componente X da direção (unitária)
+            dir_z: Componente Z da direção (unitária)
+            max_distance: Distância máxima do raio
+            radius: Raio do círculo que percorre o raio
+
+        Returns:
+            tuple: (distância, (nx, nz)) do impacto, ou None
+        """
+        size = self.cell_size
+        ring = math.ceil(radius / size) if radius > 0 else 0
+
+        # O raio só pode atingir paredes dentro da grade expandida pelo anel
+        grid_bounds = (self.origin_x - ring * size, self.origin_z - ring * size,
+                       self.origin_x + (self.cols + ring) * size,
+                       self.origin_z + (self.rows + ring) * size)
+        entry = ray_box(origin_x, origin_z, dir_x, dir_z, grid_bounds)
+        if entry is None or entry[0] > max_distance:
+            return None
+
+        # Começa a travessia no ponto de entrada na grade
+        t_start = entry[0]
+        start_x = origin_x + dir_x * t_start
+        start_z = origin_z + dir_z * t_start
+        row, col = self.world_to_cell(start_x, start_z)
+
+        step_col = 1 if dir_x > 0 else -1
+        step_row = 1 if dir_z > 0 else -1
+        if abs(dir_x) > 1e-12:
+            next_x = self.origin_x + (col + (step_col > 0)) * size
+            t_max_x = t_start + (next_x - start_x) / dir_x
+            t_delta_x = size / abs(dir_x)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if abs(dir_z) > 1e-12:
+            next_z = self.origin_z + (row + (step_row > 0)) * size
+            t_max_z = t_start + (next_z - start_z) / dir_z
+            t_delta_z = size / abs(dir_z)
+        else:
+            t_max_z = t_delta_z = math.inf
+
+        limit = min(max_distance, entry[0] + math.hypot(
+            grid_bounds[2] - grid_bounds[0], grid_bounds[3] - grid_bounds[1]))
+        best = None
+        tested = set()
+        t_cell = t_start
+
+        while t_cell <= limit:
+            # Testa as paredes no anel ao redor da célula atual
+            for r in range(row - ring, row + ring + 1):
+                for c in range(col - ring, col + ring + 1):
+                    if (r, c) in tested or not self.is_wall(r, c):
+                        continue
+                    tested.add((r, c))
+                    hit = ray_box(origin_x, origin_z, dir_x, dir_z,
+                                  self._cell_bounds(r, c), radius, max_distance)
+                    if hit is not None and (best is None or hit[0] < best[0]):
+                        best = hit
+
+            # Avança para a próxima célula cruzada pelo raio
+            if t_max_x < t_max_z:
+                t_cell = t_max_x
+                t_max_x += t_delta_x
+                col += step_col
+            else:
+                t_cell = t_max_z
+                t_max_z += t_delta_z
+                row += step_row
+
+            # Nenhum impacto posterior pode ser mais próximo que o já encontrado
+            if best is not None and best[0] <= t_cell:
+                break
+
+        return best
@@ -0,0 +1,111 @@
+"""
+Interseção analítica de raios com caixas no plano XZ.
+
+Um círculo de raio r percorrendo um raio colide com uma caixa exatamente
+quando o centro do círculo atinge a caixa arredondada (a caixa expandida por
+r com cantos circulares). Ela é a união de duas caixas em cruz e quatro
+círculos nos cantos, e o primeiro impacto é o menor t entre essas partes.
+"""
+
+import math
+
+
+def _ray_slab(origin_x, origin_z, dir_x, dir_z, min_x, min_z, max_x, max_z):
+    """
+    Interseção de um raio com uma caixa alinhada aos eixos.
+
+    Returns:
+        tuple: (t, (nx, nz)) da entrada na caixa (t = 0 se a origem está
+        dentro), ou None se o raio não a atinge
+    """
+    t_enter = 0.0
+    t_exit = math.inf
+    normal = None
+
+    for origin, direction, low, high, axis_normal in (
+        (origin_x, dir_x, min_x, max_x, (1.0, 0.0)),
+        (origin_z, dir_z, min_z, max_z, (0.0, 1.0)),
+    ):
+        if abs(direction) < 1e-12:
+            # Raio paralelo ao eixo: precisa estar entre os planos
+            if origin < low or origin > high:
+                return None
+            continue
+
+        t_low = (low - origin) / direction
+        t_high = (high - origin) / direction
+        sign = -1.0
+        if t_low > t_high:
+            t_low, t_high = t_high, t_low
+            sign = 1.0
+
+        if t_low > t_enter:
+            t_enter = t_low
+            normal = (axis_normal[0] * sign, axis_normal[1] * sign)
+        t_exit = min(t_exit, t_high)
+        if t_enter > t_exit:
+            return None
+
+    if normal is None:
+        # Origem dentro da caixa: normal oposta à direção do raio
+        normal = (-dir_x, -dir_z)
+    return t_enter, normal
+
+
+def _ray_circle(origin_x, origin_z, dir_x, dir_z, center_x, center_z, radius):
+    """
+    Interseção de um raio (direção unitária) com um círculo.
+
+    Returns:
+        tuple: (t, (nx, nz)) do primeiro impacto, ou None
+    """
+    offset_x = origin_x - center_x
+    offset_z = origin_z - center_z
+    c = offset_x * offset_x + offset_z * offset_z - radius * radius
+    if c <= 0.0:
+        # Origem dentro do círculo
+        return 0.0, (-dir_x, -dir_z)
+
+    b = offset_x * dir_x + offset_z * dir_z
+    discriminant = b * b - c
+    if b > 0.0 or discriminant < 0.0:
+        return None
+
+    t = -b - math.sqrt(discriminant)
+    hit_x = origin_x + dir_x * t - center_x
+    hit_z = origin_z + dir_z * t - center_z
+    return t, (hit_x / radius, hit_z / radius)
+
+
+def ray_box(origin_x, origin_z, dir_x, dir_z, bounds, radius=0.0, max_distance=math.inf):
+    """
+    Primeiro impacto de um círculo percorrendo um raio contra uma caixa.
+
+    Args:
+        origin_x: Coordenada X da origem do raio
+        origin_z: Coordenada Z da origem do raio
+        dir_x: Componente X da direção (unitária)
+        dir_z: Componente Z da direção (unitária)
+        bounds: Caixa (min_x, min_z, max_x, max_z)
+        radius: Raio do círculo que percorre o raio
+        max_distance: Distância máxima considerada
+
+    Returns:
+        tuple: (distância, (nx, nz)) do impacto, ou None
+    """
+    min_x, min_z, max_x, max_z = bounds
+    best = None
+
+    hits = [
+        _ray_slab(origin_x, origin_z, dir_x, dir_z, min_x - radius, min_z, max_x + radius, max_z),
+        _ray_slab(origin_x, origin_z, dir_x, dir_z, min_x, min_z - radius, max_x, max_z + radius),
+    ]
+    if radius > 0.0:
+        for corner_x in (min_x, max_x):
+            for corner_z in (min_z, max_z):
+                hits.append(_ray_circle(origin_x, origin_z, dir_x, dir_z, corner_x, corner_z, radius))
+
+    for hit in hits:
+        if hit is not None and hit[0] <= max_distance and (best is None or hit[0] < best[0]):
+            best = hit
+    return best
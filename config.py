@@ -12,6 +12,8 @@ class Config:
         self.maze_size = 5  # Tamanho padrão (cria grid 11x11)
         self.music_enabled = True  # Música ligada/desligada
         self.music_volume = 0.5  # Volume 0.0-1.0 (padrão 50%)
+        self.enemy_count = 1  # Número de inimigos (mais de 1 usa EnemySwarm)
+        self.simulation_rate = 60  # Passos de simulação por segundo (independente do FPS)
         self.load()
 
     def load(self):
@@ -23,6 +25,8 @@ class Config:
                     self.maze_size = data.get('maze_size', 5)
                     self.music_enabled = data.get('music_enabled', True)
                     self.music_volume = data.get('music_volume', 0.5)
+                    self.enemy_count = data.get('enemy_count', 1)
+                    self.simulation_rate = data.get('simulation_rate', 60)
             except Exception as e:
                 print(f"Could not load config: {e}")
 
@@ -33,7 +37,9 @@ class Config:
                 json.dump({
                     'maze_size': self.maze_size,
                     'music_enabled': self.music_enabled,
-                    'music_volume': self.music_volume
+                    'music_volume': self.music_volume,
+                    'enemy_count': self.enemy_count,
+                    'simulation_rate': self.simulation_rate
                 }, f, indent=2)
         except Exception as e:
             print(f"Could not save config: {e}")
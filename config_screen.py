@@ -1,8 +1,10 @@
 import pygame
 from config import game_config
+from render.text import text_renderer
+from ui_screen import RetainedScreen
 
 
-class ConfigScreen:
+class ConfigScreen(RetainedScreen):
     """Tela de configuração para ajustes do jogo."""
 
     def __init__(self, width=800, height=600):
@@ -13,8 +15,7 @@ class ConfigScreen:
             width: Largura da tela
             height: Altura da tela
         """
-        self.width = width
-        self.height = height
+        super().__init__(width, height)
 
         # Cores
         self.bg_color = (20, 20, 30)
@@ -25,12 +26,11 @@ class ConfigScreen:
         self.button_color = (70, 70, 80)
         self.button_hover_color = (100, 100, 110)
 
-        # Fontes
-        pygame.font.init()
-        self.title_font = pygame.font.Font(None, 70)
-        self.label_font = pygame.font.Font(None, 40)
-        self.value_font = pygame.font.Font(None, 50)
-        self.button_font = pygame.font.Font(None, 50)
+        # Tamanhos de fonte (textos rasterizados uma vez pelo text_renderer)
+        self.title_size = 70
+        self.label_size = 40
+        self.value_size = 50
+        self.button_size = 50
 
         # Controle deslizante de tamanho do labirinto
         self.dragging_maze = False
@@ -148,6 +148,22 @@ class ConfigScreen:
 
         return None
 
+    def regions(self):
+        """Controles deslizantes, seus valores e botões, com o estado que altera seu desenho."""
+        handle_margin = 2 * self.handle_radius + 2
+        maze_rect = self.maze_slider_rect.inflate(handle_margin, handle_margin)
+        maze_rect.union_ip(pygame.Rect(250, 155, 300, 40))  # Valor atual
+        volume_rect = self.volume_slider_rect.inflate(handle_margin, handle_margin)
+        volume_rect.union_ip(pygame.Rect(250, 315, 300, 40))  # Valor atual
+
+        return {
+            'maze': (maze_rect, (self._get_maze_size(), self.dragging_maze)),
+            'volume': (volume_rect, (self._get_volume_handle_x(), int(game_config.music_volume * 100),
+                                     self.dragging_volume)),
+            'music': (self.music_toggle_button, (game_config.music_enabled, self.music_toggle_hover)),
+            'back': (self.back_button, self.back_button_hover),
+        }
+
     def render(self, screen):
         """
         Renderiza a tela de configuração.
@@ -159,19 +175,20 @@ class ConfigScreen:
         screen.fill(self.bg_color)
 
         # Título
-        title_text = self.title_font.render("SETTINGS", True, self.title_color)
+        title_text = text_renderer.render("SETTINGS", self.title_size, self.title_color)
         title_x = self.width // 2 - title_text.get_width() // 2
         screen.blit(title_text, (title_x, 50))
 
         # ===== TAMANHO DO LABIRINTO =====
         # Rótulo de tamanho do labirinto
-        label_text = self.label_font.render("Maze Size:", True, self.text_color)
+        label_text = text_renderer.render("Maze Size:", self.label_size, self.text_color)
         screen.blit(label_text, (250, 120))
 
         # Valor atual do tamanho do labirinto
         value = self._get_maze_size()
         grid_size = 2 * value + 1
-        value_text = self.label_font.render(f"{value} ({grid_size}x{grid_size})", True, self.slider_active_color)
+        value_text = text_renderer.render_dynamic(f"{value} ({grid_size}x{grid_size})", self.label_size,
+                                                  self.slider_active_color)
         screen.blit(value_text, (250, 155))
 
         # Barra do controle deslizante do labirinto
@@ -184,19 +201,19 @@ class ConfigScreen:
         pygame.draw.circle(screen, handle_color, (handle_x, handle_y), self.handle_radius)
 
         # Rótulos Min/Max
-        min_label = self.label_font.render("1", True, self.text_color)
-        max_label = self.label_font.render("10", True, self.text_color)
+        min_label = text_renderer.render("1", self.label_size, self.text_color)
+        max_label = text_renderer.render("10", self.label_size, self.text_color)
         screen.blit(min_label, (self.maze_slider_rect.x - 30, self.maze_slider_rect.y - 5))
         screen.blit(max_label, (self.maze_slider_rect.x + self.maze_slider_rect.width + 10, self.maze_slider_rect.y - 5))
 
         # ===== VOLUME DA MÚSICA =====
         # Rótulo de volume
-        vol_label = self.label_font.render("Music Volume:", True, self.text_color)
+        vol_label = text_renderer.render("Music Volume:", self.label_size, self.text_color)
         screen.blit(vol_label, (250, 280))
 
         # Valor atual do volume
         vol_percent = int(game_config.music_volume * 100)
-        vol_value_text = self.label_font.render(f"{vol_percent}%", True, self.slider_active_color)
+        vol_value_text = text_renderer.render_dynamic(f"{vol_percent}%", self.label_size, self.slider_active_color)
         screen.blit(vol_value_text, (250, 315))
 
         # Barra do controle deslizante de volume
@@ -209,8 +226,8 @@ class ConfigScreen:
         pygame.draw.circle(screen, vol_handle_color, (vol_handle_x, vol_handle_y), self.handle_radius)
 
         # Rótulos min/max de volume
-        vol_min_label = self.label_font.render("0%", True, self.text_color)
-        vol_max_label = self.label_font.render("100%", True, self.text_color)
+        vol_min_label = text_renderer.render("0%", self.label_size, self.text_color)
+        vol_max_label = text_renderer.render("100%", self.label_size, self.text_color)
         screen.blit(vol_min_label, (self.volume_slider_rect.x - 45, self.volume_slider_rect.y - 5))
         screen.blit(vol_max_label, (self.volume_slider_rect.x + self.volume_slider_rect.width + 10, self.volume_slider_rect.y - 5))
 
@@ -218,19 +235,21 @@ class ConfigScreen:
         # Botão de alternância de música
         toggle_color = self.button_hover_color if self.music_toggle_hover else self.button_color
         pygame.draw.rect(screen, toggle_color, self.music_toggle_button, border_radius=10)
-        toggle_text = self.button_font.render("ON" if game_config.music_enabled else "OFF", True, self.slider_active_color if game_config.music_enabled else self.text_color)
+        toggle_text_color = self.slider_active_color if game_config.music_enabled else self.text_color
+        toggle_text = text_renderer.render("ON" if game_config.music_enabled else "OFF", self.button_size,
+                                           toggle_text_color)
         toggle_x = self.music_toggle_button.x + (self.music_toggle_button.width - toggle_text.get_width()) // 2
         toggle_y = self.music_toggle_button.y + (self.music_toggle_button.height - toggle_text.get_height()) // 2
         screen.blit(toggle_text, (toggle_x, toggle_y))
 
         # Rótulo de alternância de música
-        music_label = self.label_font.render("Music:", True, self.text_color)
+        music_label = text_renderer.render("Music:", self.label_size, self.text_color)
         screen.blit(music_label, (250, 410))
 
         # ===== BOTÃO VOLTAR =====
         button_color = self.button_hover_color if self.back_button_hover else self.button_color
         pygame.draw.rect(screen, button_color, self.back_button, border_radius=10)
-        back_text = self.button_font.render("BACK", True, self.text_color)
+        back_text = text_renderer.render("BACK", self.button_size, self.text_color)
         text_x = self.back_button.x + (self.back_button.width - back_text.get_width()) // 2
         text_y = self.back_button.y + (self.back_button.height - back_text.get_height()) // 2
         screen.blit(back_text, (text_x, text_y))
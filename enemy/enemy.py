@@ -1,7 +1,6 @@
 from OpenGL.GL import *
-from OpenGL.GLU import *
-import pygame
-import os
+from render.texture_cache import texture_cache
+from render.sphere_mesh import sphere_meshes
 import numpy as np
 
 
@@ -28,34 +27,12 @@ class Enemy:
         self.detection_range = 15.0  # Alcance para detectar jogador
         self.chase_speed = 3.5  # Velocidade ao perseguir
         self.is_chasing = False
-        self.texture_id = self._load_texture()
-
-    @classmethod
-    def _load_texture(cls):
-        """Carrega textura do inimigo se existir."""
-        if not os.path.exists(cls.TEXTURE_PATH):
-            return None
-
-        try:
-            texture_surface = pygame.image.load(cls.TEXTURE_PATH)
-            texture_surface = texture_surface.convert_alpha()
-
-            # Inverte textura verticalmente para OpenGL
-            texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
-            width = texture_surface.get_width()
-            height = texture_surface.get_height()
-
-            texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-            return texture_id
-        except Exception as e:
-            print(f"Não foi possível carregar textura do inimigo: {e}")
-            return None
+        self.texture_id = texture_cache.acquire(self.TEXTURE_PATH, wrap=GL_CLAMP)
+
+    def release(self):
+        """Libera a referência à textura do inimigo."""
+        texture_cache.release(self.texture_id)
+        self.texture_id = None
 
     def can_see_player(self, player_x, player_z):
         """
@@ -122,8 +99,8 @@ class Enemy:
         Renderiza o inimigo como uma esfera flutuante.
 
         Args:
-            player_x: Posição X do jogador (não usado para esfera)
-            player_z: Posição Z do jogador (não usado para esfera)
+            player_x: Posição X do jogador (escolhe o nível de detalhe da esfera)
+            player_z: Posição Z do jogador (escolhe o nível de detalhe da esfera)
         """
         glPushMatrix()
 
@@ -133,10 +110,8 @@ class Enemy:
         # Desenha como uma esfera vermelha brilhante (fácil de ver)
         glColor3f(1.0, 0.0, 0.0)  # Vermelho brilhante
 
-        # Cria esfera usando quadric GLU
-        quadric = gluNewQuadric()
-        gluQuadricDrawStyle(quadric, GLU_FILL)
-        gluSphere(quadric, 0.5, 16, 16)  # raio=0.5, segmentos=16
-        gluDeleteQuadric(quadric)
+        # Esfera da malha em cache, com detalhe pela distância ao jogador
+        distance = np.sqrt((player_x - self.x) ** 2 + (player_z - self.z) ** 2)
+        sphere_meshes.draw(0.5, sphere_meshes.level_for(0.5, distance))
 
         glPopMatrix()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Simulação sem janela nem OpenGL.
+
+Monta o cenário com Place(headless=True), desliga o carregamento de
+texturas e executa a mesma lógica de atualização do jogo (jogador,
+inimigos, captura e saída) em passos fixos, o mais rápido possível. O
+jogador é controlado por um agente que segue o caminho mais curto até a
+saída. Útil para ajustar a IA dos inimigos e para testes de regressão em
+máquinas sem tela:
+
+    python headless.py --sessions 1000 --maze-size 5 --enemies 3
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import random
+import time
+import numpy as np
+
+from config import game_config
+from maze.pathfinding import Pathfinder
+from place.place import Place
+from player.player import Player
+from render.texture_cache import texture_cache
+from timestep import FixedTimestep
+
+
+# Mesma distância de vitória do loop do jogo em main.py
+EXIT_DISTANCE = 2.0
+
+
+class ExitSeeker:
+    """Agente que conduz o jogador pelo caminho mais curto até a saída."""
+
+    def __init__(self, place):
+        """
+        Inicializa o agente; a rota até a saída é calculada com A* a partir
+        da primeira posição do jogador.
+
+        Args:
+            place: Cenário (Place) da sessão
+        """
+        self.exit_pos = place.end_pos
+        self.pathfinder = Pathfinder(place.maze_grid, place.cell_size)
+        self.exit_cell = None
+        if self.exit_pos:
+            self.exit_cell = self.pathfinder.world_to_cell(self.exit_pos[0], self.exit_pos[2])
+        self.route = {}  # Célula -> próxima célula da rota
+
+    def _plan(self, cell):
+        """Calcula a rota A* da célula dada até a saída."""
+        path = self.pathfinder.find_path(cell, self.exit_cell)
+        self.route = dict(zip(path, path[1:]))
+        return path
+
+    def steer(self, player):
+        """
+        Vira a câmera para o próximo ponto da rota e anda para frente.
+
+        Se o jogador sair da rota (empurrado por uma colisão), ela é
+        recalculada a partir da célula atual.
+
+        Args:
+            player: Jogador controlado
+        """
+        if not self.exit_pos:
+            player.movement.moving_forward = False
+            return
+
+        x, _, z = player.get_position()
+        cell = self.pathfinder.world_to_cell(x, z)
+        if cell not in self.route and cell != self.exit_cell:
+            self._plan(cell)
+
+        next_cell = self.route.get(cell)
+        if next_cell is not None:
+            target = self.pathfinder.cell_to_world(*next_cell)
+        else:
+            target = (self.exit_pos[0], self.exit_pos[2])
+
+        # Inverso da convenção de Movement: frente = (sin(yaw), -cos(yaw))
+        player.camera.yaw = math.degrees(math.atan2(target[0] - x, -(target[1] - z)))
+        player.movement.moving_forward = True
+
+    def distance_to_exit(self, x, z):
+        """
+        Obtém a distância em células até a saída.
+
+        Returns:
+            int: Número de passos, ou -1 se inalcançável ou sem saída
+        """
+        if not self.exit_pos:
+            return -1
+        return len(self._plan(self.pathfinder.world_to_cell(x, z))) - 1
+
+
+def run_session(max_time=300.0, rate=60, seed=None, quiet=True):
+    """
+    Executa uma partida completa sem renderização.
+
+    Args:
+        max_time: Tempo simulado máximo em segundos
+        rate: Passos de simulação por segundo
+        seed: Semente opcional dos geradores aleatórios (labirinto e inimigos)
+        quiet: Se True, descarta as mensagens impressas durante a montagem do cenário
+
+    Returns:
+        dict: 'outcome' ('escaped', 'caught' ou 'timeout'), 'time' (segundos
+        simulados), 'steps' e 'exit_distance' (células restantes até a saída)
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+
+    texture_cache.headless = True
+    output = io.StringIO() if quiet else None
+    with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+        place = Place(headless=True)
+
+    start = place.start_pos or (0.0, 1.7, 5.0)
+    player = Player(x=start[0], y=start[1], z=start[2])
+    agent = ExitSeeker(place)
+    simulation = FixedTimestep(rate=rate)
+
+    outcome = 'timeout'
+    steps = 0
+    max_steps = int(max_time * rate)
+    while steps < max_steps:
+        agent.steer(player)
+        player.update(simulation.step, collision_check=place.framework.check_collision)
+        x, _, z = player.get_position()
+        caught = place.update(simulation.step, x, z)
+        steps += 1
+
+        if caught:
+            outcome = 'caught'
+            break
+        if place.end_pos and math.hypot(x - place.end_pos[0], z - place.end_pos[2]) < EXIT_DISTANCE:
+            outcome = 'escaped'
+            break
+
+    x, _, z = player.get_position()
+    place.release()
+    return {
+        'outcome': outcome,
+        'time': steps * simulation.step,
+        'steps': steps,
+        'exit_distance': agent.distance_to_exit(x, z),
+    }
+
+
+def run_sessions(count, max_time=300.0, rate=60, seed=None):
+    """
+    Executa várias partidas seguidas.
+
+    Args:
+        count: Número de partidas
+        max_time: Tempo simulado máximo de cada partida em segundos
+        rate: Passos de simulação por segundo
+        seed: Semente opcional; a partida i usa seed + i
+
+    Returns:
+        list: Resultados de run_session, na ordem
+    """
+    return [run_session(max_time, rate, None if seed is None else seed + i) for i in range(count)]
+
+
+def main():
+    """Executa as partidas pedidas na linha de comando e imprime um resumo."""
+    parser = argparse.ArgumentParser(description="Run Dreamrooms sessions without a display")
+    parser.add_argument("--sessions", type=int, default=100, help="number of sessions")
+    parser.add_argument("--maze-size", type=int, default=game_config.maze_size, help="maze size (1-10)")
+    parser.add_argument("--enemies", type=int, default=game_config.enemy_count, help="enemy count")
+    parser.add_argument("--rate", type=int, default=game_config.simulation_rate, help="simulation Hz")
+    parser.add_argument("--max-time", type=float, default=300.0, help="simulated seconds per session")
+    parser.add_argument("--seed", type=int, default=None, help="base random seed")
+    args = parser.parse_args()
+
+    # Só para esta execução; game_config.json não é alterado
+    game_config.maze_size = args.maze_size
+    game_config.enemy_count = args.enemies
+
+    started = time.perf_counter()
+    results = run_sessions(args.sessions, args.max_time, args.rate, args.seed)
+    elapsed = time.perf_counter() - started
+
+    for outcome in ('escaped', 'caught', 'timeout'):
+        matching = [result for result in results if result['outcome'] == outcome]
+        mean_time = sum(result['time'] for result in matching) / len(matching) if matching else 0.0
+        print(f"{outcome}: {len(matching)} ({mean_time:.1f}s simulated on average)")
+    print(f"{len(results)} sessions in {elapsed:.1f}s ({60.0 * len(results) / max(elapsed, 1e-9):.0f}/min)")
+
+
+if __name__ == "__main__":
+    main()
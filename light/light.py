@@ -8,6 +8,8 @@ from .lighting_config import LightingConfig
 from .light_math import calculate_direction_vector, calculate_light_position, check_collision_and_adjust
 from .light_setup import LightingSetup
 from .light_renderer import LightRenderer
+from .shader_lighting import shader_lighting
+from render.frustum import camera_view_matrix
 
 
 class LightBall:
@@ -33,7 +35,8 @@ class LightBall:
 
         self.position = np.zeros(3, dtype=np.float32)
 
-    def calculate_position(self, player_x, player_y, player_z, yaw, pitch, collision_check=None):
+    def calculate_position(self, player_x, player_y, player_z, yaw, pitch, collision_check=None,
+                           raycast=None):
         """
         Calcula a posição da bola de luz baseada na direção de visão do jogador.
 
@@ -44,6 +47,7 @@ class LightBall:
             yaw: Ângulo yaw do jogador
             pitch: Ângulo pitch do jogador
             collision_check: Função opcional de verificação de colisão
+            raycast: Função opcional de raycast contra o cenário
         """
         # Vetor de posição do jogador
         player_pos = np.array([player_x, player_y, player_z], dtype=np.float32)
@@ -53,12 +57,13 @@ class LightBall:
 
         # Ajusta distância se colisão detectada
         adjusted_distance = self.distance
-        if collision_check:
+        if collision_check or raycast:
             adjusted_distance = check_collision_and_adjust(
                 player_pos, direction, self.distance, collision_check,
                 self.config.MIN_DISTANCE_FROM_WALL,
                 self.config.DISTANCE_STEP,
-                self.config.COLLISION_CHECK_RADIUS
+                self.config.COLLISION_CHECK_RADIUS,
+                raycast=raycast
             )
 
         # Calcula posição da luz
@@ -118,21 +123,58 @@ class LightBall:
             self.config.MATERIAL_SHININESS
         )
 
-    def render_ball(self):
-        """Renderiza a própria bola de luz brilhante."""
+        # Mesmos parâmetros para a iluminação por pixel do cenário
+        if self.config.USE_SHADER_LIGHTING:
+            shader_lighting.update(
+                self.config, self.position, direction, linear_atten, quadratic_atten,
+                camera_view_matrix(player_x, player_y, player_z, pitch, yaw)
+            )
+
+    def upload(self):
+        """Prepara na GPU os recursos da iluminação por pixel (tela de carregamento)."""
+        if self.config.USE_SHADER_LIGHTING:
+            shader_lighting.upload()
+
+    def begin_world_pass(self):
+        """Ativa a iluminação por pixel para a renderização do cenário."""
+        if self.config.USE_SHADER_LIGHTING:
+            shader_lighting.begin()
+
+    def end_world_pass(self):
+        """Volta ao pipeline fixo após a renderização do cenário."""
+        shader_lighting.end()
+
+    def render_ball(self, eye_position=None):
+        """
+        Renderiza a própria bola de luz brilhante.
+
+        Args:
+            eye_position: Posição opcional da câmera [x, y, z], usada para
+                          escolher o nível de detalhe da esfera
+        """
+        view_distance = None
+        if eye_position is not None:
+            view_distance = float(np.linalg.norm(self.position - np.asarray(eye_position, dtype=np.float32)))
+
         LightRenderer.render_glowing_ball(
             self.position,
             self.radius,
             self.config.GLOW_CORE_COLOR,
             self.config.GLOW_OUTER_COLOR,
-            self.config.GLOW_OUTER_SIZE_MULTIPLIER
+            self.config.GLOW_OUTER_SIZE_MULTIPLIER,
+            view_distance
         )
 
+    def release(self):
+        """Libera o programa de iluminação por pixel."""
+        shader_lighting.release()
+
     def disable_lighting(self):
         """Desabilita o sistema de iluminação."""
         LightingSetup.disable_lighting()
 
-    def update_and_render(self, player_x, player_y, player_z, yaw, pitch, collision_check=None):
+    def update_and_render(self, player_x, player_y, player_z, yaw, pitch, collision_check=None,
+                          raycast=None):
         """
         Atualiza posição da luz e configura iluminação em uma única chamada.
 
@@ -143,12 +185,14 @@ class LightBall:
             yaw: Ângulo yaw do jogador
             pitch: Ângulo pitch do jogador
             collision_check: Função opcional de verificação de colisão
+            raycast: Função opcional de raycast contra o cenário
         """
         # Calcula onde a bola de luz deve estar
-        self.calculate_position(player_x, player_y, player_z, yaw, pitch, collision_check)
+        self.calculate_position(player_x, player_y, player_z, yaw, pitch, collision_check,
+                                raycast)
 
         # Configura a iluminação a partir desta posição
         self.setup_lighting(player_x, player_y, player_z, yaw, pitch)
 
         # Renderiza a bola brilhante visível
-        self.render_ball()
+        self.render_ball((player_x, player_y, player_z))
@@ -46,7 +46,7 @@ def calculate_light_position(player_pos, direction, distance, height_offset):
 
 
 def check_collision_and_adjust(player_pos, direction, distance, collision_check,
-                                min_distance, distance_step, check_radius):
+                                min_distance, distance_step, check_radius, raycast=None):
     """
     Verifica colisões e ajusta distância se necessário.
 
@@ -58,10 +58,28 @@ def check_collision_and_adjust(player_pos, direction, distance, collision_check,
         min_distance: Distância mínima permitida
         distance_step: Tamanho do passo para redução de distância
         check_radius: Raio para verificação de colisão
+        raycast: Função opcional (origin, direction, max_distance, radius) ->
+                 (distância, normal) ou None; quando fornecida, a distância é
+                 calculada analiticamente em vez de recuar passo a passo
 
     Returns:
         float: Distância ajustada
     """
+    if raycast is not None:
+        if distance <= min_distance:
+            return distance
+
+        # A colisão é no plano XZ: converte a distância 3D para a horizontal
+        horizontal_length = float(np.hypot(direction[0], direction[2]))
+        if horizontal_length < 1e-6:
+            return distance
+
+        hit = raycast((player_pos[0], player_pos[2]), (direction[0], direction[2]),
+                      distance * horizontal_length, check_radius)
+        if hit is None:
+            return distance
+        return max(min_distance, hit[0] / horizontal_length)
+
     check_distance = distance
 
     while check_distance > min_distance:
@@ -4,7 +4,8 @@ Lida com a renderização da bola de luz brilhante.
 """
 
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from render.gl_state import gl_state
+from render.sphere_mesh import sphere_meshes
 import numpy as np
 
 
@@ -12,7 +13,8 @@ class LightRenderer:
     """Renderiza o visual da bola de luz brilhante."""
 
     @staticmethod
-    def render_glowing_ball(position, radius, core_color, outer_color, outer_size_multiplier):
+    def render_glowing_ball(position, radius, core_color, outer_color, outer_size_multiplier,
+                            view_distance=None):
         """
         Renderiza uma bola brilhante na posição especificada.
 
@@ -22,6 +24,8 @@ class LightRenderer:
             core_color: Cor do brilho do núcleo [r, g, b, a]
             outer_color: Cor do brilho externo [r, g, b, a]
             outer_size_multiplier: Multiplicador de tamanho para brilho externo
+            view_distance: Distância da câmera à bola para escolher o nível de
+                           detalhe (None usa o máximo)
         """
         glPushMatrix()
 
@@ -29,27 +33,24 @@ class LightRenderer:
         glTranslatef(position[0], position[1], position[2])
 
         # Desabilita iluminação para a própria bola (para que ela brilhe)
-        glDisable(GL_LIGHTING)
+        gl_state.disable(GL_LIGHTING)
 
         # Habilita blending para efeito de brilho
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        gl_state.enable(GL_BLEND)
+        gl_state.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
         # Desenha o núcleo brilhante (amarelo-branco brilhante)
         glColor4fv(core_color)
-        quadric = gluNewQuadric()
-        gluSphere(quadric, radius, 16, 16)
-        gluDeleteQuadric(quadric)
+        sphere_meshes.draw(radius, sphere_meshes.level_for(radius, view_distance))
 
         # Desenha o brilho externo (semi-transparente)
         glColor4fv(outer_color)
-        quadric = gluNewQuadric()
-        gluSphere(quadric, radius * outer_size_multiplier, 16, 16)
-        gluDeleteQuadric(quadric)
+        outer_radius = radius * outer_size_multiplier
+        sphere_meshes.draw(outer_radius, sphere_meshes.level_for(outer_radius, view_distance))
 
-        glDisable(GL_BLEND)
+        gl_state.disable(GL_BLEND)
 
         # Re-habilita iluminação para outros objetos
-        glEnable(GL_LIGHTING)
+        gl_state.enable(GL_LIGHTING)
 
         glPopMatrix()
@@ -1,10 +1,14 @@
 """
 Módulo de configuração de iluminação OpenGL.
 Lida com toda configuração de iluminação OpenGL.
+
+As chamadas passam por gl_state, então os parâmetros constantes de
+LightingConfig chegam ao driver só no primeiro quadro.
 """
 
 from OpenGL.GL import *
 import numpy as np
+from render.gl_state import gl_state
 
 
 class LightingSetup:
@@ -19,10 +23,10 @@ class LightingSetup:
             global_ambient: Cor da luz ambiente global [r, g, b, a]
         """
         # Define luz ambiente global
-        glLightModelfv(GL_LIGHT_MODEL_AMBIENT, global_ambient)
+        gl_state.light_model(GL_LIGHT_MODEL_AMBIENT, global_ambient)
 
         # Iluminação de dois lados para que ambos os lados dos polígonos sejam iluminados
-        glLightModeli(GL_LIGHT_MODEL_TWO_SIDE, GL_TRUE)
+        gl_state.light_model(GL_LIGHT_MODEL_TWO_SIDE, GL_TRUE)
 
     @staticmethod
     def setup_fog(fog_color, fog_start, fog_end, fog_density):
@@ -35,12 +39,12 @@ class LightingSetup:
             fog_end: Distância onde a neblina é completa
             fog_density: Densidade da neblina (para neblina exponencial)
         """
-        glEnable(GL_FOG)
-        glFogi(GL_FOG_MODE, GL_LINEAR)  # Neblina linear para queda previsível
-        glFogfv(GL_FOG_COLOR, fog_color)
-        glFogf(GL_FOG_START, fog_start)
-        glFogf(GL_FOG_END, fog_end)
-        glHint(GL_FOG_HINT, GL_NICEST)  # Neblina de melhor qualidade
+        gl_state.enable(GL_FOG)
+        gl_state.fog(GL_FOG_MODE, GL_LINEAR)  # Neblina linear para queda previsível
+        gl_state.fog(GL_FOG_COLOR, fog_color)
+        gl_state.fog(GL_FOG_START, fog_start)
+        gl_state.fog(GL_FOG_END, fog_end)
+        gl_state.hint(GL_FOG_HINT, GL_NICEST)  # Neblina de melhor qualidade
 
     @staticmethod
     def setup_spotlight(position, direction, cutoff_angle, exponent,
@@ -62,27 +66,27 @@ class LightingSetup:
             quadratic_atten: Atenuação quadrática
         """
         # Habilita iluminação
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
+        gl_state.enable(GL_LIGHTING)
+        gl_state.enable(GL_LIGHT0)
 
         # Posiciona a luz (luz posicional)
         light_pos = np.array([position[0], position[1], position[2], 1.0], dtype=np.float32)
-        glLightfv(GL_LIGHT0, GL_POSITION, light_pos)
+        gl_state.light(GL_LIGHT0, GL_POSITION, light_pos)
 
         # Define direção do spotlight
-        glLightfv(GL_LIGHT0, GL_SPOT_DIRECTION, direction)
-        glLightf(GL_LIGHT0, GL_SPOT_CUTOFF, cutoff_angle)
-        glLightf(GL_LIGHT0, GL_SPOT_EXPONENT, exponent)
+        gl_state.light(GL_LIGHT0, GL_SPOT_DIRECTION, direction)
+        gl_state.light(GL_LIGHT0, GL_SPOT_CUTOFF, cutoff_angle)
+        gl_state.light(GL_LIGHT0, GL_SPOT_EXPONENT, exponent)
 
         # Define cores da luz
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, diffuse_color)
-        glLightfv(GL_LIGHT0, GL_AMBIENT, ambient_color)
-        glLightfv(GL_LIGHT0, GL_SPECULAR, specular_color)
+        gl_state.light(GL_LIGHT0, GL_DIFFUSE, diffuse_color)
+        gl_state.light(GL_LIGHT0, GL_AMBIENT, ambient_color)
+        gl_state.light(GL_LIGHT0, GL_SPECULAR, specular_color)
 
         # Define atenuação
-        glLightf(GL_LIGHT0, GL_CONSTANT_ATTENUATION, constant_atten)
-        glLightf(GL_LIGHT0, GL_LINEAR_ATTENUATION, linear_atten)
-        glLightf(GL_LIGHT0, GL_QUADRATIC_ATTENUATION, quadratic_atten)
+        gl_state.light(GL_LIGHT0, GL_CONSTANT_ATTENUATION, constant_atten)
+        gl_state.light(GL_LIGHT0, GL_LINEAR_ATTENUATION, linear_atten)
+        gl_state.light(GL_LIGHT0, GL_QUADRATIC_ATTENUATION, quadratic_atten)
 
     @staticmethod
     def setup_material_properties(ambient, diffuse, specular, shininess):
@@ -95,29 +99,29 @@ class LightingSetup:
             specular: Cor especular do material [r, g, b, a]
             shininess: Valor de brilho do material
         """
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, ambient)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, diffuse)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, specular)
-        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, shininess)
+        gl_state.material(GL_FRONT_AND_BACK, GL_AMBIENT, ambient)
+        gl_state.material(GL_FRONT_AND_BACK, GL_DIFFUSE, diffuse)
+        gl_state.material(GL_FRONT_AND_BACK, GL_SPECULAR, specular)
+        gl_state.material(GL_FRONT_AND_BACK, GL_SHININESS, shininess)
 
         # Habilita material de cor
-        glEnable(GL_COLOR_MATERIAL)
-        glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+        gl_state.enable(GL_COLOR_MATERIAL)
+        gl_state.color_material(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
 
         # Habilita reescalonamento automático de normais para melhor precisão de iluminação
-        glEnable(GL_RESCALE_NORMAL)  # Mais eficiente que GL_NORMALIZE
+        gl_state.enable(GL_RESCALE_NORMAL)  # Mais eficiente que GL_NORMALIZE
 
         # Habilita sombreamento suave para transições graduais de luz
-        glShadeModel(GL_SMOOTH)
+        gl_state.shade_model(GL_SMOOTH)
 
         # Habilita visualizador local para destaques especulares mais precisos
-        glLightModeli(GL_LIGHT_MODEL_LOCAL_VIEWER, GL_TRUE)
+        gl_state.light_model(GL_LIGHT_MODEL_LOCAL_VIEWER, GL_TRUE)
 
     @staticmethod
     def disable_lighting():
         """Desabilita toda iluminação."""
-        glDisable(GL_LIGHTING)
-        glDisable(GL_LIGHT0)
-        glDisable(GL_COLOR_MATERIAL)
-        glDisable(GL_NORMALIZE)
-        glDisable(GL_FOG)
+        gl_state.disable(GL_LIGHTING)
+        gl_state.disable(GL_LIGHT0)
+        gl_state.disable(GL_COLOR_MATERIAL)
+        gl_state.disable(GL_NORMALIZE)
+        gl_state.disable(GL_FOG)
@@ -13,6 +13,7 @@ O sistema de iluminação usa:
 - Propriedades de material para interação de superfície
 """
 
+import math
 import numpy as np
 
 
@@ -76,6 +77,33 @@ class LightingConfig:
     FOG_START = 4.0  # Distância onde a neblina começa (unidades)
     FOG_END = 14.0  # Distância onde a neblina é completa (unidades)
 
+    @classmethod
+    def fog_cull_distance(cls, fov_y=45.0, aspect=16 / 9):
+        """
+        Distância horizontal a partir da qual a geometria está totalmente coberta
+        pela neblina e pode ser descartada.
+
+        A neblina usa a profundidade no espaço do olho, que fora do eixo da
+        câmera é menor que a distância real; por isso FOG_END é dividido pelo
+        cosseno do maior ângulo visível (o canto da tela).
+
+        Args:
+            fov_y: Campo de visão vertical em graus (o de gluPerspective)
+            aspect: Maior proporção de tela considerada
+
+        Returns:
+            float: Distância de corte, ou infinito se a neblina estiver desabilitada
+        """
+        if not cls.FOG_ENABLED:
+            return float('inf')
+        tan_y = math.tan(math.radians(fov_y) / 2)
+        return cls.FOG_END * math.sqrt(1.0 + tan_y * tan_y * (1.0 + aspect * aspect))
+
+    # ===== PIPELINE DE ILUMINAÇÃO =====
+    # Iluminação por pixel com GLSL no cenário (cai para o pipeline fixo se
+    # os shaders não estiverem disponíveis)
+    USE_SHADER_LIGHTING = True
+
     # ===== DETECÇÃO DE COLISÃO =====
     # Parâmetros para ajuste de posição da luz perto de paredes
     COLLISION_CHECK_RADIUS = 0.15  # Raio para verificar colisões com paredes
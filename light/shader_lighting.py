@@ -0,0 +1,312 @@
+"""
+Módulo de iluminação por pixel com GLSL.
+
+Calcula o cone do spotlight, a atenuação e a neblina linear de LightingConfig
+em cada fragmento, em vez de apenas nos vértices como o pipeline fixo. Assim
+quads grandes (piso, teto, paredes fundidas) recebem o cone da tocha sem
+precisar de mais vértices.
+
+Os shaders usam GLSL 1.20 com os atributos do pipeline fixo (gl_Vertex,
+gl_Normal, gl_Color, gl_MultiTexCoord0), então a geometria existente é
+desenhada sem mudanças. Se os shaders não estiverem disponíveis, a
+iluminação do pipeline fixo configurada por LightingSetup continua valendo.
+
+Quando o driver oferece arrays de texturas, as texturas do cenário vêm das
+camadas de world_textures, vinculado uma única vez por passagem; os
+elementos trocam de textura com bind_texture(), que só altera um uniform.
+Nesse caso os elementos não obtêm cópias 2D dessas texturas
+(acquire_texture); desenhos fora da passagem, como a tela de vitória no
+pipeline fixo, carregam a cópia 2D só quando precisam dela.
+"""
+
+import math
+import numpy as np
+from render.gl_state import gl_state
+from render.shader import ShaderProgram
+from render.texture_array import world_textures
+from render.texture_cache import texture_cache
+
+
+VERTEX_SHADER = """
+#version 120
+
+varying vec3 v_eye_position;
+varying vec3 v_eye_normal;
+varying vec4 v_color;
+varying vec2 v_uv;
+
+void main() {
+    vec4 eye = gl_ModelViewMatrix * gl_Vertex;
+    v_eye_position = eye.xyz;
+    v_eye_normal = gl_NormalMatrix * gl_Normal;
+    v_color = gl_Color;
+    v_uv = gl_MultiTexCoord0.xy;
+    gl_Position = gl_ProjectionMatrix * eye;
+}
+"""
+
+FRAGMENT_SHADER = """
+#version 120
+
+uniform sampler2D u_texture;
+uniform bool u_texturing;
+
+#ifdef TEXTURE_ARRAY
+uniform sampler2DArray u_texture_array;
+uniform float u_layer;           // Camada do array, ou negativo para usar u_texture
+#endif
+
+uniform vec3 u_light_position;   // Espaço do olho
+uniform vec3 u_spot_direction;   // Espaço do olho, unitário
+uniform float u_spot_cos_cutoff;
+uniform float u_spot_exponent;
+uniform vec3 u_attenuation;      // Constante, linear, quadrática
+
+uniform vec4 u_global_ambient;
+uniform vec4 u_light_ambient;
+uniform vec4 u_light_diffuse;
+uniform vec4 u_light_specular;
+uniform vec4 u_material_specular;
+uniform float u_shininess;
+
+uniform bool u_fog;
+uniform vec4 u_fog_color;
+uniform float u_fog_start;
+uniform float u_fog_end;
+
+varying vec3 v_eye_position;
+varying vec3 v_eye_normal;
+varying vec4 v_color;
+varying vec2 v_uv;
+
+void main() {
+    // Iluminação de dois lados, como GL_LIGHT_MODEL_TWO_SIDE
+    vec3 normal = normalize(v_eye_normal);
+    if (!gl_FrontFacing) {
+        normal = -normal;
+    }
+
+    vec3 to_light = u_light_position - v_eye_position;
+    float light_distance = length(to_light);
+    vec3 light_dir = to_light / light_distance;
+
+    float attenuation = 1.0 / (u_attenuation.x + u_attenuation.y * light_distance +
+                               u_attenuation.z * light_distance * light_distance);
+    float spot_cos = dot(-light_dir, u_spot_direction);
+    float spot = spot_cos >= u_spot_cos_cutoff ? pow(max(spot_cos, 0.0), u_spot_exponent) : 0.0;
+
+    float diffuse = max(dot(normal, light_dir), 0.0);
+    vec3 half_vector = normalize(light_dir + normalize(-v_eye_position));
+    float specular = diffuse > 0.0 ? pow(max(dot(normal, half_vector), 0.0), u_shininess) : 0.0;
+
+    // GL_COLOR_MATERIAL: ambiente e difusa do material vêm da cor do vértice
+    vec4 color = u_global_ambient * v_color +
+                 attenuation * spot * (u_light_ambient * v_color +
+                                       u_light_diffuse * v_color * diffuse +
+                                       u_light_specular * u_material_specular * specular);
+    color = clamp(color, 0.0, 1.0);
+    color.a = v_color.a;
+
+    if (u_texturing) {
+#ifdef TEXTURE_ARRAY
+        if (u_layer >= 0.0) {
+            color *= texture2DArray(u_texture_array, vec3(v_uv, u_layer));
+        } else {
+            color *= texture2D(u_texture, v_uv);
+        }
+#else
+        color *= texture2D(u_texture, v_uv);
+#endif
+    }
+
+    if (u_fog) {
+        float fog = clamp((u_fog_end - length(v_eye_position)) / (u_fog_end - u_fog_start), 0.0, 1.0);
+        color.rgb = mix(u_fog_color.rgb, color.rgb, fog);
+    }
+
+    gl_FragColor = color;
+}
+"""
+
+# Cabeçalho que ativa o caminho com array de texturas no fragment shader
+TEXTURE_ARRAY_HEADER = "#extension GL_EXT_texture_array : enable\n#define TEXTURE_ARRAY\n"
+
+
+class ShaderLighting:
+    """Pipeline de iluminação por pixel usado na passagem do cenário."""
+
+    def __init__(self):
+        """Inicializa sem programa; ele é criado no primeiro uso (requer contexto GL)."""
+        self.program = None
+        self.failed = False  # True se os shaders não puderam ser criados
+        self.active = False  # True durante a passagem do cenário
+        self.texture_array = None  # world_textures, se o programa o suporta
+        self._fallback_textures = {}  # Caminho -> cópia 2D carregada sob demanda
+
+    def available(self):
+        """
+        Verifica se o pipeline por pixel pode ser usado, criando o programa
+        na primeira chamada.
+
+        Returns:
+            bool: True se o programa está pronto
+        """
+        if self.program is None and not self.failed:
+            if world_textures.supported():
+                array_shader = FRAGMENT_SHADER.replace("#version 120\n",
+                                                       "#version 120\n" + TEXTURE_ARRAY_HEADER, 1)
+                self.program = ShaderProgram.create(VERTEX_SHADER, array_shader)
+                if self.program is not None:
+                    self.texture_array = world_textures
+            if self.program is None:
+                self.program = ShaderProgram.create(VERTEX_SHADER, FRAGMENT_SHADER)
+            if self.program is None:
+                self.failed = True
+                print("Falling back to fixed-function lighting")
+        return self.program is not None
+
+    def update(self, config, position, direction, linear_atten, quadratic_atten, view_matrix):
+        """
+        Atualiza os uniforms da luz; valores repetidos não são reenviados.
+
+        Args:
+            config: LightingConfig com cores, cone, material e neblina
+            position: Posição da luz no mundo [x, y, z]
+            direction: Direção do spotlight no mundo [x, y, z]
+            linear_atten: Atenuação linear
+            quadratic_atten: Atenuação quadrática
+            view_matrix: Matriz 4x4 de visualização da câmera
+        """
+        if not self.available():
+            return
+
+        # Posição e direção no espaço do olho, como glLightfv faz com a modelview
+        eye_position = view_matrix @ np.array([position[0], position[1], position[2], 1.0])
+        eye_direction = view_matrix[:3, :3] @ np.asarray(direction, dtype=np.float64)
+        eye_direction /= np.linalg.norm(eye_direction)
+
+        program = self.program
+        program.use()
+        program.set_uniform('u_texture', 0)
+        if self.texture_array is not None:
+            program.set_uniform('u_texture_array', self.texture_array.UNIT)
+        program.set_uniform('u_light_position', eye_position[:3])
+        program.set_uniform('u_spot_direction', eye_direction)
+        program.set_uniform('u_spot_cos_cutoff', math.cos(math.radians(config.SPOT_CUTOFF_ANGLE)))
+        program.set_uniform('u_spot_exponent', config.SPOT_EXPONENT)
+        program.set_uniform('u_attenuation', config.CONSTANT_ATTENUATION, linear_atten, quadratic_atten)
+        program.set_uniform('u_global_ambient', config.GLOBAL_AMBIENT)
+        program.set_uniform('u_light_ambient', config.AMBIENT_COLOR)
+        program.set_uniform('u_light_diffuse', config.DIFFUSE_COLOR)
+        program.set_uniform('u_light_specular', config.SPECULAR_COLOR)
+        program.set_uniform('u_material_specular', config.MATERIAL_SPECULAR)
+        program.set_uniform('u_shininess', config.MATERIAL_SHININESS)
+        program.set_uniform('u_fog', bool(config.FOG_ENABLED))
+        program.set_uniform('u_fog_color', config.FOG_COLOR)
+        program.set_uniform('u_fog_start', config.FOG_START)
+        program.set_uniform('u_fog_end', config.FOG_END)
+        if not self.active:
+            ShaderProgram.use_fixed_function()
+
+    def upload(self):
+        """Compila o programa e envia o array de texturas antes do primeiro quadro."""
+        if self.available() and self.texture_array is not None and not self.texture_array.bind():
+            self.texture_array = None
+
+    def begin(self):
+        """Ativa o programa para a passagem do cenário."""
+        if not self.available():
+            return
+        self.program.use()
+        self.active = True
+        self.set_texturing(False)
+
+        # Um único vínculo de textura para todo o cenário
+        if self.texture_array is not None and not self.texture_array.bind():
+            self.texture_array = None
+
+    def end(self):
+        """Volta ao pipeline fixo (inimigos, bola de luz e interface)."""
+        if self.active:
+            ShaderProgram.use_fixed_function()
+            self.active = False
+
+    def set_texturing(self, enabled):
+        """
+        Informa ao shader se GL_TEXTURE_2D está habilitado, já que
+        glEnable não afeta programas GLSL. Sem efeito fora da passagem.
+
+        Args:
+            enabled: True se o próximo desenho usa a textura vinculada
+        """
+        if self.active:
+            self.program.set_uniform('u_texturing', bool(enabled))
+
+    def acquire_texture(self, path):
+        """
+        Obtém a textura 2D de um elemento do cenário, com os parâmetros
+        padrão de texture_cache.acquire(). Chamar depois de upload().
+
+        Args:
+            path: Caminho da imagem
+
+        Returns:
+            int: ID da textura, ou None se ela vem do array de texturas (ou
+            não pôde ser carregada); em ambos os casos, passe o caminho para
+            bind_texture()
+        """
+        if self.texture_array is not None and self.texture_array.layer_of(path) is not None:
+            return None
+        return texture_cache.acquire(path)
+
+    def bind_texture(self, texture_id, path=None):
+        """
+        Seleciona a textura do próximo desenho e ativa a texturização.
+
+        Dentro da passagem, texturas presentes no array só trocam a camada
+        (um uniform); as demais, e todas fora da passagem, são vinculadas
+        normalmente na unidade 0. Sem texture_id, a cópia 2D de path é
+        carregada na primeira vez em que é necessária.
+
+        Args:
+            texture_id: ID retornado por texture_cache.acquire() ou por
+                        acquire_texture(), ou None
+            path: Caminho passado a acquire_texture(), se houver
+
+        Returns:
+            bool: True se há uma textura para o desenho
+        """
+        if self.active and self.texture_array is not None:
+            if path is not None:
+                layer = self.texture_array.layer_of(path)
+            else:
+                layer = self.texture_array.layer_of_texture(texture_id)
+            self.program.set_uniform('u_layer', -1.0 if layer is None else float(layer))
+            if layer is not None:
+                self.set_texturing(True)
+                return True
+
+        if texture_id is None and path is not None:
+            if path not in self._fallback_textures:
+                self._fallback_textures[path] = texture_cache.acquire(path)
+            texture_id = self._fallback_textures[path]
+        if not texture_id:
+            return False
+
+        self.set_texturing(True)
+        gl_state.bind_texture(texture_id)
+        return True
+
+    def release(self):
+        """Apaga o programa, o array de texturas e as cópias 2D sob demanda."""
+        if self.program is not None:
+            self.program.release()
+            self.program = None
+        world_textures.release()
+        for texture_id in self._fallback_textures.values():
+            texture_cache.release(texture_id)
+        self._fallback_textures.clear()
+
+
+# Instância global usada pela bola de luz e pelos elementos do cenário
+shader_lighting = ShaderLighting()
@@ -16,6 +16,7 @@ Controles:
 
 # Importações da biblioteca padrão
 import os
+import time
 
 # Importações de terceiros
 import pygame
@@ -26,17 +27,32 @@ import numpy as np
 
 # Importações dos módulos do jogo
 from player.player import Player
-from place.place import Place
 from menu import Menu
 from config_screen import ConfigScreen
 from victory_screen import VictoryScreen
+from ui_screen import wait_for_events
+from timestep import FixedTimestep
+from world_loader import WorldLoader
 from config import game_config
 from light.light import LightBall
+from render.frustum import Frustum
+from render.gl_state import gl_state
+from render.text import text_renderer
+from render.sphere_mesh import sphere_meshes
+from render.dynamic_resolution import ResolutionController, SceneFramebuffer
 
 
 # Caminho para o arquivo de música de fundo
 SOUNDTRACK_PATH = "assets/audio/soundtrack.mp3"
 
+# Projeção da câmera (usada por setup_opengl e pelo frustum culling)
+CAMERA_FOV_Y = 45
+CAMERA_NEAR = 0.1
+CAMERA_FAR = 1000.0
+
+# Tempo máximo de envio de recursos à GPU por quadro da tela de carregamento
+UPLOAD_SLICE = 1.0 / 120
+
 
 def load_soundtrack():
     """
@@ -94,15 +110,18 @@ def show_config(width, height):
     pygame.display.set_caption("Dreamrooms - Config")
 
     config_screen = ConfigScreen(width, height)
-    clock = pygame.time.Clock()
+    config_screen.present(screen)
 
-    # Loop da tela de configuração
+    # Loop da tela de configuração: dorme até chegar um evento e redesenha
+    # só o que mudou
     while True:
         # Trata eventos (cliques do mouse, teclado, fechar janela)
-        for event in pygame.event.get():
+        for event in wait_for_events():
             if event.type == QUIT:
                 return 'quit'
 
+            config_screen.handle_window_event(event)
+
             # Deixa a tela de configuração tratar o evento
             action = config_screen.handle_event(event)
             if action == 'back':
@@ -112,9 +131,7 @@ def show_config(width, height):
         update_music()
 
         # Desenha interface da tela de configuração
-        config_screen.render(screen)
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS
+        config_screen.present(screen)
 
 
 def show_victory(width, height):
@@ -123,22 +140,24 @@ def show_victory(width, height):
     pygame.display.set_caption("Dreamrooms - Victory!")
 
     victory_screen = VictoryScreen(width, height)
+    victory_screen.present(screen)
     clock = pygame.time.Clock()
 
     while True:
-        delta_time = clock.tick(60) / 1000.0
-
-        for event in pygame.event.get():
+        # Acorda a cada pixel de rolagem; parados, os créditos só esperam eventos
+        for event in wait_for_events(victory_screen.animation_interval()):
             if event.type == QUIT:
                 return 'quit'
 
+            victory_screen.handle_window_event(event)
+
             action = victory_screen.handle_event(event)
             if action:
                 return action
 
+        delta_time = clock.tick() / 1000.0
         victory_screen.update(delta_time)
-        victory_screen.render(screen)
-        pygame.display.flip()
+        victory_screen.present(screen)
 
 
 def show_menu(width, height):
@@ -147,20 +166,20 @@ def show_menu(width, height):
     pygame.display.set_caption("Dreamrooms - Menu")
 
     menu = Menu(width, height)
-    clock = pygame.time.Clock()
+    menu.present(screen)
 
     while True:
-        for event in pygame.event.get():
+        for event in wait_for_events():
             if event.type == QUIT:
                 return 'quit'
 
+            menu.handle_window_event(event)
+
             action = menu.handle_event(event)
             if action:
                 return action
 
-        menu.render(screen)
-        pygame.display.flip()
-        clock.tick(60)
+        menu.present(screen)
 
 
 def setup_opengl(width, height):
@@ -173,8 +192,11 @@ def setup_opengl(width, height):
         width: Largura da janela em pixels
         height: Altura da janela em pixels
     """
+    # Contexto novo: o cache de estado não vale mais
+    gl_state.invalidate()
+
     # Habilita teste de profundidade para oclusão 3D adequada
-    glEnable(GL_DEPTH_TEST)
+    gl_state.enable(GL_DEPTH_TEST)
 
     # Define o viewport para corresponder às dimensões da janela
     glViewport(0, 0, width, height)
@@ -183,12 +205,118 @@ def setup_opengl(width, height):
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     # FOV=45°, proporção de aspecto, perto=0.1, longe=1000 (estendido para ambiente externo)
-    gluPerspective(45, width / height, 0.1, 1000.0)
+    gluPerspective(CAMERA_FOV_Y, width / height, CAMERA_NEAR, CAMERA_FAR)
 
     # Volta para matriz modelview para renderização
     glMatrixMode(GL_MODELVIEW)
 
 
+def draw_loading_screen(progress, width, height):
+    """
+    Desenha a barra de progresso do carregamento do cenário.
+
+    Args:
+        progress: Fração enviada à GPU (0.0-1.0), ou None enquanto o cenário
+                  ainda está sendo montado (barra animada)
+        width: Largura da janela em pixels
+        height: Altura da janela em pixels
+    """
+    def quad(left, top, right, bottom):
+        glBegin(GL_QUADS)
+        glVertex2f(left, top)
+        glVertex2f(right, top)
+        glVertex2f(right, bottom)
+        glVertex2f(left, bottom)
+        glEnd()
+
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+    # Projeção ortográfica 2D
+    glMatrixMode(GL_PROJECTION)
+    glPushMatrix()
+    glLoadIdentity()
+    glOrtho(0, width, height, 0, -1, 1)
+    glMatrixMode(GL_MODELVIEW)
+    glPushMatrix()
+    glLoadIdentity()
+    gl_state.disable(GL_DEPTH_TEST)
+
+    bar_width = width // 2
+    left = (width - bar_width) // 2
+    top = height * 2 // 3
+    glColor3f(0.2, 0.2, 0.2)
+    quad(left, top, left + bar_width, top + 12)
+
+    glColor3f(0.8, 0.8, 0.8)
+    if progress is None:
+        # Montagem sem progresso conhecido: um trecho percorre a barra
+        start = left + (time.perf_counter() % 1.0) * bar_width * 0.75
+        quad(start, top, start + bar_width * 0.25, top + 12)
+    else:
+        quad(left, top, left + bar_width * progress, top + 12)
+
+    glPopMatrix()
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glMatrixMode(GL_MODELVIEW)
+    gl_state.enable(GL_DEPTH_TEST)
+
+    pygame.display.flip()
+
+
+def load_world(world_loader, light_ball, width, height):
+    """
+    Obtém o cenário montado em segundo plano e envia seus recursos à GPU em
+    fatias de UPLOAD_SLICE por quadro, com barra de progresso.
+
+    Args:
+        world_loader: WorldLoader com a montagem do cenário
+        light_ball: Bola de luz cujos recursos também são preparados
+        width: Largura da janela em pixels
+        height: Altura da janela em pixels
+
+    Returns:
+        Place: Cenário pronto para o primeiro quadro, ou None se a janela foi fechada
+    """
+    clock = pygame.time.Clock()
+
+    # Espera a montagem (normalmente já terminou enquanto o menu estava aberto)
+    world_loader.prefetch()
+    while not world_loader.ready():
+        if pygame.event.get(QUIT):
+            return None
+        draw_loading_screen(None, width, height)
+        clock.tick(30)
+    place = world_loader.take()
+    if place.mesh_stats:
+        boxes = place.mesh_stats['boxes']
+        merged = place.mesh_stats['triangles']
+        print(f"Wall mesh {len(place.maze_grid)}x{len(place.maze_grid[0])}: {boxes} -> {merged} triangles "
+              f"({100.0 * (1 - merged / boxes):.1f}% fewer)")
+
+    # Antes dos elementos: com o array de texturas ativo, eles não carregam cópias 2D
+    light_ball.upload()
+    uploads = place.upload_steps()
+    progress = 0.0
+    finished = False
+    while not finished:
+        if pygame.event.get(QUIT):
+            place.release()
+            light_ball.release()
+            return None
+
+        deadline = time.perf_counter() + UPLOAD_SLICE
+        finished = True
+        for done, total in uploads:
+            progress = done / total
+            if time.perf_counter() >= deadline:
+                finished = False
+                break
+        draw_loading_screen(progress, width, height)
+
+    return place
+
+
 def main():
     """
     Ponto de entrada principal para Dreamrooms.
@@ -208,8 +336,13 @@ def main():
     # Carrega e reproduz trilha sonora de fundo
     load_soundtrack()
 
+    # O cenário é montado em segundo plano enquanto o menu está aberto
+    world_loader = WorldLoader()
+
     # ===== LOOP DO MENU =====
     while True:
+        # (Re)começa a montagem se a configuração mudou
+        world_loader.prefetch()
         action = show_menu(width, height)
 
         if action == 'quit':
@@ -238,8 +371,16 @@ def main():
     # Inicializa configurações OpenGL (perspectiva, teste de profundidade)
     setup_opengl(width, height)
 
-    # Cria o mundo do jogo (labirinto, chão, paredes, inimigo)
-    place = Place()
+    # Cria a fonte de luz do jogador (spotlight tipo tocha)
+    # Parâmetros: distância do jogador, deslocamento de altura, raio visual, alcance da luz
+    light_ball = LightBall(distance=0.8, height_offset=-0.5, radius=0.15, light_range=15.0)
+
+    # Obtém o mundo do jogo (labirinto, chão, paredes, inimigo) montado em
+    # segundo plano e envia texturas e buffers à GPU
+    place = load_world(world_loader, light_ball, width, height)
+    if place is None:
+        pygame.quit()
+        return
 
     # Gera jogador na posição inicial do labirinto
     if place.start_pos:
@@ -248,17 +389,17 @@ def main():
         # Posição de fallback se nenhuma posição inicial foi definida
         player = Player(x=0, y=1.7, z=5)
 
-    # Cria a fonte de luz do jogador (spotlight tipo tocha)
-    # Parâmetros: distância do jogador, deslocamento de altura, raio visual, alcance da luz
-    light_ball = LightBall(distance=0.8, height_offset=-0.5, radius=0.15, light_range=15.0)
-
     # ===== VARIÁVEIS DO LOOP DO JOGO =====
     clock = pygame.time.Clock()  # Para controle de taxa de quadros
+    # Resolução da cena 3D ajustada para manter 60 FPS (a sobreposição 2D fica nativa)
+    resolution = ResolutionController(target_fps=60)
+    scene_framebuffer = SceneFramebuffer(width, height)
     running = True  # Controle do loop principal
     game_over = False  # Torna-se True quando inimigo captura jogador
+    # Simulação em passos fixos, desacoplada da taxa de quadros da tela
+    simulation = FixedTimestep(rate=game_config.simulation_rate, max_steps=5)
 
     # Sistema de sobreposição de Vitória/Game Over
-    credits_font = pygame.font.Font(None, 40)
     credits_lines = [
         "Credits:",
         "Game Developers:",
@@ -296,20 +437,28 @@ def main():
                     player.handle_mouse_motion(event.rel[0], event.rel[1])
 
         # ===== FASE DE ATUALIZAÇÃO =====
-        # Calcula tempo do quadro para física suave (alvo de 60 FPS)
-        delta_time = clock.tick(60) / 1000.0  # Converte milissegundos para segundos
+        # Tempo real do quadro (tela limitada a 60 FPS)
+        frame_time = clock.tick(60) / 1000.0  # Converte milissegundos para segundos
+        # Tempo de trabalho do quadro anterior, sem a espera do limitador
+        resolution.record(clock.get_rawtime() / 1000.0)
+
+        # Executa os passos fixos de simulação que couberem no tempo decorrido:
+        # um travamento vira vários passos pequenos em vez de um salto que
+        # atravessaria paredes
+        player_caught = False
+        for _ in range(simulation.advance(frame_time)):
+            if game_over or player_caught:
+                break
 
-        # Atualiza movimento e física do jogador (só se jogo está ativo)
-        if not game_over:
-            player.update(delta_time, collision_check=place.framework.check_collision)
+            # Atualiza movimento e física do jogador
+            player.update(simulation.step, collision_check=place.framework.check_collision)
 
-        # Obtém posição atual do jogador para IA e detecção de vitória
-        x, y, z = player.get_position()
+            # Atualiza IA do inimigo e verifica se jogador foi capturado
+            x, y, z = player.get_position()
+            player_caught = place.update(simulation.step, x, z)
 
-        # Atualiza IA do inimigo e verifica se jogador foi capturado
-        player_caught = False
-        if not game_over:
-            player_caught = place.update(delta_time, x, z)
+        # Obtém posição simulada do jogador para detecção de vitória
+        x, y, z = player.get_position()
 
         # Verifica se inimigo capturou o jogador
         if player_caught and not show_credits:
@@ -325,22 +474,7 @@ def main():
 
             # Gera textura de texto de game over
             show_credits = True  # Reutiliza sistema de sobreposição de créditos para game over
-            credits_textures = []
-            game_over_font = pygame.font.Font(None, 100)
-            game_over_surf = game_over_font.render("GAME OVER", True, (255, 0, 0))
-
-            # Converte para textura OpenGL
-            texture_data = pygame.image.tostring(game_over_surf, "RGBA", True)
-            tex_width = game_over_surf.get_width()
-            tex_height = game_over_surf.get_height()
-
-            texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, tex_width, tex_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-
-            credits_textures.append(('game_over', texture_id, tex_width, tex_height))
+            credits_textures = [('game_over',) + text_renderer.texture("GAME OVER", 100, (255, 0, 0))]
 
         # Verifica se jogador alcançou a saída (dispara vitória uma vez)
         if place.end_pos and not show_credits:
@@ -357,31 +491,17 @@ def main():
                     except Exception as e:
                         print(f"Não foi possível carregar música de encerramento: {e}")
 
-                # Gera texturas de texto para créditos
-                credits_textures = []
-                title_font = pygame.font.Font(None, 60)
-                title_surf = title_font.render("VICTORY!", True, (255, 215, 0))
-                credits_textures.append(('title', title_surf))
-
+                # Texturas de texto para créditos (rasterizadas e enviadas uma única vez)
+                credits_textures = [('title',) + text_renderer.texture("VICTORY!", 60, (255, 215, 0))]
                 for line in credits_lines:
-                    text_surf = credits_font.render(line, True, (200, 200, 200))
-                    credits_textures.append(('line', text_surf))
-
-                # Converte superfícies pygame para texturas OpenGL
-                for i, (text_type, surf) in enumerate(credits_textures):
-                    texture_data = pygame.image.tostring(surf, "RGBA", True)
-                    tex_width = surf.get_width()
-                    tex_height = surf.get_height()
-
-                    texture_id = glGenTextures(1)
-                    glBindTexture(GL_TEXTURE_2D, texture_id)
-                    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-                    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-                    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, tex_width, tex_height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+                    credits_textures.append(('line',) + text_renderer.texture(line, 40, (200, 200, 200)))
 
-                    credits_textures[i] = (text_type, texture_id, tex_width, tex_height)
+        # Renderização entre os dois últimos passos simulados (parado após o game over)
+        alpha = 1.0 if game_over else simulation.alpha
+        x, y, z = player.get_interpolated_position(alpha)
 
-        # Renderização
+        gl_state.begin_frame()
+        scene_framebuffer.begin(resolution.scale)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
 
@@ -395,27 +515,42 @@ def main():
         # Atualiza e renderiza bola de luz (configura iluminação e renderiza o orbe brilhante)
         # Se vitória, define luz ambiente máxima para revelar todo o labirinto
         if show_credits:
-            glEnable(GL_LIGHTING)
-            glEnable(GL_LIGHT0)
-            glLightModelfv(GL_LIGHT_MODEL_AMBIENT, [1.0, 1.0, 1.0, 1.0])  # Luz ambiente máxima
-            glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.0, 0.0, 0.0, 1.0])  # Desabilita spotlight
-            glEnable(GL_COLOR_MATERIAL)
-            glColorMaterial(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
+            gl_state.enable(GL_LIGHTING)
+            gl_state.enable(GL_LIGHT0)
+            gl_state.light_model(GL_LIGHT_MODEL_AMBIENT, [1.0, 1.0, 1.0, 1.0])  # Luz ambiente máxima
+            gl_state.light(GL_LIGHT0, GL_DIFFUSE, [0.0, 0.0, 0.0, 1.0])  # Desabilita spotlight
+            gl_state.enable(GL_COLOR_MATERIAL)
+            gl_state.color_material(GL_FRONT_AND_BACK, GL_AMBIENT_AND_DIFFUSE)
         else:
-            light_ball.update_and_render(x, y, z, yaw, pitch, collision_check=place.framework.check_collision)
-
-        # Renderiza a cena
-        place.render()
+            light_ball.update_and_render(x, y, z, yaw, pitch,
+                                         collision_check=place.framework.check_collision,
+                                         raycast=place.framework.raycast)
+
+        # Renderiza a cena, descartando blocos fora do frustum da câmera; na
+        # vitória a luz ambiente revela todo o labirinto, então o culling por
+        # visibilidade e neblina é desabilitado
+        frustum = Frustum.from_camera(x, y, z, pitch, yaw, CAMERA_FOV_Y, width / height,
+                                      CAMERA_NEAR, CAMERA_FAR)
+        if show_credits:
+            place.render(frustum=frustum)
+        else:
+            # Cenário com iluminação por pixel (quando disponível)
+            light_ball.begin_world_pass()
+            place.render(x, z, frustum)
+            light_ball.end_world_pass()
 
         # Renderiza inimigo (precisa ser renderizado separadamente para billboard)
-        place.render_enemy(x, z)
+        place.render_enemy(x, z, alpha)
 
         # Desabilita iluminação antes de renderizar interface
         if not show_credits:
             light_ball.disable_lighting()
         else:
-            glDisable(GL_LIGHTING)
-            glDisable(GL_LIGHT0)
+            gl_state.disable(GL_LIGHTING)
+            gl_state.disable(GL_LIGHT0)
+
+        # Amplia a cena para a janela; a sobreposição é desenhada em resolução nativa
+        scene_framebuffer.end()
 
         # Desenha sobreposição de créditos se vitória foi disparada (sobreposição 2D usando OpenGL)
         if show_credits and credits_textures:
@@ -429,11 +564,11 @@ def main():
             glLoadIdentity()
 
             # Desabilita teste de profundidade para sobreposição 2D
-            glDisable(GL_DEPTH_TEST)
+            gl_state.disable(GL_DEPTH_TEST)
 
             # Desenha caixa de fundo semi-transparente
-            glEnable(GL_BLEND)
-            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            gl_state.enable(GL_BLEND)
+            gl_state.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
             glColor4f(0.0, 0.0, 0.0, 0.7)  # Preto semi-transparente
             glBegin(GL_QUADS)
             glVertex2f(0, 0)
@@ -443,13 +578,13 @@ def main():
             glEnd()
 
             # Habilita texturização
-            glEnable(GL_TEXTURE_2D)
+            gl_state.enable(GL_TEXTURE_2D)
             glColor4f(1.0, 1.0, 1.0, 1.0)
 
             # Desenha texturas de texto
             y_pos = 70
             for text_type, texture_id, tex_width, tex_height in credits_textures:
-                glBindTexture(GL_TEXTURE_2D, texture_id)
+                gl_state.bind_texture(texture_id)
 
                 x_pos = width // 2 - tex_width // 2  # Centraliza texto
 
@@ -473,8 +608,8 @@ def main():
                 else:
                     y_pos += tex_height + 10
 
-            glDisable(GL_TEXTURE_2D)
-            glDisable(GL_BLEND)
+            gl_state.disable(GL_TEXTURE_2D)
+            gl_state.disable(GL_BLEND)
 
             # Restaura projeção 3D
             glPopMatrix()
@@ -483,10 +618,16 @@ def main():
             glMatrixMode(GL_MODELVIEW)
 
             # Reabilita teste de profundidade
-            glEnable(GL_DEPTH_TEST)
+            gl_state.enable(GL_DEPTH_TEST)
 
         pygame.display.flip()
 
+    # Libera texturas e buffers do mundo antes de destruir o contexto OpenGL
+    place.release()
+    light_ball.release()
+    text_renderer.release_textures()
+    sphere_meshes.release()
+    scene_framebuffer.release()
     pygame.quit()
 
 
@@ -1,5 +1,7 @@
 from .maze import Maze
 from .framework import MazeFramework
 from .generator import MazeGenerator
+from .pathfinding import Pathfinder
+from .visibility import VisibilityTable
 
-__all__ = ['Maze', 'MazeFramework', 'MazeGenerator']
+__all__ = ['Maze', 'MazeFramework', 'MazeGenerator', 'Pathfinder', 'VisibilityTable']
@@ -8,6 +8,8 @@ Símbolos da grade:
 - 'E' = posição final (transitável)
 """
 
+import numpy as np
+
 
 class MazeFramework:
     """Framework para construir labirintos a partir de layouts de grade ASCII."""
@@ -26,6 +28,7 @@ class MazeFramework:
         self.wall_height = wall_height
         self.rows = len(grid)
         self.cols = len(grid[0]) if grid else 0
+        self.mesh_stats = None  # Triângulos antes/depois da fusão, após add_to_framework
 
     def get_world_position(self, row, col):
         """
@@ -115,19 +118,126 @@ class MazeFramework:
             'end': end_pos
         }
 
-    def add_to_framework(self, place_framework):
+    def find_endpoints(self):
         """
-        Adiciona todos os elementos do labirinto a um framework de lugar.
+        Encontra as posições de início e fim sem criar paredes nem teto.
+
+        Returns:
+            tuple: (início, fim) como posições (x, y, z), ou None se ausentes
+        """
+        start_pos = None
+        end_pos = None
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cell = self.grid[row][col]
+                if cell == 'S':
+                    x, z = self.get_world_position(row, col)
+                    start_pos = (x, 1.7, z)
+                elif cell == 'E':
+                    x, z = self.get_world_position(row, col)
+                    end_pos = (x, 1.7, z)
+        return start_pos, end_pos
+
+    def _build_ceiling(self, walkable):
+        """
+        Cria o teto sobre a caixa que envolve as células transitáveis.
 
         Args:
-            place_framework: Instância de PlaceFramework para adicionar elementos
+            walkable: Array bool (linhas, colunas) das células transitáveis
+
+        Returns:
+            Ceiling: Teto único, ou None se não há células transitáveis
+        """
+        from place.ceiling import Ceiling
+
+        open_rows = np.flatnonzero(walkable.any(axis=1))
+        open_cols = np.flatnonzero(walkable.any(axis=0))
+        if not open_rows.size:
+            return None
+
+        min_x, min_z = self.get_world_position(open_rows[0], open_cols[0])
+        max_x, max_z = self.get_world_position(open_rows[-1], open_cols[-1])
+        return Ceiling(
+            x=float(min_x + max_x) / 2,
+            y=self.wall_height,
+            z=float(min_z + max_z) / 2,
+            width=float(max_x - min_x) + self.cell_size,
+            depth=float(max_z - min_z) + self.cell_size
+        )
+
+    def add_to_framework(self, place_framework, visibility=None, cull_distance=float('inf'),
+                         chunk_cells=None, geometry=True):
         """
-        elements = self.parse()
+        Adiciona todos os elementos do labirinto a um framework de lugar.
 
-        for wall in elements['walls']:
-            place_framework.add_element(wall)
+        A colisão das paredes é feita por uma única grade de ocupação
+        construída da grade ASCII; sua geometria (apenas faces visíveis,
+        fundidas em quads longos) é empacotada em uma única malha estática
+        desenhada com um VBO. As contagens de triângulos antes e depois da
+        fusão ficam em mesh_stats.
 
-        if elements['ceiling']:
-            place_framework.add_element(elements['ceiling'])
+        Args:
+            place_framework: Instância de PlaceFramework para adicionar elementos
+            visibility: VisibilityTable conservadora opcional; quando fornecida,
+                        a malha das paredes desenha apenas as células
+                        potencialmente visíveis a partir do observador
+            cull_distance: Distância além da qual as paredes não são desenhadas
+                           (normalmente o fim da neblina)
+            chunk_cells: Lado dos blocos espaciais em células; quando fornecido,
+                         paredes e teto são divididos em um elemento por bloco,
+                         cada um com seu buffer e sua caixa para frustum culling
+            geometry: Se False, adiciona apenas a grade de colisão (simulação
+                      sem renderização)
 
-        return elements['start'], elements['end']
+        Returns:
+            tuple: Posições (x, y, z) de início e fim
+        """
+        from place.wall import Wall
+        from place.static_mesh import StaticMesh, CellCulledMesh
+        from collision.grid import OccupancyGrid
+        from .mesh import build_maze_faces, group_quads_by_chunk, triangle_count
+
+        occupancy = OccupancyGrid.from_grid(self.grid, self.cell_size)
+        place_framework.add_collidable(occupancy)
+
+        start_pos, end_pos = self.find_endpoints()
+        if not geometry:
+            return start_pos, end_pos
+
+        wall_cells = int(occupancy.occupancy.sum())
+        if wall_cells:
+            # Apenas faces visíveis, fundidas ao longo dos corredores
+            vertices, quad_cells, quad_chunks = build_maze_faces(
+                occupancy.occupancy, self.cell_size, self.wall_height, chunk_cells
+            )
+            self.mesh_stats = {
+                'boxes': wall_cells * 5 * 2,  # 5 faces por caixa, 2 triângulos por face
+                'triangles': triangle_count(vertices),
+            }
+
+            color = (0.6, 0.4, 0.2)  # Cor marrom, igual a Wall.render
+            chunks = group_quads_by_chunk(vertices, quad_cells, quad_chunks)
+            for chunk_vertices, chunk_links in chunks.values():
+                if visibility is not None:
+                    wall_mesh = CellCulledMesh(chunk_vertices, chunk_links, visibility,
+                                               cull_distance, texture_path=Wall.TEXTURE_PATH,
+                                               color=color)
+                else:
+                    wall_mesh = StaticMesh(chunk_vertices, texture_path=Wall.TEXTURE_PATH,
+                                           color=color)
+                place_framework.add_element(wall_mesh)
+
+        ceiling = self._build_ceiling(~occupancy.occupancy)
+        if ceiling:
+            if chunk_cells:
+                # Teto alinhado à mesma grade de blocos das paredes
+                chunk_size = chunk_cells * self.cell_size
+                origin_x = -(self.cols / 2 + 0.5) * self.cell_size
+                origin_z = -(self.rows / 2 + 0.5) * self.cell_size
+                for piece in ceiling.split(chunk_size, origin_x, origin_z):
+                    place_framework.add_element(piece)
+                ceiling.release()
+            else:
+                place_framework.add_element(ceiling)
+
+        return start_pos, end_pos
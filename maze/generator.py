@@ -1,43 +1,62 @@
+"""
+Geração de labirintos perfeitos (exatamente um caminho entre duas células).
+
+Os algoritmos trabalham sobre as células do labirinto como índices inteiros
+(célula = linha * size + coluna), com estado em bytearray/listas planas, e
+registram as passagens abertas em dois arrays booleanos (leste e sul). A
+grade final é montada de uma vez em NumPy como uint8 com os códigos ASCII
+dos símbolos ('#', '.', 'S', 'E'); generate() a converte para a lista de
+listas de caracteres usada pelo restante do jogo.
+
+Todos usam o módulo random (e um gerador NumPy semeado por ele), então
+random.seed() reproduz o mesmo labirinto.
+"""
+
+import itertools
 import random
+import numpy as np
+
+
+# Códigos uint8 da grade gerada
+WALL = ord('#')
+PATH = ord('.')
+START = ord('S')
+EXIT = ord('E')
 
 
 class MazeGenerator:
     """Gera labirintos usando vários algoritmos."""
 
+    ALGORITHMS = ('prim', 'backtracking', 'kruskal', 'wilson')
+    NEIGHBOR_SLOTS = 12  # Entradas por célula na tabela de vizinhos de Wilson
+    WALK_BATCH = 1 << 20  # Máximo de sorteios gerados por lote nos passeios de Wilson
+
     @staticmethod
     def find_dead_ends(grid):
         """
         Encontra todos os becos sem saída no labirinto (células com apenas uma saída).
 
         Args:
-            grid: Grade 2D do labirinto
+            grid: Grade 2D do labirinto (lista de listas de caracteres ou array uint8)
 
         Returns:
             list: Lista de tuplas (linha, coluna) representando posições de becos sem saída
         """
-        dead_ends = []
-        rows = len(grid)
-        cols = len(grid[0]) if rows > 0 else 0
-
-        for row in range(1, rows - 1):
-            for col in range(1, cols - 1):
-                if grid[row][col] in ['.', 'S', 'E']:
-                    # Conta vizinhos abertos
-                    open_neighbors = 0
-                    if grid[row - 1][col] in ['.', 'S', 'E']:
-                        open_neighbors += 1
-                    if grid[row + 1][col] in ['.', 'S', 'E']:
-                        open_neighbors += 1
-                    if grid[row][col - 1] in ['.', 'S', 'E']:
-                        open_neighbors += 1
-                    if grid[row][col + 1] in ['.', 'S', 'E']:
-                        open_neighbors += 1
-
-                    # Beco sem saída tem exatamente 1 vizinho
-                    if open_neighbors == 1 and grid[row][col] not in ['S', 'E']:
-                        dead_ends.append((row, col))
-
-        return dead_ends
+        if isinstance(grid, np.ndarray):
+            codes = grid
+        else:
+            codes = np.array([[ord(cell) for cell in row] for row in grid], dtype=np.uint8)
+        if codes.ndim != 2 or codes.shape[0] < 3 or codes.shape[1] < 3:
+            return []
+
+        walkable = (codes == PATH) | (codes == START) | (codes == EXIT)
+        inner = walkable[1:-1, 1:-1]
+        open_neighbors = (walkable[:-2, 1:-1].astype(np.int8) + walkable[2:, 1:-1] +
+                          walkable[1:-1, :-2] + walkable[1:-1, 2:])
+
+        # Beco sem saída tem exatamente 1 vizinho (início e saída não contam)
+        dead = inner & (open_neighbors == 1) & (codes[1:-1, 1:-1] == PATH)
+        return [(int(row) + 1, int(col) + 1) for row, col in np.argwhere(dead)]
 
     @staticmethod
     def generate(size=5, algorithm='prim'):
@@ -46,124 +65,311 @@ class MazeGenerator:
 
         Args:
             size: Tamanho do labirinto (criará uma grade (2*size+1) x (2*size+1))
-            algorithm: 'prim' (padrão) ou 'backtracking'
+            algorithm: 'prim' (padrão), 'backtracking', 'kruskal' ou 'wilson'
 
         Returns:
             list: Grade 2D representando o labirinto com paredes '#' e caminhos '.'
         """
-        if algorithm == 'prim':
-            return MazeGenerator._generate_prim(size)
-        else:
-            return MazeGenerator._generate_backtracking(size)
+        return MazeGenerator.to_rows(MazeGenerator.generate_array(size, algorithm))
 
     @staticmethod
-    def _generate_prim(size):
+    def generate_array(size=5, algorithm='prim'):
         """
-        Gera labirinto usando o algoritmo de Prim Aleatorizado.
-        Cria labirintos com melhor ramificação e caminhos menos previsíveis.
+        Gera um labirinto como array NumPy, sem criar listas de caracteres.
+
+        Args:
+            size: Tamanho do labirinto (grade (2*size+1) x (2*size+1))
+            algorithm: 'prim' (padrão, melhor ramificação), 'backtracking'
+                       (corredores longos), 'kruskal' (muitos becos curtos) ou
+                       'wilson' (uniforme entre todos os labirintos possíveis,
+                       mas o mais lento em grades grandes, com tempo que varia
+                       com a semente); nomes desconhecidos usam 'backtracking'
+
+        Returns:
+            numpy.ndarray: Grade uint8 com os códigos WALL, PATH, START e EXIT
         """
-        grid_size = 2 * size + 1
-        grid = [['#' for _ in range(grid_size)] for _ in range(grid_size)]
+        size = max(1, int(size))
+        carve = {
+            'prim': MazeGenerator._generate_prim,
+            'kruskal': MazeGenerator._generate_kruskal,
+            'wilson': MazeGenerator._generate_wilson,
+        }.get(algorithm, MazeGenerator._generate_backtracking)
+
+        east = np.zeros((size, max(size - 1, 0)), dtype=bool)
+        south = np.zeros((max(size - 1, 0), size), dtype=bool)
+        carve(size, east.reshape(-1), south.reshape(-1))
+        return MazeGenerator._build_grid(size, east, south)
+
+    @staticmethod
+    def to_rows(grid):
+        """
+        Converte uma grade uint8 para a lista de listas de caracteres.
+
+        Args:
+            grid: Array uint8 de códigos ASCII
+
+        Returns:
+            list: Grade 2D de caracteres
+        """
+        return [list(row.tobytes().decode('ascii')) for row in grid]
 
-        # Começa de posição aleatória
-        start_row, start_col = 1, 1
-        grid[start_row][start_col] = 'S'
+    @staticmethod
+    def _open(size, cells, neighbors, east, south):
+        """
+        Abre as passagens entre pares de células vizinhas nos arrays leste/sul.
+
+        Args:
+            size: Número de células por lado
+            cells: Sequência de células
+            neighbors: Sequência de células vizinhas, na mesma ordem
+            east: Array bool plano (size * (size - 1)) das passagens para a direita
+            south: Array bool plano ((size - 1) * size) das passagens para baixo
+        """
+        cells = np.asarray(cells, dtype=np.int64)
+        neighbors = np.asarray(neighbors, dtype=np.int64)
+        low = np.minimum(cells, neighbors)
+        horizontal = np.abs(cells - neighbors) == 1
+        rows, cols = np.divmod(low[horizontal], size)
+        east[rows * (size - 1) + cols] = True
+        south[low[~horizontal]] = True
+
+    @staticmethod
+    def _neighbors(size, cell):
+        """Células vizinhas (norte, leste, sul, oeste) dentro da grade."""
+        row, col = divmod(cell, size)
+        neighbors = []
+        if row > 0:
+            neighbors.append(cell - size)
+        if col < size - 1:
+            neighbors.append(cell + 1)
+        if row < size - 1:
+            neighbors.append(cell + size)
+        if col > 0:
+            neighbors.append(cell - 1)
+        return neighbors
 
-        # Lista de paredes - paredes adjacentes a células visitadas
-        walls = []
-        visited = set()
-        visited.add((start_row, start_col))
+    @staticmethod
+    def _generate_prim(size, east, south):
+        """
+        Gera labirinto usando o algoritmo de Prim Aleatorizado.
+        Cria labirintos com melhor ramificação e caminhos menos previsíveis.
 
-        # Adiciona paredes iniciais
-        directions = [(-2, 0), (0, 2), (2, 0), (0, -2)]
-        for dr, dc in directions:
-            wall_row, wall_col = start_row + dr // 2, start_col + dc // 2
-            new_row, new_col = start_row + dr, start_col + dc
-            if 0 < new_row < grid_size - 1 and 0 < new_col < grid_size - 1:
-                walls.append((wall_row, wall_col, new_row, new_col))
+        A lista de paredes da fronteira remove o item sorteado trocando-o
+        com o último (O(1)), já que a ordem da lista não importa.
+        """
+        visited = bytearray(size * size)
+        visited[0] = 1  # Começa no canto superior esquerdo (posição 'S')
+        neighbors_of = MazeGenerator._neighbors
+        walls = [(0, neighbor) for neighbor in neighbors_of(size, 0)]
+        cells = []
+        links = []
+        rand = random.random
 
         while walls:
-            # Escolhe parede aleatória
-            wall_row, wall_col, cell_row, cell_col = walls.pop(random.randrange(len(walls)))
+            # Escolhe parede aleatória e a remove em O(1)
+            index = int(rand() * len(walls))
+            walls[index], walls[-1] = walls[-1], walls[index]
+            cell, neighbor = walls.pop()
 
             # Se a célula do outro lado não foi visitada
-            if (cell_row, cell_col) not in visited:
-                # Torna a parede uma passagem e marca a célula como visitada
-                grid[wall_row][wall_col] = '.'
-                grid[cell_row][cell_col] = '.'
-                visited.add((cell_row, cell_col))
-
-                # Adiciona paredes vizinhas da célula
-                for dr, dc in directions:
-                    wall_r, wall_c = cell_row + dr // 2, cell_col + dc // 2
-                    new_r, new_c = cell_row + dr, cell_col + dc
-                    if (0 < new_r < grid_size - 1 and
-                        0 < new_c < grid_size - 1 and
-                        (new_r, new_c) not in visited):
-                        walls.append((wall_r, wall_c, new_r, new_c))
-
-        # Place exit
-        MazeGenerator._place_exit(grid, grid_size)
-        return grid
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                cells.append(cell)
+                links.append(neighbor)
+                for next_cell in neighbors_of(size, neighbor):
+                    if not visited[next_cell]:
+                        walls.append((neighbor, next_cell))
+
+        MazeGenerator._open(size, cells, links, east, south)
 
     @staticmethod
-    def _generate_backtracking(size):
+    def _generate_backtracking(size, east, south):
         """
-        Gera labirinto usando backtracking recursivo (DFS).
+        Gera labirinto usando backtracking (DFS com pilha explícita).
         Cria labirintos com corredores longos.
         """
-        grid_size = 2 * size + 1
-        grid = [['#' for _ in range(grid_size)] for _ in range(grid_size)]
+        visited = bytearray(size * size)
+        visited[0] = 1
+        stack = [0]
+        neighbors_of = MazeGenerator._neighbors
+        cells = []
+        links = []
+        rand = random.random
 
-        start_row, start_col = 1, 1
-        grid[start_row][start_col] = 'S'
+        while stack:
+            cell = stack[-1]
+            candidates = [neighbor for neighbor in neighbors_of(size, cell) if not visited[neighbor]]
+            if candidates:
+                neighbor = candidates[int(rand() * len(candidates))]
+                visited[neighbor] = 1
+                cells.append(cell)
+                links.append(neighbor)
+                stack.append(neighbor)
+            else:
+                stack.pop()
+
+        MazeGenerator._open(size, cells, links, east, south)
 
-        stack = [(start_row, start_col)]
-        visited = set()
-        visited.add((start_row, start_col))
+    @staticmethod
+    def _generate_kruskal(size, east, south):
+        """
+        Gera labirinto com o algoritmo de Kruskal aleatorizado.
 
-        directions = [(-2, 0), (0, 2), (2, 0), (0, -2)]
+        Percorre todas as paredes internas em ordem aleatória e abre as que
+        separam componentes diferentes (union-find com compressão de caminho
+        por divisão e união por tamanho).
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        east_count = len(east)
+        order = rng.permutation(east_count + len(south)).tolist()
 
-        while stack:
-            current_row, current_col = stack[-1]
-
-            neighbors = []
-            for dr, dc in directions:
-                new_row, new_col = current_row + dr, current_col + dc
-                if (0 < new_row < grid_size - 1 and
-                    0 < new_col < grid_size - 1 and
-                    (new_row, new_col) not in visited):
-                    neighbors.append((new_row, new_col, dr, dc))
-
-            if neighbors:
-                new_row, new_col, dr, dc = random.choice(neighbors)
-
-                wall_row = current_row + dr // 2
-                wall_col = current_col + dc // 2
-                grid[wall_row][wall_col] = '.'
-                grid[new_row][new_col] = '.'
-
-                visited.add((new_row, new_col))
-                stack.append((new_row, new_col))
+        parent = list(range(size * size))
+        component_size = [1] * (size * size)
+        width = size - 1
+        remaining = size * size - 1  # Uniões que faltam para a árvore geradora
+
+        for edge in order:
+            if edge < east_count:
+                row, col = divmod(edge, width)
+                a = row * size + col
+                b = a + 1
             else:
-                stack.pop()
+                a = edge - east_count
+                b = a + size
+
+            # Raízes com divisão de caminho
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+            if a == b:
+                continue
+
+            if component_size[a] < component_size[b]:
+                a, b = b, a
+            parent[b] = a
+            component_size[a] += component_size[b]
+            if edge < east_count:
+                east[edge] = True
+            else:
+                south[edge - east_count] = True
+
+            remaining -= 1
+            if remaining == 0:
+                break
+
+    @staticmethod
+    def _neighbor_table(size):
+        """
+        Tabela plana de vizinhos para sorteio com um único índice.
+
+        Cada célula ocupa NEIGHBOR_SLOTS entradas (mmc dos graus 2, 3 e 4),
+        com cada vizinho repetido NEIGHBOR_SLOTS / grau vezes; assim um
+        inteiro uniforme em [0, NEIGHBOR_SLOTS) escolhe um vizinho uniforme.
+
+        Args:
+            size: Número de células por lado
+
+        Returns:
+            list: Vizinho da célula c na entrada c * NEIGHBOR_SLOTS + sorteio
+        """
+        cells = np.arange(size * size)
+        rows, cols = np.divmod(cells, size)
+        # Norte, leste, sul, oeste e quais existem dentro da grade
+        neighbors = np.stack([cells - size, cells + 1, cells + size, cells - 1], axis=1)
+        valid = np.stack([rows > 0, cols < size - 1, rows < size - 1, cols > 0], axis=1)
 
+        # Vizinhos válidos primeiro, na mesma ordem
+        order = np.argsort(~valid, axis=1, kind='stable')
+        neighbors = np.take_along_axis(neighbors, order, axis=1)
+        degree = np.maximum(valid.sum(axis=1), 1)
+        slots = np.arange(MazeGenerator.NEIGHBOR_SLOTS)
+        table = np.take_along_axis(neighbors, slots[None, :] % degree[:, None], axis=1)
+        return table.ravel().tolist()
+
+    @staticmethod
+    def _generate_wilson(size, east, south):
+        """
+        Gera labirinto com o algoritmo de Wilson (passeios aleatórios com
+        apagamento de laços), uniforme entre todas as árvores geradoras.
+
+        Cada passeio guarda só a última direção tomada em cada célula, o que
+        apaga os laços implicitamente; ao tocar a árvore, o caminho é refeito
+        seguindo essas direções e incorporado. Os passos dos passeios usam
+        sorteios gerados em lotes NumPy sobre a tabela de _neighbor_table().
+        """
+        count = size * size
+        in_tree = bytearray(count)
+        # A árvore começa no centro: a distribuição não depende da raiz, e o
+        # primeiro passeio (o mais longo) chega ao centro muito antes que a um canto
+        in_tree[(size // 2) * size + size // 2] = 1
+        next_cell = [0] * count
+        table = MazeGenerator._neighbor_table(size)
+        slots = MazeGenerator.NEIGHBOR_SLOTS
+        cells = []
+
+        # Cada passeio começa na próxima célula fora da árvore, em ordem aleatória
+        rng = np.random.default_rng(random.getrandbits(64))
+        starts = rng.permutation(count).tolist()
+        batch = min(MazeGenerator.WALK_BATCH, 16 * count)
+        draw = itertools.chain.from_iterable(
+            rng.integers(0, slots, batch).tolist() for _ in itertools.count()
+        ).__next__
+
+        for start in starts:
+            if in_tree[start]:
+                continue
+
+            cell = start
+            while not in_tree[cell]:
+                step = table[cell * slots + draw()]
+                next_cell[cell] = step
+                cell = step
+
+            cell = start
+            while not in_tree[cell]:
+                in_tree[cell] = 1
+                cells.append(cell)
+                cell = next_cell[cell]
+
+        MazeGenerator._open(size, cells, [next_cell[cell] for cell in cells], east, south)
+
+    @staticmethod
+    def _build_grid(size, east, south):
+        """
+        Monta a grade uint8 a partir das passagens abertas e marca início e saída.
+
+        Args:
+            size: Número de células por lado
+            east: Array bool (size, size - 1), passagem para a célula à direita
+            south: Array bool (size - 1, size), passagem para a célula abaixo
+
+        Returns:
+            numpy.ndarray: Grade (2*size+1) x (2*size+1)
+        """
+        grid_size = 2 * size + 1
+        grid = np.full((grid_size, grid_size), WALL, dtype=np.uint8)
+        grid[1::2, 1::2] = PATH
+        grid[1::2, 2:-1:2][east] = PATH
+        grid[2:-1:2, 1::2][south] = PATH
+        grid[1, 1] = START
         MazeGenerator._place_exit(grid, grid_size)
         return grid
 
     @staticmethod
     def _place_exit(grid, grid_size):
         """Coloca saída na área inferior direita com abertura."""
-        exit_placed = False
-        for col in range(grid_size - 2, 0, -1):
-            for row in range(grid_size - 2, 0, -1):
-                if grid[row][col] == '.':
-                    grid[row][col] = 'E'
-                    if col == grid_size - 2:
-                        grid[row][grid_size - 1] = 'E'
-                    elif row == grid_size - 2:
-                        grid[grid_size - 1][col] = 'E'
-                    exit_placed = True
-                    break
-            if exit_placed:
-                break
+        # Coluna mais à direita com caminho e, nela, a linha mais abaixo
+        open_columns = np.flatnonzero((grid[1:-1, 1:-1] == PATH).any(axis=0))
+        if not open_columns.size:
+            return
+        col = int(open_columns[-1]) + 1
+        row = int(np.flatnonzero(grid[1:-1, col] == PATH)[-1]) + 1
+
+        grid[row, col] = EXIT
+        if col == grid_size - 2:
+            grid[row, grid_size - 1] = EXIT
+        elif row == grid_size - 2:
+            grid[grid_size - 1, col] = EXIT
@@ -21,7 +21,8 @@ class Maze:
         Args:
             size: Parâmetro de tamanho (cria grade (2*size+1) x (2*size+1))
                  size=3 -> 7x7, size=5 -> 11x11, size=10 -> 21x21
-            algorithm: 'prim' (padrão, melhor ramificação) ou 'backtracking' (corredores longos)
+            algorithm: 'prim' (padrão, melhor ramificação), 'backtracking' (corredores longos),
+                       'kruskal' (muitos becos curtos) ou 'wilson' (uniforme)
 
         Returns:
             list: Grade 2D pronta para MazeFramework
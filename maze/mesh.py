@@ -0,0 +1,206 @@
+"""
+Construção de malhas estáticas para a geometria do labirinto.
+
+Empacota as faces de todas as paredes em um único array NumPy intercalado
+no formato GL_T2F_N3F_V3F (u, v, nx, ny, nz, x, y, z), pronto para ser
+enviado uma única vez a um vertex buffer.
+
+build_maze_faces gera apenas as faces que podem ser vistas (as que fazem
+fronteira com uma célula aberta) e funde faces coplanares vizinhas em quads
+longos.
+"""
+
+import numpy as np
+
+
+# Número de floats por vértice no formato GL_T2F_N3F_V3F
+VERTEX_STRIDE = 8
+
+# Faces laterais visíveis de uma célula de parede: (deslocamento da célula
+# vizinha, normal, eixo ao longo do qual as faces são fundidas, ordem dos
+# cantos). Cada canto é (s, y): s = 0/1 no início/fim do trecho e y = 0/1 na
+# base/topo, reproduzindo a orientação das faces de Wall.render().
+_FRONT_CORNERS = ((0, 0), (1, 0), (1, 1), (0, 1))
+_BACK_CORNERS = ((0, 0), (0, 1), (1, 1), (1, 0))
+_SIDE_FACES = (
+    ((1, 0), (0.0, 0.0, 1.0), 'x', _FRONT_CORNERS),    # Frontal (+Z)
+    ((-1, 0), (0.0, 0.0, -1.0), 'x', _BACK_CORNERS),   # Traseira (-Z)
+    ((0, -1), (-1.0, 0.0, 0.0), 'z', _FRONT_CORNERS),  # Esquerda (-X)
+    ((0, 1), (1.0, 0.0, 0.0), 'z', _BACK_CORNERS),     # Direita (+X)
+)
+
+
+def _runs(mask):
+    """
+    Encontra trechos contínuos de True ao longo das linhas de uma máscara 2D.
+
+    Returns:
+        tuple: (linhas, início, fim) dos trechos, com fim exclusivo
+    """
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    change = np.diff(padded, axis=1)
+    lines, starts = np.nonzero(change == 1)
+    _, ends = np.nonzero(change == -1)
+    return lines, starts, ends
+
+
+def _split_runs(lines, starts, ends, chunk_cells):
+    """
+    Corta trechos nas fronteiras de blocos de chunk_cells células.
+
+    Returns:
+        tuple: (linhas, início, fim) dos trechos resultantes
+    """
+    pieces = (ends - 1) // chunk_cells - starts // chunk_cells + 1
+    run = np.repeat(np.arange(len(starts)), pieces)
+    index = np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    block = starts[run] // chunk_cells + index
+    new_starts = np.maximum(starts[run], block * chunk_cells)
+    new_ends = np.minimum(ends[run], (block + 1) * chunk_cells)
+    return lines[run], new_starts, new_ends
+
+
+def build_maze_faces(occupancy, cell_size=5.0, wall_height=3.0, chunk_cells=None):
+    """
+    Gera a malha das paredes apenas com faces visíveis, fundidas em quads longos.
+
+    Uma face lateral só existe onde a parede faz fronteira com uma célula
+    aberta (ou com o exterior da grade, visível pela abertura da saída).
+    Faces superiores ficam rentes ao teto e nunca são vistas. Faces
+    consecutivas no mesmo plano viram um único quad, com a coordenada u
+    repetindo a textura uma vez por célula.
+
+    Args:
+        occupancy: Array booleano (linhas, colunas), True = parede
+        cell_size: Tamanho de cada célula da grade
+        wall_height: Altura das paredes
+        chunk_cells: Lado dos blocos espaciais em células; quando fornecido,
+                     nenhum quad atravessa a fronteira entre blocos
+
+    Returns:
+        tuple: (vertices, quad_cells, quad_chunks) onde vertices é um array
+        float32 (N, 8) GL_T2F_N3F_V3F com 4 vértices por quad, quad_cells é
+        um array int (M, 3) de pares (quad, linha, coluna) ligando cada quad
+        às células abertas de onde ele pode ser visto, e quad_chunks é um
+        array int (N / 4, 2) com o bloco (linha, coluna) de cada quad
+    """
+    occupancy = np.asarray(occupancy, dtype=bool)
+    rows, cols = occupancy.shape
+
+    # Máscara de células abertas com uma borda aberta ao redor da grade
+    open_cells = np.ones((rows + 2, cols + 2), dtype=bool)
+    open_cells[1:-1, 1:-1] = ~occupancy
+
+    quads = []
+    links = []
+    chunks = []
+    quad_count = 0
+    for (d_row, d_col), normal, axis, corners in _SIDE_FACES:
+        neighbor_open = open_cells[1 + d_row:1 + d_row + rows, 1 + d_col:1 + d_col + cols]
+        faces = occupancy & neighbor_open
+
+        # Trechos ao longo de X (faces ±Z) percorrem colunas; ao longo de Z, linhas
+        if axis == 'x':
+            lines, starts, ends = _runs(faces)
+        else:
+            lines, starts, ends = _runs(faces.T)
+        if len(lines) == 0:
+            continue
+        if chunk_cells:
+            lines, starts, ends = _split_runs(lines, starts, ends, chunk_cells)
+
+        lengths = (ends - starts).astype(np.float32)
+        if axis == 'x':
+            # Linha fixa, trecho de colunas [start, end)
+            run_min = (starts - cols / 2 - 0.5) * cell_size
+            plane = (lines - rows / 2 + d_row * 0.5) * cell_size
+        else:
+            # Coluna fixa, trecho de linhas [start, end)
+            run_min = (starts - rows / 2 - 0.5) * cell_size
+            plane = (lines - cols / 2 + d_col * 0.5) * cell_size
+
+        vertices = np.empty((len(lines), 4, VERTEX_STRIDE), dtype=np.float32)
+        vertices[:, :, 2:5] = normal
+        for corner, (s, y) in enumerate(corners):
+            along = run_min + s * lengths * cell_size
+            vertices[:, corner, 0] = s * lengths  # Uma repetição por célula
+            vertices[:, corner, 1] = y
+            vertices[:, corner, 6] = y * wall_height
+            if axis == 'x':
+                vertices[:, corner, 5] = along
+                vertices[:, corner, 7] = plane
+            else:
+                vertices[:, corner, 5] = plane
+                vertices[:, corner, 7] = along
+        quads.append(vertices)
+
+        # Liga cada quad às células abertas à sua frente (dentro da grade)
+        run_lengths = ends - starts
+        quad_ids = np.repeat(np.arange(len(lines)) + quad_count, run_lengths)
+        steps = np.arange(run_lengths.sum()) - np.repeat(np.cumsum(run_lengths) - run_lengths, run_lengths)
+        positions = np.repeat(starts, run_lengths) + steps
+        fixed = np.repeat(lines, run_lengths)
+        if axis == 'x':
+            cell_rows, cell_cols = fixed + d_row, positions
+        else:
+            cell_rows, cell_cols = positions, fixed + d_col
+        inside = (cell_rows >= 0) & (cell_rows < rows) & (cell_cols >= 0) & (cell_cols < cols)
+        links.append(np.stack([quad_ids[inside], cell_rows[inside], cell_cols[inside]], axis=1))
+        quad_count += len(lines)
+
+        # Bloco de cada quad, pela célula de parede onde o trecho começa
+        block = chunk_cells or max(rows, cols, 1)
+        if axis == 'x':
+            chunks.append(np.stack([lines // block, starts // block], axis=1))
+        else:
+            chunks.append(np.stack([starts // block, lines // block], axis=1))
+
+    if not quads:
+        return (np.zeros((0, VERTEX_STRIDE), dtype=np.float32),
+                np.zeros((0, 3), dtype=np.int64), np.zeros((0, 2), dtype=np.int64))
+    return (np.concatenate(quads).reshape(-1, VERTEX_STRIDE), np.concatenate(links),
+            np.concatenate(chunks))
+
+
+def group_quads_by_chunk(vertices, quad_cells, quad_chunks):
+    """
+    Separa uma malha de quads por bloco espacial.
+
+    Args:
+        vertices: Array (N, 8) com 4 vértices por quad
+        quad_cells: Array (M, 3) de pares (quad, linha, coluna)
+        quad_chunks: Array (N / 4, 2) com o bloco de cada quad
+
+    Returns:
+        dict: (linha, coluna) do bloco -> (vertices, quad_cells) do bloco,
+        com os índices de quad renumerados a partir de 0
+    """
+    quads = vertices.reshape(-1, 4, VERTEX_STRIDE)
+    keys, chunk_of_quad = np.unique(quad_chunks, axis=0, return_inverse=True)
+    chunk_of_quad = chunk_of_quad.reshape(-1)
+
+    # Ordena quads e ligações por bloco e separa nas fronteiras
+    quad_order = np.argsort(chunk_of_quad, kind='stable')
+    quad_bounds = np.searchsorted(chunk_of_quad[quad_order], np.arange(len(keys) + 1))
+    local = np.empty(len(quads), dtype=np.int64)
+    local[quad_order] = np.arange(len(quads)) - np.repeat(quad_bounds[:-1], np.diff(quad_bounds))
+
+    link_chunk = chunk_of_quad[quad_cells[:, 0]]
+    link_order = np.argsort(link_chunk, kind='stable')
+    link_bounds = np.searchsorted(link_chunk[link_order], np.arange(len(keys) + 1))
+    links = np.column_stack([local[quad_cells[:, 0]], quad_cells[:, 1:]])[link_order]
+
+    groups = {}
+    for index, key in enumerate(keys):
+        members = quad_order[quad_bounds[index]:quad_bounds[index + 1]]
+        groups[tuple(int(v) for v in key)] = (
+            quads[members].reshape(-1, VERTEX_STRIDE),
+            links[link_bounds[index]:link_bounds[index + 1]]
+        )
+    return groups
+
+
+def triangle_count(vertices):
+    """Número de triângulos de uma malha de quads (2 por quad)."""
+    return len(vertices) // 4 * 2
@@ -0,0 +1,248 @@
+"""
+Busca de caminhos sobre a grade do labirinto.
+
+Oferece A* com heap binário para consultas ponto a ponto e um campo de fluxo
+(BFS a partir da célula do jogador) que é recalculado apenas quando o jogador
+muda de célula, e só na primeira consulta depois disso. Com o campo pronto,
+qualquer número de inimigos obtém sua próxima célula com uma consulta O(1).
+"""
+
+from collections import deque
+import heapq
+import math
+import numpy as np
+
+
+# Vizinhos ortogonais (linha, coluna)
+NEIGHBORS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# Símbolos transitáveis, os mesmos de MazeFramework.is_walkable
+WALKABLE_CELLS = ('.', ' ', 'S', 'E')
+
+
+class Pathfinder:
+    """Busca de caminhos e campo de fluxo sobre uma grade de labirinto."""
+
+    def __init__(self, grid, cell_size=5.0):
+        """
+        Inicializa o pathfinder.
+
+        Args:
+            grid: Lista 2D de caracteres do labirinto
+            cell_size: Tamanho de cada célula da grade
+        """
+        self.cell_size = cell_size
+        self.rows = len(grid)
+        self.cols = len(grid[0]) if grid else 0
+        self.walkable = np.array(
+            [[cell in WALKABLE_CELLS for cell in row] for row in grid], dtype=bool
+        ).reshape(self.rows, self.cols)
+
+        # Campo de fluxo em cache
+        self.target_cell = None
+        self._field_cell = None  # Alvo do campo calculado
+        self.distance = None  # Passos até o alvo (-1 = inalcançável)
+        self.next_row = None  # Próxima célula em direção ao alvo
+        self.next_col = None
+
+    def world_to_cell(self, x, z):
+        """
+        Converte coordenadas do mundo para a célula da grade (mesmo sistema de
+        MazeFramework.get_world_position, com centros nas posições das células).
+
+        Returns:
+            tuple: (linha, coluna)
+        """
+        col = math.floor(x / self.cell_size + self.cols / 2 + 0.5)
+        row = math.floor(z / self.cell_size + self.rows / 2 + 0.5)
+        return row, col
+
+    def cell_to_world(self, row, col):
+        """
+        Converte uma célula da grade para a posição do seu centro no mundo.
+
+        Returns:
+            tuple: Posição (x, z)
+        """
+        x = (col - self.cols / 2) * self.cell_size
+        z = (row - self.rows / 2) * self.cell_size
+        return x, z
+
+    def is_walkable(self, row, col):
+        """Verifica se uma célula está dentro da grade e é transitável."""
+        return 0 <= row < self.rows and 0 <= col < self.cols and bool(self.walkable[row, col])
+
+    def find_path(self, start, goal):
+        """
+        Encontra o menor caminho entre duas células usando A*.
+
+        Args:
+            start: Célula inicial (linha, coluna)
+            goal: Célula final (linha, coluna)
+
+        Returns:
+            list: Células (linha, coluna) de start até goal, ou [] se não houver caminho
+        """
+        if not self.is_walkable(*start) or not self.is_walkable(*goal):
+            return []
+
+        goal_row, goal_col = goal
+        came_from = {start: None}
+        cost = {start: 0}
+        # Entradas: (f, contador de desempate, g, célula)
+        open_heap = [(abs(start[0] - goal_row) + abs(start[1] - goal_col), 0, 0, start)]
+        counter = 1
+
+        while open_heap:
+            _, _, g, current = heapq.heappop(open_heap)
+            if current == goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                return path
+
+            if g > cost[current]:
+                continue  # Entrada obsoleta do heap
+
+            row, col = current
+            for dr, dc in NEIGHBORS:
+                neighbor = (row + dr, col + dc)
+                if not self.is_walkable(*neighbor):
+                    continue
+                new_cost = g + 1
+                if new_cost < cost.get(neighbor, math.inf):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heuristic = abs(neighbor[0] - goal_row) + abs(neighbor[1] - goal_col)
+                    heapq.heappush(open_heap, (new_cost + heuristic, counter, new_cost, neighbor))
+                    counter += 1
+
+        return []
+
+    def update_target(self, x, z):
+        """
+        Atualiza o alvo do campo de fluxo para a posição dada.
+
+        O BFS só é refeito quando a posição cai em uma célula diferente, na
+        próxima consulta ao campo; enquanto nenhum inimigo persegue o
+        jogador, o campo não é calculado.
+
+        Args:
+            x: Coordenada X do alvo (normalmente o jogador)
+            z: Coordenada Z do alvo
+
+        Returns:
+            bool: True se o alvo mudou de célula
+        """
+        cell = self.world_to_cell(x, z)
+        if cell == self.target_cell:
+            return False
+        self.target_cell = cell
+        return True
+
+    def _ensure_flow_field(self):
+        """Calcula o campo de fluxo do alvo atual, se ainda não foi calculado."""
+        if self.target_cell is not None and self._field_cell != self.target_cell:
+            self._compute_flow_field(self.target_cell)
+            self._field_cell = self.target_cell
+
+    def _compute_flow_field(self, target):
+        """Calcula distâncias por BFS e a próxima célula de cada célula."""
+        distance = np.full((self.rows, self.cols), -1, dtype=np.int32)
+
+        if self.is_walkable(*target):
+            distance[target] = 0
+            queue = deque([target])
+            while queue:
+                row, col = queue.popleft()
+                next_distance = distance[row, col] + 1
+                for dr, dc in NEIGHBORS:
+                    r, c = row + dr, col + dc
+                    if (0 <= r < self.rows and 0 <= c < self.cols and
+                            self.walkable[r, c] and distance[r, c] < 0):
+                        distance[r, c] = next_distance
+                        queue.append((r, c))
+
+        # Próxima célula: vizinho com distância exatamente uma unidade menor
+        rows, cols = np.indices((self.rows, self.cols))
+        next_row = rows.copy()
+        next_col = cols.copy()
+        padded = np.pad(distance, 1, constant_values=-1)
+        unresolved = distance > 0
+        for dr, dc in NEIGHBORS:
+            neighbor_distance = padded[1 + dr:1 + dr + self.rows, 1 + dc:1 + dc + self.cols]
+            step = unresolved & (neighbor_distance == distance - 1)
+            next_row[step] = rows[step] + dr
+            next_col[step] = cols[step] + dc
+            unresolved &= ~step
+
+        self.distance = distance
+        self.next_row = next_row
+        self.next_col = next_col
+
+    def next_waypoint(self, x, z):
+        """
+        Obtém o próximo ponto de passagem em direção ao alvo do campo de fluxo.
+
+        Args:
+            x: Coordenada X de quem está se movendo
+            z: Coordenada Z de quem está se movendo
+
+        Returns:
+            tuple: Posição (x, z) do centro da próxima célula, ou None se a
+            posição estiver fora do campo, inalcançável ou na célula do alvo
+        """
+        self._ensure_flow_field()
+        if self.distance is None:
+            return None
+
+        row, col = self.world_to_cell(x, z)
+        if not (0 <= row < self.rows and 0 <= col < self.cols) or self.distance[row, col] <= 0:
+            return None
+        return self.cell_to_world(self.next_row[row, col], self.next_col[row, col])
+
+    def next_waypoints(self, xs, zs):
+        """
+        Versão vetorizada de next_waypoint para muitas posições.
+
+        Args:
+            xs: Array NumPy de coordenadas X
+            zs: Array NumPy de coordenadas Z
+
+        Returns:
+            tuple: (waypoint_x, waypoint_z, valid) onde valid indica as posições
+            com um próximo ponto de passagem definido
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        zs = np.asarray(zs, dtype=np.float64)
+        waypoint_x = xs.copy()
+        waypoint_z = zs.copy()
+        self._ensure_flow_field()
+        if self.distance is None:
+            return waypoint_x, waypoint_z, np.zeros(xs.shape, dtype=bool)
+
+        cols = np.floor(xs / self.cell_size + self.cols / 2 + 0.5).astype(np.int64)
+        rows = np.floor(zs / self.cell_size + self.rows / 2 + 0.5).astype(np.int64)
+        valid = (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+        valid[valid] = self.distance[rows[valid], cols[valid]] > 0
+
+        next_rows = self.next_row[rows[valid], cols[valid]]
+        next_cols = self.next_col[rows[valid], cols[valid]]
+        waypoint_x[valid] = (next_cols - self.cols / 2) * self.cell_size
+        waypoint_z[valid] = (next_rows - self.rows / 2) * self.cell_size
+        return waypoint_x, waypoint_z, valid
+
+    def distance_to_target(self, x, z):
+        """
+        Obtém a distância em células até o alvo do campo de fluxo.
+
+        Returns:
+            int: Número de passos, ou -1 se inalcançável ou sem campo
+        """
+        self._ensure_flow_field()
+        row, col = self.world_to_cell(x, z)
+        if self.distance is None or not (0 <= row < self.rows and 0 <= col < self.cols):
+            return -1
+        return int(self.distance[row, col])
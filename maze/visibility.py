@@ -0,0 +1,329 @@
+"""
+Tabela de visibilidade célula a célula para a grade do labirinto.
+
+Para cada célula transitável, guarda um bit por deslocamento dentro de uma
+janela de raio fixo indicando se a linha entre os centros das duas células
+atravessa apenas células transitáveis. A linha é percorrida com DDA em modo
+"supercover" (ao passar exatamente por um vértice, as duas células vizinhas
+são consideradas), então não se enxerga por frestas diagonais entre paredes.
+
+Com REGION_SAMPLES, as linhas partem de vários pontos de cada célula em vez
+do centro, e a tabela passa a ser um conjunto potencialmente visível (PVS)
+usado para descartar geometria na renderização.
+
+Consultas são uma leitura de bit em tempo constante. A tabela pode ser salva
+em disco, indexada pelo hash do layout do labirinto.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+import hashlib
+import math
+import os
+import numpy as np
+
+
+# Símbolos transitáveis, os mesmos de MazeFramework.is_walkable
+WALKABLE_CELLS = ('.', ' ', 'S', 'E')
+
+# Versão do formato em disco (mudar invalida caches antigos)
+CACHE_VERSION = 1
+
+
+# Pontos de amostragem dentro de uma célula, em frações do seu lado.
+# CENTER_SAMPLES liga apenas os centros; REGION_SAMPLES cobre a célula até
+# perto das bordas, para visibilidade conservadora entre regiões (PVS).
+CENTER_SAMPLES = (Fraction(1, 2),)
+REGION_SAMPLES = (Fraction(1, 32), Fraction(1, 3), Fraction(2, 3), Fraction(31, 32))
+
+
+def _traverse(d_row, d_col, start_row, start_col, end_row, end_col, scale):
+    """
+    DDA supercover em coordenadas inteiras (unidades de 1/scale de célula).
+
+    Returns:
+        list: Células intermediárias cruzadas, sem incluir as extremidades
+    """
+    span_row = d_row * scale + end_row - start_row
+    span_col = d_col * scale + end_col - start_col
+    step_row = (span_row > 0) - (span_row < 0)
+    step_col = (span_col > 0) - (span_col < 0)
+    # Distância até a próxima fronteira em cada eixo; o parâmetro t de cada
+    # fronteira é distância / |span|, comparado por multiplicação cruzada
+    to_row = start_row if step_row < 0 else scale - start_row
+    to_col = start_col if step_col < 0 else scale - start_col
+    abs_row = abs(span_row)
+    abs_col = abs(span_col)
+
+    row = col = 0
+    cells = []
+    while (row, col) != (d_row, d_col):
+        t_row = to_row * abs_col
+        t_col = to_col * abs_row
+        if not span_col or (span_row and t_row < t_col):
+            row += step_row
+            to_row += scale
+        elif not span_row or t_col < t_row:
+            col += step_col
+            to_col += scale
+        else:
+            # Passa exatamente por um vértice: inclui as duas células vizinhas
+            cells.append((row + step_row, col))
+            cells.append((row, col + step_col))
+            row += step_row
+            col += step_col
+            to_row += scale
+            to_col += scale
+        cells.append((row, col))
+
+    return [cell for cell in cells if cell != (d_row, d_col)]
+
+
+def _to_integers(values):
+    """Converte frações para inteiros sobre um denominador comum."""
+    scale = math.lcm(*(Fraction(v).denominator for v in values))
+    return [int(Fraction(v) * scale) for v in values], scale
+
+
+def line_cells(d_row, d_col, start=(Fraction(1, 2), Fraction(1, 2)), end=(Fraction(1, 2), Fraction(1, 2))):
+    """
+    Células intermediárias cruzadas pela linha entre um ponto da célula
+    (0, 0) e um ponto da célula (d_row, d_col), usando DDA supercover com
+    aritmética exata.
+
+    Args:
+        d_row: Deslocamento em linhas da célula final
+        d_col: Deslocamento em colunas da célula final
+        start: Ponto (linha, coluna) dentro da célula inicial, em frações de célula
+        end: Ponto (linha, coluna) dentro da célula final, em frações de célula
+
+    Returns:
+        list: Deslocamentos (linha, coluna), sem incluir as extremidades
+    """
+    (start_row, start_col, end_row, end_col), scale = _to_integers((*start, *end))
+    return _traverse(d_row, d_col, start_row, start_col, end_row, end_col, scale)
+
+
+@lru_cache(maxsize=None)
+def offset_patterns(radius, samples=CENTER_SAMPLES):
+    """
+    Conjuntos de células intermediárias que podem ligar duas células para
+    cada deslocamento da janela, considerando todos os pares de pontos de
+    amostragem. O resultado depende apenas do raio e das amostras, não do
+    labirinto, e fica em cache.
+
+    Returns:
+        dict: (d_row, d_col) -> tupla de conjuntos de deslocamentos; as
+        células são visíveis se todas as células de algum conjunto forem livres
+    """
+    values, scale = _to_integers(samples)
+    points = [(r, c) for r in values for c in values]
+    # Amostras simétricas (s e 1 - s) permitem espelhar o primeiro quadrante
+    symmetric = sorted(values) == sorted(scale - v for v in values)
+
+    patterns = {}
+    for d_row in range(-radius, radius + 1):
+        for d_col in range(-radius, radius + 1):
+            if symmetric and (d_row < 0 or d_col < 0):
+                continue
+            found = set()
+            for start in points:
+                for end in points:
+                    found.add(frozenset(_traverse(d_row, d_col, *start, *end, scale)))
+            # Um conjunto que contém outro nunca muda o resultado
+            minimal = [p for p in found if not any(q < p for q in found)]
+            patterns[(d_row, d_col)] = tuple(sorted(minimal, key=len))
+
+    if symmetric:
+        for (d_row, d_col), found in list(patterns.items()):
+            for sign_row in (-1, 1):
+                for sign_col in (-1, 1):
+                    patterns[(d_row * sign_row, d_col * sign_col)] = tuple(
+                        frozenset((r * sign_row, c * sign_col) for r, c in pattern)
+                        for pattern in found
+                    )
+    return patterns
+
+
+class VisibilityTable:
+    """Visibilidade pré-calculada entre células próximas do labirinto."""
+
+    CACHE_DIR = ".cache/visibility"
+
+    def __init__(self, bits, radius, cell_size=5.0):
+        """
+        Inicializa a tabela a partir de bits já calculados.
+
+        Args:
+            bits: Array uint8 (ceil(K / 8), linhas, colunas) de bits empacotados,
+                  onde K = (2 * radius + 1) ** 2 deslocamentos
+            radius: Raio da janela em células
+            cell_size: Tamanho de cada célula da grade
+        """
+        self.bits = bits
+        self.radius = radius
+        self.window = 2 * radius + 1
+        self.cell_size = cell_size
+        self.rows = bits.shape[1]
+        self.cols = bits.shape[2]
+
+    @staticmethod
+    def layout_hash(grid, radius, samples=CENTER_SAMPLES):
+        """Calcula o hash que identifica o layout, o raio e as amostras da tabela."""
+        layout = "\n".join("".join(row) for row in grid)
+        sample_key = ",".join(str(sample) for sample in samples)
+        key = f"{CACHE_VERSION}:{radius}:{sample_key}:{layout}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def build(cls, grid, radius, cell_size=5.0, samples=CENTER_SAMPLES):
+        """
+        Calcula a tabela de visibilidade para a grade.
+
+        Cada deslocamento é avaliado para todas as células de uma vez,
+        deslocando a máscara de células transitáveis.
+
+        Args:
+            grid: Lista 2D de caracteres do labirinto
+            radius: Raio da janela em células
+            cell_size: Tamanho de cada célula da grade
+            samples: Pontos de amostragem das linhas dentro de cada célula
+
+        Returns:
+            VisibilityTable: Nova tabela
+        """
+        rows = len(grid)
+        cols = len(grid[0]) if grid else 0
+        walkable = np.array(
+            [[cell in WALKABLE_CELLS for cell in row] for row in grid], dtype=bool
+        ).reshape(rows, cols)
+
+        # Máscara com borda de paredes para deslocamentos fora da grade
+        padded = np.zeros((rows + 2 * radius, cols + 2 * radius), dtype=bool)
+        padded[radius:radius + rows, radius:radius + cols] = walkable
+
+        def shifted(d_row, d_col):
+            return padded[radius + d_row:radius + d_row + rows, radius + d_col:radius + d_col + cols]
+
+        window = 2 * radius + 1
+        visible = np.zeros((window * window, rows, cols), dtype=bool)
+        for (d_row, d_col), patterns in offset_patterns(radius, tuple(samples)).items():
+            endpoints = walkable & shifted(d_row, d_col)
+            mask = np.zeros((rows, cols), dtype=bool)
+            for pattern in patterns:
+                clear = endpoints.copy()
+                for mid_row, mid_col in pattern:
+                    clear &= shifted(mid_row, mid_col)
+                mask |= clear
+            visible[(d_row + radius) * window + (d_col + radius)] = mask
+
+        return cls(np.packbits(visible, axis=0), radius, cell_size)
+
+    @classmethod
+    def load_or_build(cls, grid, radius, cell_size=5.0, samples=CENTER_SAMPLES, cache_dir=None,
+                      persist=True):
+        """
+        Carrega a tabela do cache em disco ou a calcula e salva.
+
+        Args:
+            grid: Lista 2D de caracteres do labirinto
+            radius: Raio da janela em células
+            cell_size: Tamanho de cada célula da grade
+            samples: Pontos de amostragem das linhas dentro de cada célula
+            cache_dir: Diretório do cache (padrão CACHE_DIR)
+            persist: Se False, calcula em memória sem ler nem gravar o cache;
+                     para labirintos aleatórios, que nunca se repetem e só
+                     fariam o diretório crescer
+
+        Returns:
+            VisibilityTable: Tabela carregada ou calculada
+        """
+        if not persist:
+            return cls.build(grid, radius, cell_size, samples)
+
+        cache_dir = cache_dir or cls.CACHE_DIR
+        path = os.path.join(cache_dir, cls.layout_hash(grid, radius, samples) + ".npy")
+
+        if os.path.exists(path):
+            try:
+                return cls(np.load(path), radius, cell_size)
+            except Exception as e:
+                print(f"Could not load visibility cache: {e}")
+
+        table = cls.build(grid, radius, cell_size, samples)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            np.save(path, table.bits)
+        except Exception as e:
+            print(f"Could not save visibility cache: {e}")
+        return table
+
+    def can_see(self, from_row, from_col, to_row, to_col):
+        """
+        Verifica se há linha de visão entre duas células.
+
+        Returns:
+            bool: True se visível; False se bloqueado, fora da grade ou além do raio
+        """
+        d_row = to_row - from_row
+        d_col = to_col - from_col
+        if (abs(d_row) > self.radius or abs(d_col) > self.radius or
+                not (0 <= from_row < self.rows and 0 <= from_col < self.cols)):
+            return False
+        index = (d_row + self.radius) * self.window + (d_col + self.radius)
+        return bool(self.bits[index >> 3, from_row, from_col] & (0x80 >> (index & 7)))
+
+    def visible_cells(self, row, col):
+        """
+        Lista as células visíveis a partir de uma célula.
+
+        Returns:
+            tuple: (linhas, colunas) como arrays NumPy; vazios se a célula
+            estiver fora da grade
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        bits = np.unpackbits(self.bits[:, row, col])[:self.window * self.window]
+        index = np.flatnonzero(bits)
+        rows = row + index // self.window - self.radius
+        cols = col + index % self.window - self.radius
+        return rows, cols
+
+    def world_to_cell(self, x, z):
+        """Converte coordenadas do mundo para a célula da grade."""
+        col = math.floor(x / self.cell_size + self.cols / 2 + 0.5)
+        row = math.floor(z / self.cell_size + self.rows / 2 + 0.5)
+        return row, col
+
+    def can_see_world(self, from_x, from_z, to_x, to_z):
+        """Verifica a linha de visão entre duas posições do mundo."""
+        return self.can_see(*self.world_to_cell(from_x, from_z), *self.world_to_cell(to_x, to_z))
+
+    def can_see_batch(self, from_xs, from_zs, to_x, to_z):
+        """
+        Versão vetorizada de can_see_world para várias origens e um alvo.
+
+        Args:
+            from_xs: Array NumPy de coordenadas X das origens
+            from_zs: Array NumPy de coordenadas Z das origens
+            to_x: Coordenada X do alvo
+            to_z: Coordenada Z do alvo
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde há linha de visão
+        """
+        cols = np.floor(np.asarray(from_xs) / self.cell_size + self.cols / 2 + 0.5).astype(np.int64)
+        rows = np.floor(np.asarray(from_zs) / self.cell_size + self.rows / 2 + 0.5).astype(np.int64)
+        to_row, to_col = self.world_to_cell(to_x, to_z)
+
+        d_row = to_row - rows
+        d_col = to_col - cols
+        valid = ((np.abs(d_row) <= self.radius) & (np.abs(d_col) <= self.radius) &
+                 (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols))
+
+        result = np.zeros(rows.shape, dtype=bool)
+        index = (d_row[valid] + self.radius) * self.window + (d_col[valid] + self.radius)
+        bytes_ = self.bits[index >> 3, rows[valid], cols[valid]]
+        result[valid] = (bytes_ & (0x80 >> (index & 7))) != 0
+        return result
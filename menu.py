@@ -1,8 +1,10 @@
 import pygame
 import os
+from render.text import text_renderer
+from ui_screen import RetainedScreen
 
 
-class Menu:
+class Menu(RetainedScreen):
     """Menu principal do jogo."""
 
     def __init__(self, width=800, height=600):
@@ -13,8 +15,7 @@ class Menu:
             width: Largura da tela
             height: Altura da tela
         """
-        self.width = width
-        self.height = height
+        super().__init__(width, height)
         self.background = None
         self.background_path = "assets/images/menu_background.png"
 
@@ -37,10 +38,9 @@ class Menu:
         self.selected_color = (255, 200, 50)
         self.normal_color = (200, 200, 200)
 
-        # Fontes
-        pygame.font.init()
-        self.title_font = pygame.font.Font(None, 80)
-        self.option_font = pygame.font.Font(None, 60)
+        # Tamanhos de fonte (textos rasterizados uma vez pelo text_renderer)
+        self.title_size = 80
+        self.option_size = 60
 
     def handle_event(self, event):
         """
@@ -91,10 +91,20 @@ class Menu:
         y_spacing = 80
         y = y_start + option_index * y_spacing
 
-        text = self.option_font.render(self.options[option_index], True, self.normal_color)
-        x = self.width // 2 - text.get_width() // 2
+        text_width, text_height = text_renderer.size(self.options[option_index], self.option_size)
+        x = self.width // 2 - text_width // 2
 
-        return pygame.Rect(x, y, text.get_width(), text.get_height())
+        return pygame.Rect(x, y, text_width, text_height)
+
+    def regions(self):
+        """Cada opção (com o indicador de seleção) é redesenhada quando a seleção muda."""
+        regions = {}
+        for i in range(len(self.options)):
+            rect = self._get_option_rect(i)
+            # Inclui o indicador ">" desenhado 50 pixels à esquerda da opção
+            rect.union_ip(pygame.Rect(rect.x - 50, rect.y, 50, rect.height))
+            regions[f'option_{i}'] = (rect, i == self.selected_option)
+        return regions
 
     def render(self, screen):
         """
@@ -110,7 +120,7 @@ class Menu:
             screen.fill(self.bg_color)
 
         # Desenha título
-        title_text = self.title_font.render("DREAMROOMS", True, self.title_color)
+        title_text = text_renderer.render("DREAMROOMS", self.title_size, self.title_color)
         title_x = self.width // 2 - title_text.get_width() // 2
         title_y = self.height // 3
         screen.blit(title_text, (title_x, title_y))
@@ -121,12 +131,12 @@ class Menu:
 
         for i, option in enumerate(self.options):
             color = self.selected_color if i == self.selected_option else self.normal_color
-            text = self.option_font.render(option, True, color)
+            text = text_renderer.render(option, self.option_size, color)
             x = self.width // 2 - text.get_width() // 2
             y = y_start + i * y_spacing
             screen.blit(text, (x, y))
 
             # Desenha indicador de seleção
             if i == self.selected_option:
-                indicator = self.option_font.render(">", True, self.selected_color)
+                indicator = text_renderer.render(">", self.option_size, self.selected_color)
                 screen.blit(indicator, (x - 50, y))
@@ -3,6 +3,7 @@ from .floor import Floor
 from .wall import Wall
 from .ceiling import Ceiling
 from .hallway import Hallway
+from .static_mesh import StaticMesh
 from .framework import PlaceFramework, PlaceElement
 
-__all__ = ['Place', 'Floor', 'Wall', 'Ceiling', 'Hallway', 'PlaceFramework', 'PlaceElement']
+__all__ = ['Place', 'Floor', 'Wall', 'Ceiling', 'Hallway', 'StaticMesh', 'PlaceFramework', 'PlaceElement']
@@ -1,13 +1,15 @@
 from OpenGL.GL import *
 from .framework import PlaceElement
-import pygame
-import os
+from render.texture_cache import texture_cache
+from render.gl_state import gl_state
+from light.shader_lighting import shader_lighting
+import math
 
 
 class Ceiling(PlaceElement):
     TEXTURE_PATH = "assets/textures/ceiling.png"
 
-    def __init__(self, x=0.0, y=3.0, z=0.0, width=5.0, depth=0.2):
+    def __init__(self, x=0.0, y=3.0, z=0.0, width=5.0, depth=0.2, uv_rect=(0.0, 0.0, 1.0, 1.0)):
         """
         Inicializa um teto que pode ser anexado a paredes.
 
@@ -17,40 +19,29 @@ class Ceiling(PlaceElement):
             z: Posição Z (centro do teto)
             width: Largura do teto
             depth: Profundidade do teto
+            uv_rect: Coordenadas de textura (u0, v0, u1, v1) das faces
+                     inferior e superior
         """
         self.x = x
         self.y = y
         self.z = z
         self.width = width
         self.depth = depth
-        self.texture_id = self._load_texture()
-
-    @classmethod
-    def _load_texture(cls):
-        """Carrega textura do teto se existir."""
-        if not os.path.exists(cls.TEXTURE_PATH):
-            return None
-
-        try:
-            texture_surface = pygame.image.load(cls.TEXTURE_PATH)
-            texture_surface = texture_surface.convert_alpha()
-
-            # Inverte textura verticalmente para OpenGL
-            texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
-            width = texture_surface.get_width()
-            height = texture_surface.get_height()
-
-            texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-            return texture_id
-        except Exception as e:
-            print(f"Could not load ceiling texture: {e}")
-            return None
+        self.uv_rect = uv_rect
+        self.texture_id = None  # Obtida em upload()
+        self._texture_loaded = False
+
+    def upload(self):
+        """Obtém a textura do teto do cache compartilhado."""
+        if not self._texture_loaded:
+            self.texture_id = shader_lighting.acquire_texture(self.TEXTURE_PATH)
+            self._texture_loaded = True
+
+    def release(self):
+        """Libera a referência à textura do teto."""
+        texture_cache.release(self.texture_id)
+        self.texture_id = None
+        self._texture_loaded = False
 
     @classmethod
     def from_wall(cls, wall, depth=5.0):
@@ -77,6 +68,57 @@ class Ceiling(PlaceElement):
             depth=depth
         )
 
+    def split(self, chunk_size, origin_x, origin_z):
+        """
+        Divide o teto em pedaços alinhados a uma grade de blocos, cada um
+        com a parte correspondente da textura, para frustum culling.
+
+        Args:
+            chunk_size: Lado de cada bloco da grade
+            origin_x: Coordenada X do canto da grade de blocos
+            origin_z: Coordenada Z do canto da grade de blocos
+
+        Returns:
+            list: Pedaços de Ceiling que cobrem o teto inteiro
+        """
+        min_x = self.x - self.width / 2
+        min_z = self.z - self.depth / 2
+        max_x = min_x + self.width
+        max_z = min_z + self.depth
+        u0, v0, u1, v1 = self.uv_rect
+
+        def edges(low, high, origin):
+            first = math.floor((low - origin) / chunk_size) + 1
+            inner = [origin + i * chunk_size for i in range(first, math.ceil((high - origin) / chunk_size))]
+            return [low] + inner + [high]
+
+        # Interpola as coordenadas de textura do teto inteiro
+        def u(x):
+            return u0 + (u1 - u0) * (x - min_x) / self.width
+
+        def v(z):
+            return v0 + (v1 - v0) * (z - min_z) / self.depth
+
+        pieces = []
+        z_edges = edges(min_z, max_z, origin_z)
+        x_edges = edges(min_x, max_x, origin_x)
+        for piece_min_z, piece_max_z in zip(z_edges, z_edges[1:]):
+            for piece_min_x, piece_max_x in zip(x_edges, x_edges[1:]):
+                pieces.append(Ceiling(
+                    x=(piece_min_x + piece_max_x) / 2,
+                    y=self.y,
+                    z=(piece_min_z + piece_max_z) / 2,
+                    width=piece_max_x - piece_min_x,
+                    depth=piece_max_z - piece_min_z,
+                    uv_rect=(u(piece_min_x), v(piece_min_z), u(piece_max_x), v(piece_max_z))
+                ))
+        return pieces
+
+    def get_render_bounds(self):
+        """Obtém a caixa que envolve o teto e sua espessura."""
+        return (self.x - self.width / 2, self.y, self.z - self.depth / 2,
+                self.x + self.width / 2, self.y + 0.1, self.z + self.depth / 2)
+
     def render(self):
         """Renderiza o teto como um plano horizontal."""
         glPushMatrix()
@@ -84,43 +126,45 @@ class Ceiling(PlaceElement):
         half_width = self.width / 2
         half_depth = self.depth / 2
 
-        if self.texture_id:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        textured = shader_lighting.bind_texture(self.texture_id, self.TEXTURE_PATH)
+        if textured:
+            gl_state.enable(GL_TEXTURE_2D)
             glColor3f(1.0, 1.0, 1.0)  # Branco para mostrar textura como está
         else:
             glColor3f(0.7, 0.5, 0.3)  # Cor do teto (mais claro que a parede)
 
+        u0, v0, u1, v1 = self.uv_rect
+
         glBegin(GL_QUADS)
 
         # Face inferior (visível de baixo) - normal apontando para baixo
         glNormal3f(0.0, -1.0, 0.0)
-        if self.texture_id:
-            glTexCoord2f(0, 0)
+        if textured:
+            glTexCoord2f(u0, v0)
         glVertex3f(self.x - half_width, self.y, self.z - half_depth)
-        if self.texture_id:
-            glTexCoord2f(1, 0)
+        if textured:
+            glTexCoord2f(u1, v0)
         glVertex3f(self.x + half_width, self.y, self.z - half_depth)
-        if self.texture_id:
-            glTexCoord2f(1, 1)
+        if textured:
+            glTexCoord2f(u1, v1)
         glVertex3f(self.x + half_width, self.y, self.z + half_depth)
-        if self.texture_id:
-            glTexCoord2f(0, 1)
+        if textured:
+            glTexCoord2f(u0, v1)
         glVertex3f(self.x - half_width, self.y, self.z + half_depth)
 
         # Face superior - normal apontando para cima
         glNormal3f(0.0, 1.0, 0.0)
-        if self.texture_id:
-            glTexCoord2f(0, 0)
+        if textured:
+            glTexCoord2f(u0, v0)
         glVertex3f(self.x - half_width, self.y + 0.1, self.z - half_depth)
-        if self.texture_id:
-            glTexCoord2f(0, 1)
+        if textured:
+            glTexCoord2f(u0, v1)
         glVertex3f(self.x - half_width, self.y + 0.1, self.z + half_depth)
-        if self.texture_id:
-            glTexCoord2f(1, 1)
+        if textured:
+            glTexCoord2f(u1, v1)
         glVertex3f(self.x + half_width, self.y + 0.1, self.z + half_depth)
-        if self.texture_id:
-            glTexCoord2f(1, 0)
+        if textured:
+            glTexCoord2f(u1, v0)
         glVertex3f(self.x + half_width, self.y + 0.1, self.z - half_depth)
 
         glEnd()
@@ -130,67 +174,68 @@ class Ceiling(PlaceElement):
 
         # Borda frontal - normal apontando para +Z
         glNormal3f(0.0, 0.0, 1.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, self.y, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, self.y, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.y + 0.1, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.y + 0.1, self.z + half_depth)
 
         # Borda traseira - normal apontando para -Z
         glNormal3f(0.0, 0.0, -1.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, self.y, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.y + 0.1, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.y + 0.1, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, self.y, self.z - half_depth)
 
         # Borda esquerda - normal apontando para -X
         glNormal3f(-1.0, 0.0, 0.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, self.y, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x - half_width, self.y, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x - half_width, self.y + 0.1, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.y + 0.1, self.z - half_depth)
 
         # Borda direita - normal apontando para +X
         glNormal3f(1.0, 0.0, 0.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x + half_width, self.y, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x + half_width, self.y + 0.1, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.y + 0.1, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, self.y, self.z + half_depth)
 
         glEnd()
 
-        if self.texture_id:
-            glDisable(GL_TEXTURE_2D)
+        if textured:
+            gl_state.disable(GL_TEXTURE_2D)
+            shader_lighting.set_texturing(False)
 
         glPopMatrix()
@@ -1,81 +1,111 @@
 from OpenGL.GL import *
 from .framework import PlaceElement
-import pygame
-import os
+from render.texture_cache import texture_cache
+from render.gl_state import gl_state
+from light.shader_lighting import shader_lighting
 
 
 class Floor(PlaceElement):
     TEXTURE_PATH = "assets/textures/floor.png"
 
-    def __init__(self, size=50.0, tile_size=1.0):
+    def __init__(self, size=50.0, tile_size=1.0, region=None):
         """
         Inicializa uma grade de piso.
 
         Args:
             size: Tamanho total do piso (size x size)
             tile_size: Tamanho de cada bloco da grade
+            region: Retângulo opcional (min_x, min_z, max_x, max_z) do piso a
+                    desenhar; as coordenadas de textura continuam as do piso inteiro
         """
         self.size = size
         self.tile_size = tile_size
+        half_size = size / 2
+        self.region = region or (-half_size, -half_size, half_size, half_size)
+        self.texture_id = None  # Obtida em upload()
+        self._texture_loaded = False
+
+    @classmethod
+    def chunked(cls, size=50.0, tile_size=1.0, chunk_size=40.0):
+        """
+        Divide o piso em pedaços quadrados, cada um um elemento com sua
+        própria caixa para frustum culling.
+
+        Args:
+            size: Tamanho total do piso (size x size)
+            tile_size: Tamanho de cada bloco da grade
+            chunk_size: Lado de cada pedaço
+
+        Returns:
+            list: Pedaços de Floor que cobrem o piso inteiro
+        """
+        half_size = size / 2
+        edges = [-half_size + i * chunk_size for i in range(int(size // chunk_size) + 1)]
+        if edges[-1] < half_size:
+            edges.append(half_size)
+
+        pieces = []
+        for min_z, max_z in zip(edges, edges[1:]):
+            for min_x, max_x in zip(edges, edges[1:]):
+                pieces.append(cls(size, tile_size, region=(min_x, min_z, max_x, max_z)))
+        return pieces
+
+    def get_render_bounds(self):
+        """Obtém a caixa do retângulo de piso desenhado."""
+        min_x, min_z, max_x, max_z = self.region
+        return (min_x, 0.0, min_z, max_x, 0.0, max_z)
+
+    def upload(self):
+        """Obtém a textura do piso do cache compartilhado."""
+        if not self._texture_loaded:
+            self.texture_id = shader_lighting.acquire_texture(self.TEXTURE_PATH)
+            self._texture_loaded = True
+
+    def release(self):
+        """Libera a referência à textura do piso."""
+        texture_cache.release(self.texture_id)
         self.texture_id = None
-        self._load_texture()
-
-    def _load_texture(self):
-        """Carrega a textura do piso se ela existir."""
-        if not os.path.exists(self.TEXTURE_PATH):
-            return
-
-        try:
-            texture_surface = pygame.image.load(self.TEXTURE_PATH)
-            texture_surface = texture_surface.convert_alpha()
-
-            # Inverte a textura verticalmente para o OpenGL
-            texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
-            width = texture_surface.get_width()
-            height = texture_surface.get_height()
-
-            self.texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-        except Exception as e:
-            print(f"Could not load floor texture: {e}")
-            self.texture_id = None
+        self._texture_loaded = False
 
     def render(self):
         """Renderiza o piso como uma grade."""
         glPushMatrix()
 
-        # Desenha a superfície principal do piso
+        # Desenha a superfície principal do piso (ou o pedaço dela em region)
         half_size = self.size / 2
+        min_x, min_z, max_x, max_z = self.region
+
+        if shader_lighting.bind_texture(self.texture_id, self.TEXTURE_PATH):
+            # Coordenadas de textura medidas a partir do canto do piso inteiro,
+            # para que pedaços vizinhos continuem a mesma repetição
+            u0 = (min_x + half_size) / self.tile_size
+            u1 = (max_x + half_size) / self.tile_size
+            v0 = (min_z + half_size) / self.tile_size
+            v1 = (max_z + half_size) / self.tile_size
 
-        if self.texture_id:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
+            gl_state.enable(GL_TEXTURE_2D)
             glColor3f(1.0, 1.0, 1.0)  # Branco para mostrar a textura como está
             glBegin(GL_QUADS)
             glNormal3f(0.0, 1.0, 0.0)  # Normal apontando para cima para iluminação adequada
-            glTexCoord2f(0, 0)
-            glVertex3f(-half_size, 0, -half_size)
-            glTexCoord2f(self.size / self.tile_size, 0)
-            glVertex3f(half_size, 0, -half_size)
-            glTexCoord2f(self.size / self.tile_size, self.size / self.tile_size)
-            glVertex3f(half_size, 0, half_size)
-            glTexCoord2f(0, self.size / self.tile_size)
-            glVertex3f(-half_size, 0, half_size)
+            glTexCoord2f(u0, v0)
+            glVertex3f(min_x, 0, min_z)
+            glTexCoord2f(u1, v0)
+            glVertex3f(max_x, 0, min_z)
+            glTexCoord2f(u1, v1)
+            glVertex3f(max_x, 0, max_z)
+            glTexCoord2f(u0, v1)
+            glVertex3f(min_x, 0, max_z)
             glEnd()
-            glDisable(GL_TEXTURE_2D)
+            gl_state.disable(GL_TEXTURE_2D)
+            shader_lighting.set_texturing(False)
         else:
             glBegin(GL_QUADS)
             glColor3f(0.3, 0.3, 0.3)  # Piso cinza escuro
             glNormal3f(0.0, 1.0, 0.0)  # Normal apontando para cima para iluminação adequada
-            glVertex3f(-half_size, 0, -half_size)
-            glVertex3f(half_size, 0, -half_size)
-            glVertex3f(half_size, 0, half_size)
-            glVertex3f(-half_size, 0, half_size)
+            glVertex3f(min_x, 0, min_z)
+            glVertex3f(max_x, 0, min_z)
+            glVertex3f(max_x, 0, max_z)
+            glVertex3f(min_x, 0, max_z)
             glEnd()
 
         glPopMatrix()
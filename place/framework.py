@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from collision.framework import CollisionFramework, Collidable
+import numpy as np
 
 
 class PlaceElement(ABC):
@@ -10,14 +11,60 @@ class PlaceElement(ABC):
         """Renderiza este elemento de cenário."""
         pass
 
+    def upload(self):
+        """
+        Cria os recursos de GPU do elemento (texturas, buffers).
+
+        Chamado na thread do OpenGL antes do primeiro desenho; o construtor
+        não toca no OpenGL, para que o cenário possa ser montado em outra thread.
+        """
+        pass
+
+    def release(self):
+        """Libera recursos de GPU do elemento (texturas, buffers)."""
+        pass
+
+    def set_view(self, x, z):
+        """
+        Informa a posição do observador antes da renderização.
+
+        Elementos com culling usam a posição para decidir o que desenhar.
+
+        Args:
+            x: Coordenada X do observador, ou None para desenhar tudo
+            z: Coordenada Z do observador, ou None para desenhar tudo
+        """
+        pass
+
+    def get_render_bounds(self):
+        """
+        Obtém a caixa que envolve a geometria desenhada, para frustum culling.
+
+        Returns:
+            tuple: (min_x, min_y, min_z, max_x, max_y, max_z), ou None se o
+            elemento deve ser sempre desenhado
+        """
+        return None
+
 
 class PlaceFramework:
     """Framework para gerenciar e renderizar elementos de cenário."""
 
-    def __init__(self):
-        """Inicializa o framework de cenário."""
+    def __init__(self, cell_size=5.0):
+        """
+        Inicializa o framework de cenário.
+
+        Args:
+            cell_size: Tamanho da célula da grade espacial de colisão
+        """
         self.elements = []
-        self.collision_framework = CollisionFramework()
+        self.collision_framework = CollisionFramework(cell_size=cell_size)
+
+        # Frustum culling por elemento
+        self.frustum = None
+        self._bounds = None  # (mins, maxs, sempre visível) em cache, refeito quando a lista muda
+        self.drawn_elements = 0  # Elementos desenhados no último quadro
+        self.uploaded = 0  # Elementos (do início da lista) com recursos na GPU
 
     def add_element(self, element):
         """
@@ -29,6 +76,7 @@ class PlaceFramework:
         if not isinstance(element, PlaceElement):
             raise TypeError("Element must inherit from PlaceElement")
         self.elements.append(element)
+        self._bounds = None
 
         # Se o elemento também é colidível, adiciona ao framework de colisão
         if isinstance(element, Collidable):
@@ -42,16 +90,99 @@ class PlaceFramework:
             element: O elemento a ser removido
         """
         if element in self.elements:
+            if self.elements.index(element) < self.uploaded:
+                self.uploaded -= 1
             self.elements.remove(element)
+            self._bounds = None
 
         # Se o elemento é colidível, remove do framework de colisão
         if isinstance(element, Collidable):
             self.collision_framework.remove_collidable(element)
 
+    def add_collidable(self, collidable):
+        """
+        Adiciona um objeto apenas ao sistema de colisão, sem renderizá-lo.
+
+        Usado por paredes cuja geometria é desenhada por uma malha estática.
+
+        Args:
+            collidable: Uma instância de Collidable para adicionar
+        """
+        self.collision_framework.add_collidable(collidable)
+
+    def remove_collidable(self, collidable):
+        """
+        Remove um objeto apenas do sistema de colisão.
+
+        Args:
+            collidable: O colidível a remover
+        """
+        self.collision_framework.remove_collidable(collidable)
+
+    def set_view(self, x, z, frustum=None):
+        """
+        Informa a posição do observador a todos os elementos.
+
+        Args:
+            x: Coordenada X do observador, ou None para desabilitar o culling
+            z: Coordenada Z do observador, ou None para desabilitar o culling
+            frustum: Frustum opcional da câmera; elementos cuja caixa está
+                     inteiramente fora dele não são desenhados
+        """
+        self.frustum = frustum
+        for element in self.elements:
+            element.set_view(x, z)
+
+    def _element_bounds(self):
+        """Monta (em cache) os arrays de caixas dos elementos."""
+        if self._bounds is None:
+            count = len(self.elements)
+            mins = np.zeros((count, 3))
+            maxs = np.zeros((count, 3))
+            always = np.zeros(count, dtype=bool)
+            for i, element in enumerate(self.elements):
+                bounds = element.get_render_bounds()
+                if bounds is None:
+                    always[i] = True
+                else:
+                    mins[i] = bounds[:3]
+                    maxs[i] = bounds[3:]
+            self._bounds = (mins, maxs, always)
+        return self._bounds
+
+    def upload_steps(self):
+        """
+        Envia os recursos de GPU dos elementos pendentes, um por vez.
+
+        Yields:
+            tuple: (elementos enviados, total de elementos) após cada elemento
+        """
+        while self.uploaded < len(self.elements):
+            self.elements[self.uploaded].upload()
+            self.uploaded += 1
+            yield self.uploaded, len(self.elements)
+
     def render(self):
-        """Renderiza todos os elementos do cenário."""
+        """Renderiza os elementos do cenário que podem estar no frustum."""
+        # Elementos ainda não enviados (sem tela de carregamento) são enviados agora
+        for _ in self.upload_steps():
+            pass
+
+        if self.frustum is None:
+            visible = np.ones(len(self.elements), dtype=bool)
+        else:
+            mins, maxs, always = self._element_bounds()
+            visible = always | self.frustum.intersects_boxes(mins, maxs)
+
+        self.drawn_elements = int(np.count_nonzero(visible))
+        for element, shown in zip(self.elements, visible):
+            if shown:
+                element.render()
+
+    def release(self):
+        """Libera os recursos de GPU de todos os elementos do cenário."""
         for element in self.elements:
-            element.render()
+            element.release()
 
     def check_collision(self, x, z, radius=0.5):
         """
@@ -66,3 +197,32 @@ class PlaceFramework:
             bool: True se colisão detectada, False caso contrário
         """
         return self.collision_framework.check_collision(x, z, radius)
+
+    def check_collision_batch(self, xs, zs, radius=0.5):
+        """
+        Verifica várias posições de uma vez contra os elementos do cenário.
+
+        Args:
+            xs: Sequência ou array de coordenadas X
+            zs: Sequência ou array de coordenadas Z
+            radius: Raio de colisão (escalar ou array)
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde há colisão
+        """
+        return self.collision_framework.check_collision_batch(xs, zs, radius)
+
+    def raycast(self, origin, direction, max_distance, radius=0.0):
+        """
+        Lança um raio no plano XZ contra os elementos do cenário.
+
+        Args:
+            origin: Origem (x, z) do raio
+            direction: Direção (x, z) do raio
+            max_distance: Distância máxima do raio
+            radius: Raio do círculo que percorre o raio
+
+        Returns:
+            tuple: (distância, (nx, nz)) do impacto mais próximo, ou None
+        """
+        return self.collision_framework.raycast(origin, direction, max_distance, radius)
@@ -2,41 +2,87 @@ from .framework import PlaceFramework
 from .floor import Floor
 from .outside import Outside
 from maze.generator import MazeGenerator
+from maze.pathfinding import Pathfinder
+from maze.visibility import VisibilityTable, REGION_SAMPLES
+from light.lighting_config import LightingConfig
+from render.sprite_batch import sprite_batch
 from player.player_enemy import PlayerEnemy
+from player.enemy_swarm import EnemySwarm
 from spawn.spawn import spawn_at_grid_center
 from config import game_config
+import math
 import random
 
 
 class Place:
-    def __init__(self):
-        """Inicializa o cenário/ambiente usando o framework."""
-        self.framework = PlaceFramework()
+    CHUNK_CELLS = 8  # Lado dos blocos de geometria estática, em células
 
+    def __init__(self, headless=False):
+        """
+        Inicializa o cenário/ambiente usando o framework.
+
+        Args:
+            headless: Se True, monta apenas o que a simulação usa (colisão,
+                      campo de fluxo, linha de visão e inimigos), sem geometria,
+                      texturas nem caches em disco; ver headless.py
+        """
         # Gera e adiciona um labirinto aleatório usando o tamanho da configuração
         from maze.maze import Maze
         maze_grid = Maze.generate(size=game_config.maze_size)  # tamanho da configuração (1-10)
         cell_size = 5.0
         self.cell_size = cell_size
+        self.maze_grid = maze_grid
+
+        # Grade de colisão alinhada às células do labirinto
+        self.framework = PlaceFramework(cell_size=cell_size)
 
         # Calcula o tamanho do piso para corresponder exatamente às dimensões do labirinto
         maze_rows = len(maze_grid)
         maze_cols = len(maze_grid[0]) if maze_grid else 0
         floor_size = max(maze_rows, maze_cols) * cell_size
 
-        # Adiciona ambiente externo (grama, céu, paredes)
-        self.outside = Outside(maze_size=floor_size)
-        self.framework.add_element(self.outside)
-
-        # Adiciona o piso ao cenário
-        floor = Floor(size=floor_size, tile_size=cell_size)
-        self.framework.add_element(floor)
-
         maze = Maze.build(maze_grid, cell_size=cell_size, wall_height=3.0)
-        self.start_pos, self.end_pos = maze.add_to_framework(self.framework)
+        if headless:
+            # Só a grade de colisão; nada é desenhado
+            self.pvs = None
+            self.outside = None
+            self.start_pos, self.end_pos = maze.add_to_framework(self.framework, geometry=False)
+        else:
+            # Conjunto potencialmente visível (PVS) de cada célula, limitado ao
+            # alcance da neblina: só o que pode aparecer na tela é desenhado
+            cull_distance = LightingConfig.fog_cull_distance()
+            pvs_radius = int(cull_distance // cell_size) + 1
+            # (em memória, como a linha de visão abaixo: o labirinto é aleatório)
+            self.pvs = VisibilityTable.load_or_build(maze_grid, pvs_radius, cell_size,
+                                                     samples=REGION_SAMPLES, persist=False)
+
+            # Adiciona ambiente externo (grama, céu, paredes)
+            self.outside = Outside(maze_size=floor_size, cull_distance=cull_distance)
+            self.framework.add_element(self.outside)
+
+            # Adiciona o piso ao cenário, dividido em blocos para frustum culling
+            for floor in Floor.chunked(size=floor_size, tile_size=cell_size,
+                                       chunk_size=self.CHUNK_CELLS * cell_size):
+                self.framework.add_element(floor)
+
+            self.start_pos, self.end_pos = maze.add_to_framework(self.framework, self.pvs, cull_distance,
+                                                                 chunk_cells=self.CHUNK_CELLS)
+
+        # Triângulos das paredes antes/depois da fusão (None sem geometria)
+        self.mesh_stats = maze.mesh_stats
+
+        # Campo de fluxo compartilhado pelos inimigos para seguir os corredores
+        self.pathfinder = Pathfinder(maze_grid, cell_size)
+
+        # Linha de visão pré-calculada até o alcance de detecção dos inimigos
+        # (sem cache em disco: cada partida gera um labirinto aleatório novo)
+        visibility_radius = math.ceil(EnemySwarm.DETECTION_RANGE / cell_size) + 1
+        self.visibility = VisibilityTable.load_or_build(maze_grid, visibility_radius, cell_size,
+                                                        persist=False)
 
         # Gera inimigo bola simples em um beco sem saída aleatório
         self.player_enemy = None
+        self.enemy_swarm = None
         dead_ends = MazeGenerator.find_dead_ends(maze_grid)
         if dead_ends:
             # Filtra becos sem saída que estão muito próximos do início ou saída
@@ -46,7 +92,11 @@ class Place:
                 if maze_grid[row][col] not in ['S', 'E']:
                     safe_dead_ends.append((row, col))
 
-            if safe_dead_ends:
+            if safe_dead_ends and game_config.enemy_count > 1:
+                # Muitos inimigos: simulação vetorizada em um único EnemySwarm
+                self.enemy_swarm = self._spawn_swarm(safe_dead_ends, game_config.enemy_count,
+                                                     maze_rows, maze_cols, cell_size)
+            elif safe_dead_ends:
                 # Escolhe um beco sem saída seguro aleatório
                 dead_end_row, dead_end_col = random.choice(safe_dead_ends)
 
@@ -68,6 +118,35 @@ class Place:
                 # Debug: Verifica células vizinhas para confirmar que é um beco sem saída
                 print(f"Surrounding cells: N='{maze_grid[dead_end_row-1][dead_end_col]}' S='{maze_grid[dead_end_row+1][dead_end_col]}' W='{maze_grid[dead_end_row][dead_end_col-1]}' E='{maze_grid[dead_end_row][dead_end_col+1]}'")
 
+    @staticmethod
+    def _spawn_swarm(dead_ends, count, maze_rows, maze_cols, cell_size):
+        """
+        Cria um grupo de inimigos distribuídos pelos becos sem saída.
+
+        Args:
+            dead_ends: Lista de células (linha, coluna) de becos sem saída seguros
+            count: Número de inimigos
+            maze_rows: Número de linhas da grade
+            maze_cols: Número de colunas da grade
+            cell_size: Tamanho de cada célula da grade
+
+        Returns:
+            EnemySwarm: Grupo de inimigos
+        """
+        # Usa todos os becos antes de repetir algum
+        cells = random.sample(dead_ends, min(count, len(dead_ends)))
+        cells += random.choices(dead_ends, k=count - len(cells))
+
+        positions = []
+        for row, col in cells:
+            x, _, z = spawn_at_grid_center(row, col, maze_rows, maze_cols, cell_size, y_height=1.5)
+            # Pequeno deslocamento para separar inimigos no mesmo beco
+            jitter = cell_size * 0.2
+            positions.append((x + random.uniform(-jitter, jitter), z + random.uniform(-jitter, jitter)))
+
+        print(f"Enemy swarm of {count} spawned across {len(set(cells))} dead ends")
+        return EnemySwarm(positions, y=1.5)
+
     def update(self, delta_time, player_x, player_z):
         """
         Atualiza elementos do cenário incluindo IA do inimigo.
@@ -75,15 +154,71 @@ class Place:
         Returns:
             bool: True se o jogador foi capturado pelo inimigo, False caso contrário
         """
+        if not self.player_enemy and not self.enemy_swarm:
+            return False
+
+        # Recalcula o campo de fluxo apenas quando o jogador muda de célula
+        self.pathfinder.update_target(player_x, player_z)
+
+        if self.enemy_swarm:
+            return self.enemy_swarm.update(delta_time, player_x, player_z,
+                                           self.framework.check_collision_batch,
+                                           self.pathfinder, self.visibility)
+
+        return self.player_enemy.update(delta_time, player_x, player_z,
+                                        self.framework.check_collision,
+                                        self.pathfinder, self.visibility)
+
+    def upload_steps(self):
+        """
+        Envia à GPU os recursos do cenário e dos inimigos, um elemento por vez,
+        para que a tela de carregamento possa dividir o envio entre quadros.
+
+        Requer o contexto OpenGL (thread principal); o construtor não o usa.
+
+        Yields:
+            tuple: (elementos enviados, total de elementos) após cada elemento
+        """
+        enemies = [enemy for enemy in (self.player_enemy, self.enemy_swarm) if enemy]
+        total = len(self.framework.elements) + len(enemies)
+        for done, _ in self.framework.upload_steps():
+            yield done, total
+        for index, enemy in enumerate(enemies, 1):
+            enemy.upload()
+            yield len(self.framework.elements) + index, total
+
+    def release(self):
+        """Libera texturas e buffers do cenário e dos inimigos."""
+        self.framework.release()
         if self.player_enemy:
-            return self.player_enemy.update(delta_time, player_x, player_z, self.framework.check_collision)
-        return False
+            self.player_enemy.release()
+        if self.enemy_swarm:
+            self.enemy_swarm.release()
+
+    def render(self, view_x=None, view_z=None, frustum=None):
+        """
+        Renderiza todos os elementos do cenário.
 
-    def render(self):
-        """Renderiza todos os elementos do cenário."""
+        Args:
+            view_x: Coordenada X do observador para o culling (None desenha tudo)
+            view_z: Coordenada Z do observador para o culling (None desenha tudo)
+            frustum: Frustum opcional da câmera para descartar blocos fora da tela
+        """
+        self.framework.set_view(view_x, view_z, frustum)
         self.framework.render()
 
-    def render_enemy(self, player_x, player_z):
-        """Renderiza o billboard do inimigo virado para o jogador."""
+    def render_enemy(self, player_x, player_z, alpha=1.0):
+        """
+        Renderiza os billboards dos inimigos virados para o jogador em um único lote.
+
+        Args:
+            player_x: Posição X da câmera
+            player_z: Posição Z da câmera
+            alpha: Fração do próximo passo de simulação já decorrida (interpola os inimigos)
+        """
+        sprite_batch.begin()
         if self.player_enemy:
-            self.player_enemy.render(player_x, player_z)
+            self.player_enemy.add_sprites(sprite_batch, alpha)
+        if self.enemy_swarm:
+            self.enemy_swarm.add_sprites(sprite_batch, alpha)
+        sprite_batch.draw(player_x, player_z)
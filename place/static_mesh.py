@@ -0,0 +1,195 @@
+from OpenGL.GL import *
+from .framework import PlaceElement
+from render.texture_cache import texture_cache
+from render.gl_state import gl_state
+from light.shader_lighting import shader_lighting
+import numpy as np
+
+
+class StaticMesh(PlaceElement):
+    """
+    Malha estática enviada uma vez para um vertex buffer (VBO).
+
+    Substitui centenas de chamadas glBegin/glEnd por uma única chamada de
+    desenho. Os vértices usam o formato intercalado GL_T2F_N3F_V3F.
+    """
+
+    def __init__(self, vertices, texture_path=None, color=(1.0, 1.0, 1.0)):
+        """
+        Inicializa a malha estática.
+
+        Args:
+            vertices: Array float32 (N, 8) no formato GL_T2F_N3F_V3F (quads)
+            texture_path: Caminho opcional da textura aplicada à malha
+            color: Cor usada quando não há textura
+        """
+        self.vertices = np.ascontiguousarray(vertices, dtype=np.float32)
+        self.vertex_count = len(self.vertices)
+        if self.vertex_count:
+            positions = self.vertices[:, 5:8]
+            self.bounds = (*positions.min(axis=0).tolist(), *positions.max(axis=0).tolist())
+        else:
+            self.bounds = None
+        self.color = color
+        self.vbo = None
+        self.texture_path = texture_path
+        self.texture_id = None  # Obtida em upload()
+
+    def upload(self):
+        """Envia os vértices para a GPU e obtém a textura (executado uma única vez)."""
+        if self.vbo is not None:
+            return
+        if self.texture_path:
+            self.texture_id = shader_lighting.acquire_texture(self.texture_path)
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.vertices.nbytes, self.vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def render(self):
+        """Renderiza a malha inteira com uma única chamada de desenho."""
+        if self.vertex_count == 0:
+            return
+
+        if self.vbo is None:
+            self.upload()
+
+        textured = shader_lighting.bind_texture(self.texture_id, self.texture_path)
+        if textured:
+            gl_state.enable(GL_TEXTURE_2D)
+            glColor3f(1.0, 1.0, 1.0)  # Branco para mostrar a textura como está
+        else:
+            glColor3f(*self.color)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glInterleavedArrays(GL_T2F_N3F_V3F, 0, None)
+        self._draw()
+
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        if textured:
+            gl_state.disable(GL_TEXTURE_2D)
+            shader_lighting.set_texturing(False)
+
+    def get_render_bounds(self):
+        """Obtém a caixa que envolve todos os vértices da malha."""
+        return self.bounds
+
+    def _draw(self):
+        """Emite as chamadas de desenho com o buffer já vinculado."""
+        glDrawArrays(GL_QUADS, 0, self.vertex_count)
+
+    def release(self):
+        """Libera o vertex buffer da GPU e a referência à textura."""
+        if self.vbo is not None:
+            glDeleteBuffers(1, [self.vbo])
+            self.vbo = None
+        texture_cache.release(self.texture_id)
+        self.texture_id = None
+
+
+class CellCulledMesh(StaticMesh):
+    """
+    Malha estática cujos quads estão ligados às células do labirinto de onde
+    podem ser vistos.
+
+    A cada quadro, apenas os quads ligados às células visíveis a partir da
+    célula do observador (segundo uma tabela de visibilidade) e dentro da
+    distância de corte da neblina são desenhados, com uma única chamada
+    glMultiDrawArrays.
+    """
+
+    def __init__(self, vertices, quad_cells, visibility, cull_distance,
+                 texture_path=None, color=(1.0, 1.0, 1.0)):
+        """
+        Inicializa a malha com culling por célula.
+
+        Args:
+            vertices: Array float32 (N, 8) no formato GL_T2F_N3F_V3F (quads)
+            quad_cells: Array int (M, 3) de pares (quad, linha, coluna); quads
+                        sem célula só são desenhados quando o culling está desligado
+            visibility: VisibilityTable conservadora entre células transitáveis
+            cull_distance: Distância horizontal além da qual nada é desenhado
+            texture_path: Caminho opcional da textura aplicada à malha
+            color: Cor usada quando não há textura
+        """
+        super().__init__(vertices, texture_path=texture_path, color=color)
+        self.visibility = visibility
+        self.cull_distance = cull_distance
+
+        # Índice célula -> quads: IDs de célula ordenados e os quads na mesma ordem
+        quad_cells = np.asarray(quad_cells, dtype=np.int64).reshape(-1, 3)
+        cell_ids = quad_cells[:, 1] * visibility.cols + quad_cells[:, 2]
+        order = np.argsort(cell_ids, kind='stable')
+        self.link_cells = cell_ids[order]
+        self.link_quads = quad_cells[order, 0]
+
+        self.view = None
+        self.view_cell = None
+        self.candidates = None  # (linhas, colunas) das células visíveis da célula atual
+        self.drawn_quads = 0  # Quads desenhados no último quadro
+
+    def set_view(self, x, z):
+        """Registra a posição do observador para o culling."""
+        self.view = None if x is None or z is None else (x, z)
+
+    def visible_ranges(self):
+        """
+        Calcula os intervalos de vértices a desenhar para a posição atual.
+
+        Returns:
+            tuple: (firsts, counts) como arrays int32, ou None para desenhar tudo
+        """
+        if self.view is None:
+            return None
+
+        x, z = self.view
+        cell = self.visibility.world_to_cell(x, z)
+        if cell != self.view_cell:
+            # O conjunto visível só muda quando o observador troca de célula
+            self.view_cell = cell
+            rows, cols = self.visibility.visible_cells(*cell)
+            self.candidates = (rows, cols) if rows.size else None
+        if self.candidates is None:
+            return None
+
+        # Corte pela neblina: distância do observador à caixa de cada célula
+        rows, cols = self.candidates
+        size = self.visibility.cell_size
+        center_x = (cols - self.visibility.cols / 2) * size
+        center_z = (rows - self.visibility.rows / 2) * size
+        dx = np.maximum(np.abs(x - center_x) - size / 2, 0.0)
+        dz = np.maximum(np.abs(z - center_z) - size / 2, 0.0)
+        near = dx * dx + dz * dz <= self.cull_distance * self.cull_distance
+
+        # Quads ligados às células restantes
+        cell_ids = rows[near] * self.visibility.cols + cols[near]
+        starts = np.searchsorted(self.link_cells, cell_ids, side='left')
+        lengths = np.searchsorted(self.link_cells, cell_ids, side='right') - starts
+        steps = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        quads = np.unique(self.link_quads[np.repeat(starts, lengths) + steps])
+        if quads.size == 0:
+            empty = np.zeros(0, dtype=np.int32)
+            return empty, empty
+
+        # Funde quads consecutivos no buffer em um único intervalo
+        breaks = np.flatnonzero(np.diff(quads) != 1) + 1
+        run_starts = quads[np.concatenate([[0], breaks])]
+        run_lengths = np.diff(np.concatenate([[0], breaks, [len(quads)]]))
+        return (run_starts * 4).astype(np.int32), (run_lengths * 4).astype(np.int32)
+
+    def _draw(self):
+        """Desenha apenas os quads potencialmente visíveis."""
+        ranges = self.visible_ranges()
+        if ranges is None:
+            self.drawn_quads = self.vertex_count // 4
+            glDrawArrays(GL_QUADS, 0, self.vertex_count)
+            return
+
+        firsts, counts = ranges
+        self.drawn_quads = int(counts.sum()) // 4
+        if len(firsts):
+            glMultiDrawArrays(GL_QUADS, firsts, counts, len(firsts))
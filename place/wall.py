@@ -1,8 +1,11 @@
 from OpenGL.GL import *
 from .framework import PlaceElement
 from collision.framework import Collidable
-import pygame
-import os
+from collision.raycast import ray_box
+from render.texture_cache import texture_cache
+from render.gl_state import gl_state
+from light.shader_lighting import shader_lighting
+import numpy as np
 
 
 class Wall(PlaceElement, Collidable):
@@ -24,34 +27,22 @@ class Wall(PlaceElement, Collidable):
         self.width = width
         self.height = height
         self.depth = depth
-        self.texture_id = self._load_texture()
-
-    @classmethod
-    def _load_texture(cls):
-        """Carrega a textura da parede se ela existir."""
-        if not os.path.exists(cls.TEXTURE_PATH):
-            return None
-
-        try:
-            texture_surface = pygame.image.load(cls.TEXTURE_PATH)
-            texture_surface = texture_surface.convert_alpha()
-
-            # Inverte a textura verticalmente para o OpenGL
-            texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
-            width = texture_surface.get_width()
-            height = texture_surface.get_height()
-
-            texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-            return texture_id
-        except Exception as e:
-            print(f"Could not load wall texture: {e}")
-            return None
+        # A textura é obtida do cache só na primeira renderização, para que
+        # paredes usadas apenas para colisão não carreguem texturas
+        self.texture_id = None
+        self._texture_loaded = False
+
+    def upload(self):
+        """Obtém a textura da parede do cache compartilhado."""
+        if not self._texture_loaded:
+            self.texture_id = shader_lighting.acquire_texture(self.TEXTURE_PATH)
+            self._texture_loaded = True
+
+    def release(self):
+        """Libera a referência à textura da parede."""
+        texture_cache.release(self.texture_id)
+        self.texture_id = None
+        self._texture_loaded = False
 
     def create_ceiling(self, depth=5.0):
         """
@@ -66,6 +57,18 @@ class Wall(PlaceElement, Collidable):
         from .ceiling import Ceiling
         return Ceiling.from_wall(self, depth=depth)
 
+    def get_bounds(self):
+        """
+        Obtém a caixa delimitadora da parede no plano XZ.
+
+        Returns:
+            tuple: (min_x, min_z, max_x, max_z)
+        """
+        half_width = self.width / 2
+        half_depth = self.depth / 2
+        return (self.x - half_width, self.z - half_depth,
+                self.x + half_width, self.z + half_depth)
+
     def check_collision(self, point_x, point_z, radius=0.5):
         """
         Verifica se um ponto (com raio) colide com esta parede.
@@ -99,17 +102,45 @@ class Wall(PlaceElement, Collidable):
         # Verifica se a distância é menor que o raio
         return distance_squared < (radius * radius)
 
+    def check_collision_batch(self, xs, zs, radii):
+        """
+        Verifica vários pontos contra esta parede de forma vetorizada.
+
+        Args:
+            xs: Array NumPy de coordenadas X
+            zs: Array NumPy de coordenadas Z
+            radii: Array NumPy de raios
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True onde há colisão
+        """
+        min_x, min_z, max_x, max_z = self.get_bounds()
+        distance_x = xs - np.clip(xs, min_x, max_x)
+        distance_z = zs - np.clip(zs, min_z, max_z)
+        return distance_x * distance_x + distance_z * distance_z < radii * radii
+
+    def raycast(self, origin_x, origin_z, dir_x, dir_z, max_distance, radius=0.0):
+        """
+        Calcula analiticamente o impacto de um raio contra esta parede.
+
+        Returns:
+            tuple: (distância, (nx, nz)) do impacto, ou None
+        """
+        return ray_box(origin_x, origin_z, dir_x, dir_z, self.get_bounds(), radius, max_distance)
+
     def render(self):
         """Renderiza a parede como uma caixa 3D."""
+        self.upload()
+
         glPushMatrix()
 
         half_width = self.width / 2
         half_height = self.height / 2
         half_depth = self.depth / 2
 
-        if self.texture_id:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        textured = shader_lighting.bind_texture(self.texture_id, self.TEXTURE_PATH)
+        if textured:
+            gl_state.enable(GL_TEXTURE_2D)
             glColor3f(1.0, 1.0, 1.0)  # Branco para mostrar a textura como está
         else:
             glColor3f(0.6, 0.4, 0.2)  # Cor marrom
@@ -119,82 +150,83 @@ class Wall(PlaceElement, Collidable):
 
         # Face frontal (normal apontando para +Z)
         glNormal3f(0.0, 0.0, 1.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, 0, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, 0, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.height, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.height, self.z + half_depth)
 
         # Face traseira (normal apontando para -Z)
         glNormal3f(0.0, 0.0, -1.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, 0, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.height, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.height, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, 0, self.z - half_depth)
 
         # Face esquerda (normal apontando para -X)
         glNormal3f(-1.0, 0.0, 0.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, 0, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x - half_width, 0, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x - half_width, self.height, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.height, self.z - half_depth)
 
         # Face direita (normal apontando para +X)
         glNormal3f(1.0, 0.0, 0.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x + half_width, 0, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x + half_width, self.height, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.height, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, 0, self.z + half_depth)
 
         # Face superior (normal apontando para +Y)
         glNormal3f(0.0, 1.0, 0.0)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 0)
         glVertex3f(self.x - half_width, self.height, self.z - half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(0, 1)
         glVertex3f(self.x - half_width, self.height, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 1)
         glVertex3f(self.x + half_width, self.height, self.z + half_depth)
-        if self.texture_id:
+        if textured:
             glTexCoord2f(1, 0)
         glVertex3f(self.x + half_width, self.height, self.z - half_depth)
 
         glEnd()
 
-        if self.texture_id:
-            glDisable(GL_TEXTURE_2D)
+        if textured:
+            gl_state.disable(GL_TEXTURE_2D)
+            shader_lighting.set_texturing(False)
 
         glPopMatrix()
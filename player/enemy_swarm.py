@@ -0,0 +1,180 @@
+from OpenGL.GL import *
+from render.texture_cache import texture_cache
+from timestep import lerp
+import numpy as np
+
+
+class EnemySwarm:
+    """
+    Grupo de inimigos armazenado como arrays NumPy (estrutura de arrays).
+
+    Detecção, movimento e captura de todos os inimigos são calculados em uma
+    única passagem vetorizada por quadro, e todos os billboards entram no
+    lote de sprites de uma vez.
+    """
+
+    TEXTURE_PATH = "assets/textures/enemy.png"
+
+    # Mesmos parâmetros de PlayerEnemy
+    SIZE = 2.0  # Tamanho do billboard
+    DETECTION_RANGE = 15.0  # Alcance para detectar jogador
+    CHASE_SPEED = 3.5  # Velocidade ao perseguir
+    CAPTURE_DISTANCE = 1.0  # Distância de captura (GAME OVER)
+    STOP_DISTANCE = 0.5  # Não se move se muito perto do alvo
+    COLLISION_RADIUS = 0.3  # Raio de colisão do inimigo
+
+    def __init__(self, positions, y=1.5):
+        """
+        Inicializa o grupo de inimigos.
+
+        Args:
+            positions: Sequência de posições (x, z) iniciais
+            y: Altura de flutuação dos inimigos
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        count = len(positions)
+
+        self.x = positions[:, 0].copy()
+        self.z = positions[:, 1].copy()
+        self.previous_x = self.x.copy()  # Posições antes do último passo de simulação
+        self.previous_z = self.z.copy()
+        self.y = np.full(count, y, dtype=np.float64)
+        self.velocity_x = np.zeros(count, dtype=np.float64)
+        self.velocity_z = np.zeros(count, dtype=np.float64)
+        self.is_chasing = np.zeros(count, dtype=bool)
+        self.detection_range = np.full(count, self.DETECTION_RANGE, dtype=np.float64)
+        self.chase_speed = np.full(count, self.CHASE_SPEED, dtype=np.float64)
+        self.size = np.full(count, self.SIZE, dtype=np.float64)
+
+        self.texture_id = None  # Obtida em upload()
+        self._texture_loaded = False
+
+    def __len__(self):
+        """Número de inimigos no grupo."""
+        return len(self.x)
+
+    def upload(self):
+        """Obtém a textura dos inimigos do cache compartilhado (requer contexto GL)."""
+        if not self._texture_loaded:
+            self.texture_id = texture_cache.acquire(self.TEXTURE_PATH, wrap=GL_CLAMP)
+            self._texture_loaded = True
+
+    def release(self):
+        """Libera a referência à textura dos inimigos."""
+        texture_cache.release(self.texture_id)
+        self.texture_id = None
+        self._texture_loaded = False
+
+    def can_see_player(self, player_x, player_z, visibility=None):
+        """
+        Verifica quais inimigos podem ver o jogador.
+
+        Args:
+            player_x: Posição X do jogador
+            player_z: Posição Z do jogador
+            visibility: VisibilityTable opcional; quando fornecida, paredes
+                        entre o inimigo e o jogador bloqueiam a visão
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True para inimigos com o jogador no alcance
+        """
+        dx = player_x - self.x
+        dz = player_z - self.z
+        in_range = dx * dx + dz * dz <= self.detection_range * self.detection_range
+        if visibility is not None and in_range.any():
+            in_range &= visibility.can_see_batch(self.x, self.z, player_x, player_z)
+        return in_range
+
+    def update(self, delta_time, player_x, player_z, batch_collision_check=None, pathfinder=None,
+               visibility=None):
+        """
+        Atualiza IA e movimento de todos os inimigos em uma passagem vetorizada.
+
+        Args:
+            delta_time: Tempo desde a última atualização
+            player_x: Posição X do jogador
+            player_z: Posição Z do jogador
+            batch_collision_check: Função opcional (xs, zs, radius) -> máscara booleana
+            pathfinder: Pathfinder opcional com campo de fluxo apontando para o jogador
+            visibility: VisibilityTable opcional para linha de visão na detecção
+
+        Returns:
+            bool: True se algum inimigo capturou o jogador, False caso contrário
+        """
+        if len(self) == 0:
+            return False
+
+        self.previous_x = self.x.copy()
+        self.previous_z = self.z.copy()
+
+        # Detecção (quem já persegue não deixa de perseguir)
+        if not self.is_chasing.all():
+            self.is_chasing |= self.can_see_player(player_x, player_z, visibility)
+        if not self.is_chasing.any():
+            # Ninguém se move: sem campo de fluxo, colisão nem captura
+            self.velocity_x.fill(0.0)
+            self.velocity_z.fill(0.0)
+            return False
+
+        # Captura
+        dx = player_x - self.x
+        dz = player_z - self.z
+        player_distance = np.sqrt(dx * dx + dz * dz)
+        if np.any(self.is_chasing & (player_distance < self.CAPTURE_DISTANCE)):
+            return True
+
+        # Alvo de cada inimigo: próxima célula do campo de fluxo ou o jogador
+        target_x = np.full(len(self), float(player_x))
+        target_z = np.full(len(self), float(player_z))
+        if pathfinder is not None:
+            waypoint_x, waypoint_z, valid = pathfinder.next_waypoints(self.x, self.z)
+            target_x[valid] = waypoint_x[valid]
+            target_z[valid] = waypoint_z[valid]
+
+        dx = target_x - self.x
+        dz = target_z - self.z
+        distance = np.sqrt(dx * dx + dz * dz)
+        moving = self.is_chasing & (distance > self.STOP_DISTANCE)
+
+        step = np.zeros(len(self))
+        step[moving] = self.chase_speed[moving] * delta_time / distance[moving]
+        new_x = self.x + dx * step
+        new_z = self.z + dz * step
+
+        old_x = self.x.copy()
+        old_z = self.z.copy()
+
+        moved = np.flatnonzero(moving)
+        if batch_collision_check is not None and moved.size:
+            # Só o passo direto, como PlayerEnemy: inimigos bloqueados ficam parados
+            blocked = batch_collision_check(new_x[moved], new_z[moved], radius=self.COLLISION_RADIUS)
+            moved = moved[~blocked]
+        self.x[moved] = new_x[moved]
+        self.z[moved] = new_z[moved]
+
+        if delta_time > 0:
+            self.velocity_x = (self.x - old_x) / delta_time
+            self.velocity_z = (self.z - old_z) / delta_time
+
+        return False
+
+    def add_sprites(self, batch, alpha=1.0):
+        """
+        Adiciona os billboards de todos os inimigos a um lote de sprites.
+
+        Args:
+            batch: SpriteBatch desenhado após o cenário
+            alpha: Fração do próximo passo de simulação já decorrida; as
+                   posições são interpoladas a partir do passo anterior
+        """
+        if len(self) == 0:
+            return
+
+        positions = np.column_stack([lerp(self.previous_x, self.x, alpha), self.y,
+                                     lerp(self.previous_z, self.z, alpha)])
+        self.upload()
+        if self.texture_id:
+            batch.add(self.texture_id, positions, self.size)
+        else:
+            # Quadrado vermelho se não houver textura
+            batch.add(None, positions, self.size, color=(1.0, 0.0, 0.0, 1.0))
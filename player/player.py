@@ -1,5 +1,6 @@
 from .camera import Camera
 from .movement import Movement
+from timestep import lerp
 
 
 class Player:
@@ -13,6 +14,7 @@ class Player:
         self.x = x
         self.y = y
         self.z = z
+        self.previous_position = (x, y, z)  # Posição antes do último passo de simulação
 
         # Inicializa módulos de câmera e movimento
         self.camera = Camera(sensitivity=0.1)
@@ -45,6 +47,7 @@ class Player:
             collision_check: Função opcional(x, z) -> bool para verificar colisões
         """
         position = (self.x, self.y, self.z)
+        self.previous_position = position
         yaw = self.camera.get_yaw()
         self.x, self.y, self.z = self.movement.update(position, yaw, delta_time, collision_check)
 
@@ -65,3 +68,16 @@ class Player:
             tuple: posição (x, y, z)
         """
         return (self.x, self.y, self.z)
+
+    def get_interpolated_position(self, alpha):
+        """
+        Obtém a posição entre os dois últimos passos de simulação, para renderização.
+
+        Args:
+            alpha: Fração do próximo passo já decorrida (0 = passo anterior, 1 = atual)
+
+        Returns:
+            tuple: posição (x, y, z) interpolada
+        """
+        return tuple(lerp(previous, current, alpha)
+                     for previous, current in zip(self.previous_position, self.get_position()))
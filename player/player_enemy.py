@@ -1,7 +1,6 @@
 from OpenGL.GL import *
-from OpenGL.GLU import *
-import pygame
-import os
+from render.texture_cache import texture_cache
+from timestep import lerp
 import numpy as np
 
 
@@ -22,56 +21,49 @@ class PlayerEnemy:
         self.x = x
         self.y = y
         self.z = z
+        self.previous_x = x  # Posição antes do último passo de simulação
+        self.previous_z = z
         self.size = 2.0  # Tamanho do billboard
         self.detection_range = 15.0  # Alcance para detectar jogador
         self.chase_speed = 3.5  # Velocidade ao perseguir
         self.is_chasing = False
-        self.texture_id = self._load_texture()
-
-    @classmethod
-    def _load_texture(cls):
-        """Carrega a textura do inimigo se ela existir."""
-        if not os.path.exists(cls.TEXTURE_PATH):
-            return None
-
-        try:
-            texture_surface = pygame.image.load(cls.TEXTURE_PATH)
-            texture_surface = texture_surface.convert_alpha()
-
-            # Inverte a textura verticalmente para o OpenGL
-            texture_data = pygame.image.tostring(texture_surface, "RGBA", 1)
-            width = texture_surface.get_width()
-            height = texture_surface.get_height()
-
-            texture_id = glGenTextures(1)
-            glBindTexture(GL_TEXTURE_2D, texture_id)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP)
-            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP)
-            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
-            return texture_id
-        except Exception as e:
-            print(f"Could not load enemy texture: {e}")
-            return None
-
-    def can_see_player(self, player_x, player_z):
+        self.texture_id = None  # Obtida em upload()
+        self._texture_loaded = False
+
+    def upload(self):
+        """Obtém a textura do inimigo do cache compartilhado (requer contexto GL)."""
+        if not self._texture_loaded:
+            self.texture_id = texture_cache.acquire(self.TEXTURE_PATH, wrap=GL_CLAMP)
+            self._texture_loaded = True
+
+    def release(self):
+        """Libera a referência à textura do inimigo."""
+        texture_cache.release(self.texture_id)
+        self.texture_id = None
+        self._texture_loaded = False
+
+    def can_see_player(self, player_x, player_z, visibility=None):
         """
         Verifica se o inimigo pode ver o jogador.
 
         Args:
             player_x: Posição X do jogador
             player_z: Posição Z do jogador
+            visibility: VisibilityTable opcional; quando fornecida, paredes
+                        entre o inimigo e o jogador bloqueiam a visão
 
         Returns:
-            bool: True se o jogador está no alcance
+            bool: True se o jogador está no alcance (e visível)
         """
         dx = player_x - self.x
         dz = player_z - self.z
         distance = np.sqrt(dx * dx + dz * dz)
-        return distance <= self.detection_range
+        if distance > self.detection_range:
+            return False
+        return visibility is None or visibility.can_see_world(self.x, self.z, player_x, player_z)
 
-    def update(self, delta_time, player_x, player_z, collision_check=None):
+    def update(self, delta_time, player_x, player_z, collision_check=None, pathfinder=None,
+               visibility=None):
         """
         Atualiza IA e movimento do inimigo.
 
@@ -80,12 +72,18 @@ class PlayerEnemy:
             player_x: Posição X do jogador
             player_z: Posição Z do jogador
             collision_check: Função de verificação de colisão
+            pathfinder: Pathfinder opcional com campo de fluxo apontando para o jogador;
+                        quando fornecido, o inimigo segue os corredores do labirinto
+            visibility: VisibilityTable opcional para linha de visão na detecção
 
         Returns:
             bool: True se o inimigo capturou o jogador (colisão detectada), False caso contrário
         """
+        self.previous_x = self.x
+        self.previous_z = self.z
+
         # Verifica se podemos ver o jogador
-        if self.can_see_player(player_x, player_z):
+        if self.can_see_player(player_x, player_z, visibility):
             self.is_chasing = True
 
         # Persegue o jogador se avistado
@@ -98,6 +96,15 @@ class PlayerEnemy:
             if distance < 1.0:  # Capturado dentro de 1 unidade - GAME OVER
                 return True
 
+            # Segue o campo de fluxo até a célula do jogador; na mesma célula
+            # (ou sem campo disponível) vai em linha reta
+            if pathfinder is not None:
+                waypoint = pathfinder.next_waypoint(self.x, self.z)
+                if waypoint is not None:
+                    dx = waypoint[0] - self.x
+                    dz = waypoint[1] - self.z
+                    distance = np.sqrt(dx * dx + dz * dz)
+
             if distance > 0.5:  # Não se move se muito perto
                 # Normaliza direção
                 dx /= distance
@@ -115,57 +122,19 @@ class PlayerEnemy:
 
         return False
 
-    def render(self, player_x, player_z):
+    def add_sprites(self, batch, alpha=1.0):
         """
-        Renderiza o inimigo como um sprite billboard virado para o jogador.
+        Adiciona o billboard do inimigo a um lote de sprites.
 
         Args:
-            player_x: Posição X do jogador para orientação do billboard
-            player_z: Posição Z do jogador para orientação do billboard
+            batch: SpriteBatch desenhado após o cenário
+            alpha: Fração do próximo passo de simulação já decorrida; a
+                   posição é interpolada a partir do passo anterior
         """
-        glPushMatrix()
-
-        # Move para posição
-        glTranslatef(self.x, self.y, self.z)
-
-        # Billboard: sempre virado para o jogador
-        dx = player_x - self.x
-        dz = player_z - self.z
-        angle = np.arctan2(dx, dz) * 180.0 / np.pi
-        glRotatef(-angle, 0, 1, 0)
-
-        # Habilita transparência
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
+        position = (lerp(self.previous_x, self.x, alpha), self.y, lerp(self.previous_z, self.z, alpha))
+        self.upload()
         if self.texture_id:
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, self.texture_id)
-            glColor4f(1.0, 1.0, 1.0, 1.0)
+            batch.add(self.texture_id, position, self.size)
         else:
             # Quadrado vermelho se não houver textura
-            glColor4f(1.0, 0.0, 0.0, 1.0)
-
-        # Desenha billboard centrado na posição
-        half_size = self.size / 2
-        glBegin(GL_QUADS)
-        if self.texture_id:
-            glTexCoord2f(0, 0)
-        glVertex3f(-half_size, -half_size, 0)
-        if self.texture_id:
-            glTexCoord2f(1, 0)
-        glVertex3f(half_size, -half_size, 0)
-        if self.texture_id:
-            glTexCoord2f(1, 1)
-        glVertex3f(half_size, half_size, 0)
-        if self.texture_id:
-            glTexCoord2f(0, 1)
-        glVertex3f(-half_size, half_size, 0)
-        glEnd()
-
-        if self.texture_id:
-            glDisable(GL_TEXTURE_2D)
-
-        glDisable(GL_BLEND)
-
-        glPopMatrix()
+            batch.add(None, position, self.size, color=(1.0, 0.0, 0.0, 1.0))
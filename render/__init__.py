@@ -0,0 +1,11 @@
+from .texture_cache import TextureCache, texture_cache
+from .frustum import Frustum
+from .gl_state import GLStateCache, gl_state
+from .sprite_batch import SpriteBatch, sprite_batch
+from .text import GlyphAtlas, TextRenderer, text_renderer
+from .sphere_mesh import SphereMeshCache, sphere_meshes
+from .texture_array import TextureArray, world_textures
+
+__all__ = ['TextureCache', 'texture_cache', 'Frustum', 'GLStateCache', 'gl_state',
+           'SpriteBatch', 'sprite_batch', 'GlyphAtlas', 'TextRenderer', 'text_renderer',
+           'SphereMeshCache', 'sphere_meshes', 'TextureArray', 'world_textures']
@@ -0,0 +1,172 @@
+"""
+Resolução dinâmica da cena 3D.
+
+A cena é desenhada em um framebuffer fora da tela com uma fração da
+resolução da janela e ampliada para a janela com glBlitFramebuffer (filtro
+linear). Um controlador acompanha o tempo gasto nos quadros recentes e
+ajusta essa fração para manter a taxa de quadros alvo. A sobreposição 2D é
+desenhada depois, direto na janela, em resolução nativa.
+"""
+
+from collections import deque
+import math
+from OpenGL.GL import *
+
+
+class ResolutionController:
+    """Escolhe a escala de renderização a partir dos tempos de quadro."""
+
+    STEP = 0.05  # Granularidade da escala (evita ajustes mínimos a cada quadro)
+    WINDOW = 30  # Quadros considerados em cada decisão
+    DOWNSCALE_LOAD = 0.95  # Acima desta fração do orçamento, reduz a escala
+    UPSCALE_LOAD = 0.75  # Abaixo desta fração do orçamento, aumenta a escala
+
+    def __init__(self, target_fps=60, min_scale=0.5, max_scale=1.0):
+        """
+        Inicializa o controlador na escala máxima.
+
+        Args:
+            target_fps: Taxa de quadros que o controlador tenta manter
+            min_scale: Menor fração da resolução da janela
+            max_scale: Maior fração da resolução da janela
+        """
+        self.budget = 1.0 / target_fps
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.scale = max_scale
+        self._frame_times = deque(maxlen=self.WINDOW)
+
+    def _quantize(self, scale):
+        """Arredonda para a granularidade STEP e limita ao intervalo permitido."""
+        scale = round(scale / self.STEP) * self.STEP
+        return min(self.max_scale, max(self.min_scale, round(scale, 4)))
+
+    def record(self, frame_time):
+        """
+        Registra o tempo de trabalho de um quadro e ajusta a escala quando há
+        amostras suficientes.
+
+        Args:
+            frame_time: Segundos gastos no quadro, sem a espera do limitador de FPS
+
+        Returns:
+            float: Escala a usar no próximo quadro
+        """
+        self._frame_times.append(frame_time)
+        if len(self._frame_times) < self.WINDOW:
+            return self.scale
+
+        load = sum(self._frame_times) / len(self._frame_times) / self.budget
+        scale = self.scale
+        if load > self.DOWNSCALE_LOAD:
+            # O custo de preenchimento cresce com a área (escala ao quadrado)
+            scale = min(scale * math.sqrt(self.DOWNSCALE_LOAD / load), scale - self.STEP)
+        elif load < self.UPSCALE_LOAD:
+            scale += self.STEP
+        scale = self._quantize(scale)
+
+        if scale != self.scale:
+            # Amostras antigas foram medidas com outra escala
+            self.scale = scale
+            self._frame_times.clear()
+        return self.scale
+
+
+class SceneFramebuffer:
+    """Framebuffer fora da tela, do tamanho da janela, usado em parte conforme a escala."""
+
+    def __init__(self, width, height):
+        """
+        Inicializa sem recursos; o framebuffer é criado no primeiro uso (requer contexto GL).
+
+        Args:
+            width: Largura da janela em pixels
+            height: Altura da janela em pixels
+        """
+        self.width = width
+        self.height = height
+        self.framebuffer = None
+        self.renderbuffers = []
+        self.failed = False
+        self.active_size = None  # (largura, altura) da cena no quadro atual
+
+    def _create(self):
+        """Cria o framebuffer com cor e profundidade; retorna False sem suporte do driver."""
+        if not (bool(glGenFramebuffers) and bool(glBlitFramebuffer)):
+            print("Framebuffer objects not supported, dynamic resolution disabled")
+            return False
+
+        framebuffer = glGenFramebuffers(1)
+        color, depth = glGenRenderbuffers(2)
+        glBindFramebuffer(GL_FRAMEBUFFER, framebuffer)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, color)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, self.width, self.height)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, color)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, depth)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, self.width, self.height)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, depth)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+        status = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+        self.framebuffer = framebuffer
+        self.renderbuffers = [color, depth]
+        if status != GL_FRAMEBUFFER_COMPLETE:
+            print(f"Scene framebuffer incomplete (status {status}), dynamic resolution disabled")
+            self.release()
+            return False
+        return True
+
+    def begin(self, scale):
+        """
+        Direciona o desenho da cena para o framebuffer, em uma fração da janela.
+
+        Com escala 1 (ou sem suporte) desenha direto na janela, sem cópia extra.
+
+        Args:
+            scale: Fração da resolução da janela em cada eixo
+
+        Returns:
+            bool: True se a cena está sendo desenhada fora da tela
+        """
+        self.active_size = None
+        if scale < 1.0 and self.framebuffer is None and not self.failed:
+            try:
+                self.failed = not self._create()
+            except Exception as e:
+                print(f"Could not create scene framebuffer: {e}")
+                self.release()
+                self.failed = True
+
+        if scale >= 1.0 or self.framebuffer is None:
+            glViewport(0, 0, self.width, self.height)
+            return False
+
+        self.active_size = (max(1, int(self.width * scale)), max(1, int(self.height * scale)))
+        glBindFramebuffer(GL_FRAMEBUFFER, self.framebuffer)
+        glViewport(0, 0, *self.active_size)
+        return True
+
+    def end(self):
+        """Amplia a cena para a janela e volta a desenhar na janela em resolução nativa."""
+        if self.active_size is not None:
+            scene_width, scene_height = self.active_size
+            glBindFramebuffer(GL_READ_FRAMEBUFFER, self.framebuffer)
+            glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+            glBlitFramebuffer(0, 0, scene_width, scene_height, 0, 0, self.width, self.height,
+                              GL_COLOR_BUFFER_BIT, GL_LINEAR)
+            glBindFramebuffer(GL_FRAMEBUFFER, 0)
+            self.active_size = None
+        glViewport(0, 0, self.width, self.height)
+
+    def release(self):
+        """Apaga o framebuffer da GPU."""
+        if self.framebuffer is not None:
+            glDeleteFramebuffers(1, [self.framebuffer])
+            self.framebuffer = None
+        if self.renderbuffers:
+            glDeleteRenderbuffers(len(self.renderbuffers), self.renderbuffers)
+            self.renderbuffers = []
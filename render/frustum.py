@@ -0,0 +1,125 @@
+"""
+Frustum de visão da câmera para culling de geometria.
+
+As matrizes são montadas em NumPy exatamente como o pipeline fixo as monta
+em main.py (gluPerspective seguido de glRotatef(pitch), glRotatef(yaw) e
+glTranslatef(-posição)), sem consultar o estado do OpenGL. Os seis planos
+são extraídos da matriz de recorte (método de Gribb-Hartmann).
+"""
+
+import math
+import numpy as np
+
+
+def perspective_matrix(fov_y, aspect, near, far):
+    """Matriz de projeção equivalente a gluPerspective."""
+    f = 1.0 / math.tan(math.radians(fov_y) / 2)
+    return np.array([
+        [f / aspect, 0.0, 0.0, 0.0],
+        [0.0, f, 0.0, 0.0],
+        [0.0, 0.0, (far + near) / (near - far), 2 * far * near / (near - far)],
+        [0.0, 0.0, -1.0, 0.0],
+    ])
+
+
+def rotation_matrix(angle, x, y, z):
+    """Matriz de rotação equivalente a glRotatef para um eixo unitário."""
+    c = math.cos(math.radians(angle))
+    s = math.sin(math.radians(angle))
+    t = 1 - c
+    return np.array([
+        [t * x * x + c, t * x * y - s * z, t * x * z + s * y, 0.0],
+        [t * x * y + s * z, t * y * y + c, t * y * z - s * x, 0.0],
+        [t * x * z - s * y, t * y * z + s * x, t * z * z + c, 0.0],
+        [0.0, 0.0, 0.0, 1.0],
+    ])
+
+
+def camera_view_matrix(x, y, z, pitch, yaw):
+    """Matriz de visualização da câmera em primeira pessoa de main.py."""
+    translation = np.identity(4)
+    translation[:3, 3] = (-x, -y, -z)
+    return rotation_matrix(pitch, 1, 0, 0) @ rotation_matrix(yaw, 0, 1, 0) @ translation
+
+
+class Frustum:
+    """Seis planos (a, b, c, d) voltados para dentro do volume visível."""
+
+    def __init__(self, planes):
+        """
+        Inicializa o frustum.
+
+        Args:
+            planes: Array (6, 4) de planos; um ponto p está dentro quando
+                    a*px + b*py + c*pz + d >= 0 para todos os planos
+        """
+        planes = np.asarray(planes, dtype=np.float64)
+        lengths = np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+        self.planes = planes / lengths
+
+    @classmethod
+    def from_matrix(cls, clip):
+        """
+        Extrai os planos de uma matriz de recorte (projeção x visualização).
+
+        Returns:
+            Frustum: Frustum correspondente
+        """
+        rows = np.asarray(clip, dtype=np.float64)
+        return cls([
+            rows[3] + rows[0],  # Esquerdo
+            rows[3] - rows[0],  # Direito
+            rows[3] + rows[1],  # Inferior
+            rows[3] - rows[1],  # Superior
+            rows[3] + rows[2],  # Próximo
+            rows[3] - rows[2],  # Distante
+        ])
+
+    @classmethod
+    def from_camera(cls, x, y, z, pitch, yaw, fov_y=45.0, aspect=4 / 3, near=0.1, far=1000.0):
+        """
+        Constrói o frustum da câmera do jogador.
+
+        Args:
+            x: Posição X da câmera
+            y: Posição Y da câmera
+            z: Posição Z da câmera
+            pitch: Rotação vertical em graus (Player.get_view_matrix_rotation)
+            yaw: Rotação horizontal em graus
+            fov_y: Campo de visão vertical em graus
+            aspect: Proporção largura / altura
+            near: Plano próximo
+            far: Plano distante
+
+        Returns:
+            Frustum: Frustum da câmera
+        """
+        clip = perspective_matrix(fov_y, aspect, near, far) @ camera_view_matrix(x, y, z, pitch, yaw)
+        return cls.from_matrix(clip)
+
+    def intersects_boxes(self, mins, maxs):
+        """
+        Testa várias caixas alinhadas aos eixos contra o frustum.
+
+        O teste é conservador: uma caixa só é descartada se estiver
+        inteiramente fora de algum plano.
+
+        Args:
+            mins: Array (N, 3) de cantos mínimos
+            maxs: Array (N, 3) de cantos máximos
+
+        Returns:
+            numpy.ndarray: Máscara booleana, True para caixas possivelmente visíveis
+        """
+        mins = np.asarray(mins, dtype=np.float64).reshape(-1, 3)
+        maxs = np.asarray(maxs, dtype=np.float64).reshape(-1, 3)
+        normals = self.planes[:, :3]
+
+        # Vértice de cada caixa mais adiante na direção da normal de cada plano
+        positive = np.where(normals[None, :, :] >= 0, maxs[:, None, :], mins[:, None, :])
+        distance = np.einsum('npk,pk->np', positive, normals) + self.planes[:, 3]
+        return np.all(distance >= 0, axis=1)
+
+    def intersects_box(self, box_min, box_max):
+        """Testa uma única caixa alinhada aos eixos contra o frustum."""
+        return bool(self.intersects_boxes(box_min, box_max)[0])
@@ -0,0 +1,176 @@
+"""
+Cache do estado do OpenGL.
+
+Guarda uma cópia (sombra) do estado que o jogo altera com frequência:
+capacidades habilitadas, textura vinculada, função de blend e parâmetros de
+luz, material e neblina. Cada chamada compara o novo valor com a sombra e
+só chega ao driver quando o valor muda; as chamadas evitadas são contadas
+por quadro.
+
+Todo o código de renderização deve passar por gl_state. Se o estado for
+alterado por fora (novo contexto, glPopAttrib), chame invalidate().
+"""
+
+from OpenGL.GL import *
+
+
+def _key(values):
+    """Converte um valor escalar ou vetor em tupla comparável."""
+    if hasattr(values, '__len__'):
+        return tuple(float(v) for v in values)
+    return (values,)
+
+
+class GLStateCache:
+    """Sombra do estado do OpenGL que descarta chamadas sem efeito."""
+
+    # Parâmetros de luz transformados pela modelview no momento da chamada;
+    # o mesmo valor pode significar outra posição, então nunca são descartados
+    VIEW_DEPENDENT = (GL_POSITION, GL_SPOT_DIRECTION)
+
+    def __init__(self):
+        """Inicializa com a sombra vazia (todo valor é enviado na primeira vez)."""
+        self._state = {}
+        self.issued = 0  # Chamadas enviadas ao driver neste quadro
+        self.elided = 0  # Chamadas descartadas neste quadro
+        self.last_frame = {'issued': 0, 'elided': 0}
+
+    def invalidate(self):
+        """Esquece a sombra; use após criar um contexto ou alterar o estado por fora."""
+        self._state.clear()
+
+    def begin_frame(self):
+        """Fecha os contadores do quadro anterior e zera os do novo quadro."""
+        self.last_frame = {'issued': self.issued, 'elided': self.elided}
+        self.issued = 0
+        self.elided = 0
+
+    def stats(self):
+        """
+        Obtém os contadores do último quadro completo.
+
+        Returns:
+            dict: 'issued' (chamadas enviadas) e 'elided' (chamadas descartadas)
+        """
+        return dict(self.last_frame)
+
+    def _changed(self, key, value):
+        """Atualiza a sombra e informa se a chamada precisa ser enviada."""
+        if self._state.get(key, self) == value:
+            self.elided += 1
+            return False
+        self._state[key] = value
+        self.issued += 1
+        return True
+
+    # ===== CAPACIDADES =====
+
+    def enable(self, capability):
+        """glEnable, se a capacidade estiver desabilitada."""
+        if self._changed(('enabled', capability), True):
+            glEnable(capability)
+
+    def disable(self, capability):
+        """glDisable, se a capacidade estiver habilitada."""
+        if self._changed(('enabled', capability), False):
+            glDisable(capability)
+
+    def set_enabled(self, capability, enabled):
+        """Habilita ou desabilita uma capacidade."""
+        if enabled:
+            self.enable(capability)
+        else:
+            self.disable(capability)
+
+    # ===== TEXTURAS E BLEND =====
+
+    def active_texture(self, unit):
+        """glActiveTexture, se outra unidade estiver ativa (unit é o índice, 0 = GL_TEXTURE0)."""
+        if self._changed(('active_texture',), unit):
+            glActiveTexture(GL_TEXTURE0 + unit)
+
+    def bind_texture(self, texture_id, target=GL_TEXTURE_2D):
+        """glBindTexture na unidade ativa, se outra textura estiver vinculada."""
+        unit = self._state.get(('active_texture',), 0)
+        if self._changed(('texture', unit, target), texture_id):
+            glBindTexture(target, texture_id)
+
+    def forget_textures(self, texture_ids):
+        """
+        Remove texturas apagadas da sombra (glDeleteTextures desvincula a
+        textura atual, e o ID pode ser reaproveitado).
+
+        Args:
+            texture_ids: IDs apagados
+        """
+        texture_ids = set(texture_ids)
+        for key in [k for k, v in self._state.items() if k[0] == 'texture' and v in texture_ids]:
+            del self._state[key]
+
+    def blend_func(self, source, destination):
+        """glBlendFunc, se a função mudou."""
+        if self._changed(('blend_func',), (source, destination)):
+            glBlendFunc(source, destination)
+
+    # ===== ILUMINAÇÃO =====
+
+    def light(self, light, parameter, value):
+        """glLightf / glLightfv, conforme o valor seja escalar ou vetor."""
+        if parameter in self.VIEW_DEPENDENT:
+            self._state.pop(('light', light, parameter), None)
+        if not self._changed(('light', light, parameter), _key(value)):
+            return
+        if hasattr(value, '__len__'):
+            glLightfv(light, parameter, value)
+        else:
+            glLightf(light, parameter, value)
+
+    def light_model(self, parameter, value):
+        """glLightModeli / glLightModelfv, conforme o valor seja escalar ou vetor."""
+        if not self._changed(('light_model', parameter), _key(value)):
+            return
+        if hasattr(value, '__len__'):
+            glLightModelfv(parameter, value)
+        else:
+            glLightModeli(parameter, value)
+
+    def material(self, face, parameter, value):
+        """glMaterialf / glMaterialfv, conforme o valor seja escalar ou vetor."""
+        if not self._changed(('material', face, parameter), _key(value)):
+            return
+        if hasattr(value, '__len__'):
+            glMaterialfv(face, parameter, value)
+        else:
+            glMaterialf(face, parameter, value)
+
+    def color_material(self, face, mode):
+        """glColorMaterial, se o modo mudou."""
+        if self._changed(('color_material',), (face, mode)):
+            glColorMaterial(face, mode)
+
+    def shade_model(self, mode):
+        """glShadeModel, se o modo mudou."""
+        if self._changed(('shade_model',), mode):
+            glShadeModel(mode)
+
+    # ===== NEBLINA =====
+
+    def fog(self, parameter, value):
+        """glFogi / glFogf / glFogfv, conforme o tipo do valor."""
+        if not self._changed(('fog', parameter), _key(value)):
+            return
+        if hasattr(value, '__len__'):
+            glFogfv(parameter, value)
+        elif isinstance(value, int):
+            glFogi(parameter, value)
+        else:
+            glFogf(parameter, value)
+
+    def hint(self, target, mode):
+        """glHint, se o modo mudou."""
+        if self._changed(('hint', target), mode):
+            glHint(target, mode)
+
+
+# Instância global usada por todos os caminhos de renderização
+gl_state = GLStateCache()
@@ -0,0 +1,130 @@
+"""
+Programas GLSL com cache de uniforms.
+
+Cada uniform guarda o último valor enviado; set_uniform só chama glUniform
+quando o valor muda, então parâmetros constantes são enviados uma única vez.
+"""
+
+from OpenGL.GL import *
+
+
+class ShaderProgram:
+    """Programa GLSL (vértice + fragmento) ligado e pronto para uso."""
+
+    def __init__(self, program):
+        """
+        Inicializa o wrapper a partir de um programa já ligado.
+
+        Args:
+            program: ID do programa OpenGL
+        """
+        self.program = program
+        self._locations = {}
+        self._values = {}
+        self.uniform_updates = 0  # Chamadas glUniform realmente emitidas
+        self.uniform_skips = 0  # Chamadas evitadas por valor repetido
+
+    @staticmethod
+    def _compile(source, kind):
+        """Compila um shader e lança RuntimeError com o log em caso de erro."""
+        shader = glCreateShader(kind)
+        glShaderSource(shader, source)
+        glCompileShader(shader)
+        if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+            log = glGetShaderInfoLog(shader)
+            glDeleteShader(shader)
+            raise RuntimeError(log.decode() if isinstance(log, bytes) else log)
+        return shader
+
+    @classmethod
+    def create(cls, vertex_source, fragment_source):
+        """
+        Compila e liga um programa.
+
+        Args:
+            vertex_source: Código GLSL do vertex shader
+            fragment_source: Código GLSL do fragment shader
+
+        Returns:
+            ShaderProgram: Programa pronto, ou None se shaders não forem
+            suportados ou a compilação falhar
+        """
+        try:
+            if not bool(glCreateShader):
+                print("Shaders not supported by this OpenGL driver")
+                return None
+
+            vertex = cls._compile(vertex_source, GL_VERTEX_SHADER)
+            fragment = cls._compile(fragment_source, GL_FRAGMENT_SHADER)
+            program = glCreateProgram()
+            glAttachShader(program, vertex)
+            glAttachShader(program, fragment)
+            glLinkProgram(program)
+            glDeleteShader(vertex)
+            glDeleteShader(fragment)
+            if not glGetProgramiv(program, GL_LINK_STATUS):
+                log = glGetProgramInfoLog(program)
+                glDeleteProgram(program)
+                raise RuntimeError(log.decode() if isinstance(log, bytes) else log)
+            return cls(program)
+        except Exception as e:
+            print(f"Could not build shader program: {e}")
+            return None
+
+    def use(self):
+        """Ativa o programa."""
+        glUseProgram(self.program)
+
+    @staticmethod
+    def use_fixed_function():
+        """Volta para o pipeline fixo."""
+        glUseProgram(0)
+
+    def _location(self, name):
+        """Obtém (em cache) a localização de um uniform."""
+        location = self._locations.get(name)
+        if location is None:
+            location = glGetUniformLocation(self.program, name)
+            self._locations[name] = location
+        return location
+
+    def set_uniform(self, name, *values):
+        """
+        Define um uniform float (1 a 4 componentes) ou int, se mudou.
+
+        Inteiros Python são enviados com glUniform1i (samplers e flags).
+        O programa precisa estar ativo.
+
+        Args:
+            name: Nome do uniform no GLSL
+            *values: Componentes do valor
+
+        Returns:
+            bool: True se glUniform foi chamado
+        """
+        if len(values) == 1 and hasattr(values[0], '__len__'):
+            values = tuple(values[0])
+        values = tuple(v if isinstance(v, (bool, int)) else float(v) for v in values)
+        if self._values.get(name) == values:
+            self.uniform_skips += 1
+            return False
+
+        location = self._location(name)
+        if location < 0:
+            return False  # Uniform otimizado pelo compilador ou inexistente
+
+        if len(values) == 1 and isinstance(values[0], (bool, int)):
+            glUniform1i(location, int(values[0]))
+        else:
+            (glUniform1f, glUniform2f, glUniform3f, glUniform4f)[len(values) - 1](location, *values)
+        self._values[name] = values
+        self.uniform_updates += 1
+        return True
+
+    def release(self):
+        """Apaga o programa da GPU."""
+        if self.program:
+            glDeleteProgram(self.program)
+            self.program = None
+        self._locations.clear()
+        self._values.clear()
@@ -0,0 +1,141 @@
+"""
+Malhas de esfera pré-calculadas com níveis de detalhe.
+
+Substitui gluSphere, que tessela a esfera na CPU e a envia em modo imediato
+a cada chamada. Cada nível de detalhe é gerado uma vez em NumPy, enviado
+para um vertex buffer e desenhado com uma única chamada, escalado pelo raio.
+O nível é escolhido pelo tamanho projetado da esfera na tela.
+"""
+
+import math
+from OpenGL.GL import *
+import numpy as np
+
+
+def build_uv_sphere(slices, stacks):
+    """
+    Gera uma esfera UV de raio 1.
+
+    Args:
+        slices: Divisões em torno do eixo Y
+        stacks: Divisões entre os polos (pelo menos 2)
+
+    Returns:
+        tuple: (vértices float32 (N, 6) no formato GL_N3F_V3F,
+                índices uint16 (M,) de triângulos)
+    """
+    theta = np.linspace(0.0, math.pi, stacks + 1)[:, None]  # Do polo norte ao sul
+    phi = np.linspace(0.0, 2 * math.pi, slices + 1)[None, :]
+
+    positions = np.empty((stacks + 1, slices + 1, 3), dtype=np.float32)
+    positions[:, :, 0] = np.sin(theta) * np.cos(phi)
+    positions[:, :, 1] = np.cos(theta) * np.ones_like(phi)
+    positions[:, :, 2] = -np.sin(theta) * np.sin(phi)
+    positions = positions.reshape(-1, 3)
+
+    # Na esfera unitária a normal é a própria posição
+    vertices = np.hstack([positions, positions])
+
+    # Dois triângulos por quad da grade, no sentido anti-horário visto de fora
+    row = np.arange(stacks)[:, None] * (slices + 1)
+    col = np.arange(slices)[None, :]
+    top_left = (row + col).ravel()
+    top_right = top_left + 1
+    bottom_left = top_left + slices + 1
+    bottom_right = bottom_left + 1
+    first = np.column_stack([top_left, bottom_left, bottom_right]).reshape(stacks, slices, 3)
+    second = np.column_stack([top_left, bottom_right, top_right]).reshape(stacks, slices, 3)
+
+    # Nos polos um dos triângulos de cada quad é degenerado
+    indices = np.concatenate([first[0].ravel(),
+                              np.stack([first[1:-1], second[1:-1]], axis=2).ravel(),
+                              second[-1].ravel()])
+    return vertices, indices.astype(np.uint16)
+
+
+class SphereMeshCache:
+    """Vertex buffers de esferas unitárias, um por nível de detalhe."""
+
+    # (fatias, pilhas) do menos ao mais detalhado; o último equivale ao
+    # gluSphere(16, 16) usado antes
+    LEVELS = ((6, 4), (10, 6), (12, 10), (16, 16))
+
+    # Raio projetado mínimo (pixels) para usar cada nível acima do primeiro
+    LEVEL_PIXELS = (6.0, 16.0, 48.0)
+
+    def __init__(self):
+        """Inicializa sem buffers; eles são criados no primeiro desenho (requer contexto GL)."""
+        self._meshes = {}  # nível -> (vbo, ibo, número de índices)
+
+    def level_for(self, radius, distance, fov_y=45.0, viewport_height=600):
+        """
+        Escolhe o nível de detalhe pelo tamanho projetado na tela.
+
+        Args:
+            radius: Raio da esfera
+            distance: Distância da câmera ao centro (None usa o nível máximo)
+            fov_y: Campo de visão vertical da câmera em graus
+            viewport_height: Altura da janela em pixels
+
+        Returns:
+            int: Índice em LEVELS
+        """
+        if distance is None:
+            return len(self.LEVELS) - 1
+        distance = max(distance, radius, 1e-6)
+        pixels = radius / (distance * math.tan(math.radians(fov_y) / 2)) * viewport_height / 2
+        return int(np.searchsorted(self.LEVEL_PIXELS, pixels, side='right'))
+
+    def _upload(self, level):
+        """Gera e envia a malha de um nível para a GPU (executado uma única vez)."""
+        vertices, indices = build_uv_sphere(*self.LEVELS[level])
+
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        ibo = glGenBuffers(1)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+        self._meshes[level] = (vbo, ibo, len(indices))
+        return self._meshes[level]
+
+    def draw(self, radius, level=None):
+        """
+        Desenha uma esfera na origem da matriz atual.
+
+        Args:
+            radius: Raio da esfera
+            level: Nível de detalhe (None usa o máximo)
+        """
+        if level is None:
+            level = len(self.LEVELS) - 1
+        vbo, ibo, index_count = self._meshes.get(level) or self._upload(level)
+
+        glPushMatrix()
+        glScalef(radius, radius, radius)
+
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glInterleavedArrays(GL_N3F_V3F, 0, None)
+        glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_SHORT, None)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glPopMatrix()
+
+    def release(self):
+        """Apaga os buffers da GPU."""
+        buffers = [buffer for vbo, ibo, _ in self._meshes.values() for buffer in (vbo, ibo)]
+        if buffers:
+            glDeleteBuffers(len(buffers), buffers)
+        self._meshes.clear()
+
+
+# Instância global usada pela bola de luz e pelos inimigos esféricos
+sphere_meshes = SphereMeshCache()
@@ -0,0 +1,141 @@
+"""
+Lote de billboards (sprites virados para a câmera).
+
+Os elementos adicionam instâncias (posição e tamanho em arrays NumPy) ao
+longo do quadro; draw() monta todos os quads em uma passagem vetorizada e
+desenha cada textura com uma única chamada, de trás para frente para que o
+blending fique correto.
+"""
+
+from OpenGL.GL import *
+import numpy as np
+from .gl_state import gl_state
+
+
+# Cantos do quad: deslocamento lateral, vertical e coordenadas de textura
+_CORNER_SIDE = np.array([-1, 1, 1, -1], dtype=np.float32)
+_CORNER_UP = np.array([-1, -1, 1, 1], dtype=np.float32)
+_CORNER_U = np.array([0, 1, 1, 0], dtype=np.float32)
+_CORNER_V = np.array([0, 0, 1, 1], dtype=np.float32)
+
+
+def build_billboards(positions, sizes, camera_x, camera_z):
+    """
+    Monta quads verticais virados para a câmera (giram apenas em torno de Y).
+
+    Args:
+        positions: Array (N, 3) com o centro de cada billboard
+        sizes: Array (N,) com o lado de cada billboard
+        camera_x: Posição X da câmera
+        camera_z: Posição Z da câmera
+
+    Returns:
+        numpy.ndarray: Array float32 (N * 4, 5) no formato GL_T2F_V3F
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    half_size = np.broadcast_to(np.asarray(sizes, dtype=np.float64), len(positions)) / 2
+
+    dx = camera_x - positions[:, 0]
+    dz = camera_z - positions[:, 2]
+    distance = np.sqrt(dx * dx + dz * dz)
+    distance[distance < 1e-6] = 1.0
+
+    # Vetor "direita" perpendicular à direção billboard -> câmera
+    right_x = dz / distance * half_size
+    right_z = -dx / distance * half_size
+
+    vertices = np.empty((len(positions), 4, 5), dtype=np.float32)
+    vertices[:, :, 0] = _CORNER_U
+    vertices[:, :, 1] = _CORNER_V
+    vertices[:, :, 2] = positions[:, 0, None] + right_x[:, None] * _CORNER_SIDE
+    vertices[:, :, 3] = positions[:, 1, None] + half_size[:, None] * _CORNER_UP
+    vertices[:, :, 4] = positions[:, 2, None] + right_z[:, None] * _CORNER_SIDE
+    return vertices.reshape(-1, 5)
+
+
+class SpriteBatch:
+    """Coleta billboards durante o quadro e os desenha agrupados por textura."""
+
+    def __init__(self):
+        """Inicializa o lote vazio."""
+        self._groups = {}  # (texture_id, cor) -> listas de posições e tamanhos
+        self.draw_calls = 0  # Chamadas de desenho no último draw()
+        self.sprite_count = 0  # Billboards desenhados no último draw()
+
+    def begin(self):
+        """Esvazia o lote para um novo quadro."""
+        self._groups.clear()
+
+    def add(self, texture_id, positions, sizes, color=(1.0, 1.0, 1.0, 1.0)):
+        """
+        Adiciona billboards ao lote.
+
+        Args:
+            texture_id: Textura dos billboards (None desenha sem textura)
+            positions: Array (N, 3) ou posição única (x, y, z)
+            sizes: Tamanho único ou array (N,) de tamanhos
+            color: Cor [r, g, b, a] aplicada ao grupo
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        if len(positions) == 0:
+            return
+        sizes = np.broadcast_to(np.asarray(sizes, dtype=np.float64), len(positions))
+
+        group = self._groups.setdefault((texture_id or 0, tuple(color)), ([], []))
+        group[0].append(positions)
+        group[1].append(sizes)
+
+    def draw(self, camera_x, camera_z):
+        """
+        Desenha todos os billboards do lote com blending.
+
+        Cada grupo é ordenado de trás para frente e desenhado com uma única
+        chamada; os grupos são desenhados do mais distante para o mais próximo.
+
+        Args:
+            camera_x: Posição X da câmera
+            camera_z: Posição Z da câmera
+        """
+        self.draw_calls = 0
+        self.sprite_count = 0
+        if not self._groups:
+            return
+
+        batches = []
+        for (texture_id, color), (positions, sizes) in self._groups.items():
+            positions = np.concatenate(positions)
+            sizes = np.concatenate(sizes)
+
+            dx = positions[:, 0] - camera_x
+            dz = positions[:, 2] - camera_z
+            distance_sq = dx * dx + dz * dz
+            order = np.argsort(distance_sq)[::-1]
+
+            vertices = build_billboards(positions[order], sizes[order], camera_x, camera_z)
+            batches.append((distance_sq[order[0]], texture_id, color, vertices))
+        batches.sort(key=lambda batch: batch[0], reverse=True)
+
+        gl_state.enable(GL_BLEND)
+        gl_state.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        for _, texture_id, color, vertices in batches:
+            if texture_id:
+                gl_state.enable(GL_TEXTURE_2D)
+                gl_state.bind_texture(texture_id)
+            else:
+                gl_state.disable(GL_TEXTURE_2D)
+            glColor4f(*color)
+
+            glInterleavedArrays(GL_T2F_V3F, 0, vertices)
+            glDrawArrays(GL_QUADS, 0, len(vertices))
+            self.draw_calls += 1
+            self.sprite_count += len(vertices) // 4
+
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        gl_state.disable(GL_TEXTURE_2D)
+        gl_state.disable(GL_BLEND)
+
+
+# Instância global usada pelos inimigos e outros sprites do cenário
+sprite_batch = SpriteBatch()
@@ -0,0 +1,234 @@
+"""
+Serviço de renderização de texto.
+
+Textos estáticos (títulos, rótulos, opções) são rasterizados uma vez e
+guardados em um cache LRU indexado por (fonte, tamanho, texto, cor). Textos
+dinâmicos (valores que mudam a cada quadro) são montados a partir de um
+atlas de glifos, sem chamar font.render. Para a sobreposição OpenGL, as
+superfícies também podem ser enviadas como texturas, com o mesmo cache.
+"""
+
+from collections import OrderedDict
+from OpenGL.GL import *
+import pygame
+from .gl_state import gl_state
+
+
+class GlyphAtlas:
+    """Folha com os glifos de uma fonte em uma cor, montada sob demanda."""
+
+    SHEET_WIDTH = 512
+
+    def __init__(self, font, color):
+        """
+        Inicializa o atlas vazio.
+
+        Args:
+            font: pygame.font.Font usada para rasterizar os glifos
+            color: Cor (r, g, b) dos glifos
+        """
+        self.font = font
+        self.color = color
+        self.line_height = font.get_height()
+        self.sheet = pygame.Surface((self.SHEET_WIDTH, self.line_height), pygame.SRCALPHA)
+        self.glyphs = {}  # caractere -> (retângulo na folha, avanço)
+        self._cursor_x = 0
+        self._cursor_y = 0
+
+    def _add_glyph(self, char):
+        """Rasteriza um glifo e o copia para a próxima posição livre da folha."""
+        surface = self.font.render(char, True, self.color)
+        metrics = self.font.metrics(char)[0]
+        advance = metrics[4] if metrics else surface.get_width()
+        width = surface.get_width()
+
+        if self._cursor_x + width > self.SHEET_WIDTH:
+            self._cursor_x = 0
+            self._cursor_y += self.line_height
+        if self._cursor_y + self.line_height > self.sheet.get_height():
+            grown = pygame.Surface((self.SHEET_WIDTH, self.sheet.get_height() * 2), pygame.SRCALPHA)
+            grown.blit(self.sheet, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.sheet = grown
+
+        rect = pygame.Rect(self._cursor_x, self._cursor_y, width, surface.get_height())
+        self.sheet.blit(surface, rect.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        self._cursor_x += width
+        self.glyphs[char] = (rect, advance)
+        return self.glyphs[char]
+
+    def render(self, text):
+        """
+        Monta um texto a partir dos glifos (sem kerning).
+
+        Args:
+            text: Texto de uma linha
+
+        Returns:
+            pygame.Surface: Superfície com canal alfa
+        """
+        glyphs = [self.glyphs.get(char) or self._add_glyph(char) for char in text]
+        width = sum(advance for _, advance in glyphs)
+        if glyphs:
+            # O último glifo pode ser mais largo que seu avanço
+            width = max(width, width - glyphs[-1][1] + glyphs[-1][0].width)
+
+        surface = pygame.Surface((max(width, 1), self.line_height), pygame.SRCALPHA)
+        x = 0
+        for rect, advance in glyphs:
+            # Destino transparente: o máximo copia o glifo sem escurecer as bordas
+            surface.blit(self.sheet, (x, 0), rect, special_flags=pygame.BLEND_RGBA_MAX)
+            x += advance
+        return surface
+
+
+class TextRenderer:
+    """Cache compartilhado de fontes, textos rasterizados e texturas de texto."""
+
+    def __init__(self, max_entries=256):
+        """
+        Inicializa o serviço.
+
+        Args:
+            max_entries: Número máximo de textos estáticos mantidos no cache LRU
+        """
+        self.max_entries = max_entries
+        self._fonts = {}
+        self._surfaces = OrderedDict()
+        self._atlases = {}
+        self._textures = {}
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size, name=None):
+        """
+        Obtém (em cache) uma fonte.
+
+        Args:
+            size: Tamanho da fonte
+            name: Caminho da fonte (None usa a fonte padrão do pygame)
+
+        Returns:
+            pygame.font.Font: Fonte carregada
+        """
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            pygame.font.init()
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+
+    def render(self, text, size, color, name=None):
+        """
+        Obtém a superfície de um texto estático, rasterizando-o só na primeira vez.
+
+        A superfície retornada é compartilhada e não deve ser modificada.
+
+        Args:
+            text: Texto de uma linha
+            size: Tamanho da fonte
+            color: Cor (r, g, b)
+            name: Caminho da fonte (None usa a fonte padrão do pygame)
+
+        Returns:
+            pygame.Surface: Texto rasterizado com antialiasing
+        """
+        key = (name, size, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.font(size, name).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def render_dynamic(self, text, size, color, name=None):
+        """
+        Monta um texto que muda com frequência (números, porcentagens) a
+        partir do atlas de glifos, sem ocupar o cache de textos estáticos.
+
+        Args:
+            text: Texto de uma linha
+            size: Tamanho da fonte
+            color: Cor (r, g, b)
+            name: Caminho da fonte (None usa a fonte padrão do pygame)
+
+        Returns:
+            pygame.Surface: Texto montado
+        """
+        key = (name, size, tuple(color))
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = GlyphAtlas(self.font(size, name), tuple(color))
+            self._atlases[key] = atlas
+        return atlas.render(text)
+
+    def size(self, text, size, name=None):
+        """
+        Mede um texto sem rasterizá-lo.
+
+        Returns:
+            tuple: (largura, altura) em pixels
+        """
+        return self.font(size, name).size(text)
+
+    def texture(self, text, size, color, name=None):
+        """
+        Obtém (em cache) uma textura OpenGL com o texto, para sobreposições.
+
+        Requer um contexto OpenGL ativo.
+
+        Returns:
+            tuple: (texture_id, largura, altura)
+        """
+        key = (name, size, text, tuple(color))
+        entry = self._textures.get(key)
+        if entry is not None:
+            return entry
+
+        surface = self.render(text, size, color, name)
+        texture_data = pygame.image.tostring(surface, "RGBA", True)
+        width = surface.get_width()
+        height = surface.get_height()
+
+        texture_id = glGenTextures(1)
+        gl_state.bind_texture(texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, texture_data)
+
+        entry = (texture_id, width, height)
+        self._textures[key] = entry
+        return entry
+
+    def release_textures(self):
+        """Apaga as texturas de texto (antes de destruir o contexto OpenGL)."""
+        texture_ids = [entry[0] for entry in self._textures.values()]
+        if texture_ids:
+            glDeleteTextures(texture_ids)
+            gl_state.forget_textures(texture_ids)
+        self._textures.clear()
+
+    def stats(self):
+        """
+        Obtém estatísticas de uso do cache.
+
+        Returns:
+            dict: 'hits', 'misses', 'surfaces', 'glyphs' e 'textures'
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'surfaces': len(self._surfaces),
+            'glyphs': sum(len(atlas.glyphs) for atlas in self._atlases.values()),
+            'textures': len(self._textures),
+        }
+
+
+# Instância global usada pelas telas e pela sobreposição do jogo
+text_renderer = TextRenderer()
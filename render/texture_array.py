@@ -0,0 +1,178 @@
+"""
+Array de texturas do cenário.
+
+As texturas desenhadas na passagem do cenário (piso, paredes, teto, grama
+e céu) são empilhadas em um único GL_TEXTURE_2D_ARRAY, uma camada por
+imagem, todas com a resolução da maior delas e cadeia de mipmaps próprias.
+O array usa os mesmos parâmetros de amostragem padrão de texture_cache
+(GL_REPEAT, GL_LINEAR_MIPMAP_LINEAR, GL_LINEAR), então superfícies que
+repetem a textura continuam usando as mesmas coordenadas UV; o shader
+escolhe a camada por um uniform. A passagem do cenário vincula o array uma
+única vez, em vez de uma textura por elemento.
+
+Requer OpenGL 3.0 ou GL_EXT_texture_array; sem suporte, cada elemento
+continua usando sua própria textura.
+"""
+
+import os
+from OpenGL.GL import *
+from .gl_state import gl_state
+from .texture_cache import texture_cache
+from .texture_preprocess import load_or_build
+
+
+# Texturas de Floor, Wall (e das malhas de parede), Ceiling e Outside; o
+# inimigo usa GL_CLAMP e é desenhado fora da passagem, então fica de fora
+WORLD_TEXTURES = (
+    "assets/textures/floor.png",
+    "assets/textures/wall.png",
+    "assets/textures/ceiling.png",
+    "assets/textures/grass.png",
+    "assets/textures/sky.png",
+)
+
+# Parâmetros de amostragem do array: (wrap, min_filter, mag_filter)
+SAMPLER = (GL_REPEAT, GL_LINEAR_MIPMAP_LINEAR, GL_LINEAR)
+
+
+class TextureArray:
+    """Texturas de mesmo tamanho empilhadas em camadas de um GL_TEXTURE_2D_ARRAY."""
+
+    UNIT = 1  # Unidade de textura do array (a unidade 0 fica com as texturas avulsas)
+
+    def __init__(self, paths=WORLD_TEXTURES, layer_size=None):
+        """
+        Inicializa o array; as imagens só são enviadas no primeiro bind().
+
+        Args:
+            paths: Caminhos das imagens que formam as camadas
+            layer_size: (largura, altura) opcional de cada camada, em potências
+                        de dois; por padrão, a da maior imagem pré-processada
+        """
+        self.paths = [os.path.normpath(path) for path in paths]
+        self.layer_size = layer_size
+        self.texture_id = None
+        self.failed = False
+        self._layers = {path: layer for layer, path in enumerate(self.paths)}
+
+    @staticmethod
+    def supported():
+        """
+        Verifica se o driver oferece arrays de texturas (requer contexto GL).
+
+        Returns:
+            bool: True com OpenGL 3.0+ ou GL_EXT_texture_array
+        """
+        try:
+            version = glGetString(GL_VERSION) or b""
+            if int(version.split(b".")[0]) >= 3:
+                return True
+            extensions = glGetString(GL_EXTENSIONS) or b""
+            return b"GL_EXT_texture_array" in extensions.split()
+        except Exception:
+            return False
+
+    def _upload(self):
+        """Pré-processa as imagens e as envia camada por camada, nível por nível."""
+        # Cadeias no tamanho natural (as mesmas de texture_cache); só as menores
+        # que a camada são pré-processadas de novo no tamanho do array
+        chains = [load_or_build(path, repeat=True) for path in self.paths]
+        if not chains or any(chain is None for chain in chains):
+            print("Could not build world texture array")
+            return None
+
+        width, height = self.layer_size or (max(chain.width for chain in chains),
+                                            max(chain.height for chain in chains))
+        for layer, path in enumerate(self.paths):
+            if (chains[layer].width, chains[layer].height) != (width, height):
+                chains[layer] = load_or_build(path, size=(width, height), repeat=True)
+        if any(chain is None for chain in chains):
+            print("Could not build world texture array")
+            return None
+
+        texture_id = glGenTextures(1)
+        gl_state.active_texture(self.UNIT)
+        gl_state.bind_texture(texture_id, GL_TEXTURE_2D_ARRAY)
+        wrap, min_filter, mag_filter = SAMPLER
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MIN_FILTER, min_filter)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAG_FILTER, mag_filter)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_S, wrap)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_WRAP_T, wrap)
+        glTexParameteri(GL_TEXTURE_2D_ARRAY, GL_TEXTURE_MAX_LEVEL, len(chains[0].levels) - 1)
+
+        for level in range(len(chains[0].levels)):
+            level_width = max(1, width >> level)
+            level_height = max(1, height >> level)
+            glTexImage3D(GL_TEXTURE_2D_ARRAY, level, GL_RGBA8, level_width, level_height, len(chains),
+                         0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+            for layer, chain in enumerate(chains):
+                glTexSubImage3D(GL_TEXTURE_2D_ARRAY, level, 0, 0, layer, level_width, level_height, 1,
+                                GL_RGBA, GL_UNSIGNED_BYTE, chain.levels[level])
+
+        gl_state.active_texture(0)
+        return texture_id
+
+    def bind(self):
+        """
+        Vincula o array à sua unidade, enviando-o na primeira chamada.
+
+        Returns:
+            bool: True se o array está pronto
+        """
+        if self.texture_id is None and not self.failed:
+            try:
+                self.texture_id = self._upload()
+            except Exception as e:
+                print(f"Could not upload world texture array: {e}")
+                gl_state.active_texture(0)
+                self.texture_id = None
+            self.failed = self.texture_id is None
+        if self.texture_id is None:
+            return False
+
+        gl_state.active_texture(self.UNIT)
+        gl_state.bind_texture(self.texture_id, GL_TEXTURE_2D_ARRAY)
+        gl_state.active_texture(0)
+        return True
+
+    def layer_of(self, path, wrap=GL_REPEAT, min_filter=GL_LINEAR_MIPMAP_LINEAR, mag_filter=GL_LINEAR):
+        """
+        Obtém a camada que substitui uma textura de texture_cache.acquire().
+
+        Args:
+            path: Caminho da imagem
+            wrap: Modo de repetição pedido
+            min_filter: Filtro de minificação pedido
+            mag_filter: Filtro de magnificação pedido
+
+        Returns:
+            int: Índice da camada, ou None se a imagem não está no array ou se
+            os parâmetros de amostragem diferem dos do array
+        """
+        if path is None or (wrap, min_filter, mag_filter) != SAMPLER:
+            return None
+        return self._layers.get(os.path.normpath(path))
+
+    def layer_of_texture(self, texture_id):
+        """
+        Obtém a camada equivalente a uma textura já carregada no texture_cache.
+
+        Args:
+            texture_id: ID retornado por texture_cache.acquire()
+
+        Returns:
+            int: Índice da camada, ou None (ver layer_of)
+        """
+        key = texture_cache.key_of(texture_id)
+        return self.layer_of(*key) if key else None
+
+    def release(self):
+        """Apaga o array da GPU."""
+        if self.texture_id is not None:
+            glDeleteTextures([self.texture_id])
+            gl_state.forget_textures([self.texture_id])
+            self.texture_id = None
+
+
+# Instância global com as texturas do cenário
+world_textures = TextureArray()
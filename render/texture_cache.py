@@ -0,0 +1,153 @@
+"""
+Cache compartilhado de texturas OpenGL.
+
+Cada textura é enviada à GPU uma única vez por combinação de caminho e
+parâmetros de amostragem, a partir da cadeia de mipmaps pré-processada
+(ver texture_preprocess). Os elementos do cenário obtêm o ID com
+acquire() e o devolvem com release(); a textura é apagada da GPU quando a
+última referência é liberada.
+"""
+
+from OpenGL.GL import *
+from .gl_state import gl_state
+from .texture_preprocess import load_or_build
+import os
+
+
+# Filtros de minificação que amostram os níveis de mipmap
+MIPMAP_FILTERS = (GL_NEAREST_MIPMAP_NEAREST, GL_LINEAR_MIPMAP_NEAREST,
+                  GL_NEAREST_MIPMAP_LINEAR, GL_LINEAR_MIPMAP_LINEAR)
+
+
+class TextureCache:
+    """Registro de texturas indexado por caminho e parâmetros de amostragem."""
+
+    def __init__(self):
+        """Inicializa o cache vazio."""
+        self._entries = {}  # chave -> [texture_id, contagem de referências]
+        self._keys_by_id = {}  # texture_id -> chave
+        self.headless = False  # Sem contexto OpenGL: acquire() não carrega nada
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _make_key(path, wrap, min_filter, mag_filter):
+        """Cria a chave do cache a partir do caminho e dos parâmetros."""
+        return (os.path.normpath(path), wrap, min_filter, mag_filter)
+
+    def acquire(self, path, wrap=GL_REPEAT, min_filter=GL_LINEAR_MIPMAP_LINEAR, mag_filter=GL_LINEAR):
+        """
+        Obtém uma textura, carregando-a apenas se ainda não estiver no cache.
+
+        Args:
+            path: Caminho do arquivo de imagem
+            wrap: Modo de repetição para S e T (GL_REPEAT, GL_CLAMP, ...)
+            min_filter: Filtro de minificação (filtros com mipmap usam a cadeia completa)
+            mag_filter: Filtro de magnificação
+
+        Returns:
+            int: ID da textura OpenGL, ou None se não puder ser carregada
+            (sempre None no modo headless)
+        """
+        if self.headless:
+            return None
+
+        key = self._make_key(path, wrap, min_filter, mag_filter)
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1] += 1
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        texture_id = self._load(path, wrap, min_filter, mag_filter)
+        if texture_id is None:
+            return None
+
+        self._entries[key] = [texture_id, 1]
+        self._keys_by_id[texture_id] = key
+        return texture_id
+
+    def release(self, texture_id):
+        """
+        Libera uma referência a uma textura obtida com acquire().
+
+        Args:
+            texture_id: ID retornado por acquire() (None é ignorado)
+        """
+        key = self._keys_by_id.get(texture_id)
+        if key is None:
+            return
+
+        entry = self._entries[key]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            glDeleteTextures([texture_id])
+            gl_state.forget_textures([texture_id])
+            del self._entries[key]
+            del self._keys_by_id[texture_id]
+
+    def key_of(self, texture_id):
+        """
+        Obtém a chave (caminho e parâmetros de amostragem) de uma textura carregada.
+
+        Returns:
+            tuple: (caminho normalizado, wrap, min_filter, mag_filter), ou None
+            se o ID não pertence ao cache
+        """
+        return self._keys_by_id.get(texture_id)
+
+    def clear(self):
+        """Apaga todas as texturas do cache, independentemente das referências."""
+        if self._keys_by_id:
+            glDeleteTextures(list(self._keys_by_id))
+            gl_state.forget_textures(self._keys_by_id)
+        self._entries.clear()
+        self._keys_by_id.clear()
+
+    def stats(self):
+        """
+        Obtém estatísticas de uso do cache.
+
+        Returns:
+            dict: 'hits', 'misses', 'textures' (carregadas) e 'references' (ativas)
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'textures': len(self._entries),
+            'references': sum(entry[1] for entry in self._entries.values()),
+        }
+
+    @staticmethod
+    def _load(path, wrap, min_filter, mag_filter):
+        """Obtém a cadeia de mipmaps pré-processada e a envia para a GPU."""
+        if not os.path.exists(path):
+            return None
+
+        chain = load_or_build(path, repeat=wrap == GL_REPEAT)
+        if chain is None:
+            return None
+
+        try:
+            texture_id = glGenTextures(1)
+            gl_state.bind_texture(texture_id)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, min_filter)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, mag_filter)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, wrap)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, wrap)
+
+            # Sem filtro de mipmap, só o nível 0 é amostrado
+            levels = chain.levels if min_filter in MIPMAP_FILTERS else chain.levels[:1]
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(levels) - 1)
+            for level, image in enumerate(levels):
+                height, width = image.shape[:2]
+                glTexImage2D(GL_TEXTURE_2D, level, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, image)
+            return texture_id
+        except Exception as e:
+            print(f"Could not load texture {path}: {e}")
+            return None
+
+
+# Instância global do cache de texturas
+texture_cache = TextureCache()
@@ -0,0 +1,232 @@
+"""
+Pré-processamento de texturas para a GPU.
+
+Cada imagem é redimensionada para potências de dois, recebe uma cadeia
+completa de mipmaps (filtro de caixa em NumPy) e é salva em um arquivo
+binário cru em .cache/textures, indexado pelo hash do arquivo de origem.
+Nas execuções seguintes o arquivo é mapeado em memória e os níveis são
+enviados direto para glTexImage2D, sem decodificar o PNG.
+
+Pode ser executado antes do jogo para preparar o cache:
+
+    python -m render.texture_preprocess assets/textures/*.png
+"""
+
+import hashlib
+import math
+import os
+import struct
+import sys
+import numpy as np
+import pygame
+
+
+CACHE_VERSION = 2
+CACHE_DIR = ".cache/textures"
+MAX_SIZE = 1024  # Lado máximo do nível 0
+
+# Cabeçalho: assinatura, versão, largura, altura e número de níveis
+_HEADER = struct.Struct("<4sIIII")
+_MAGIC = b"MIPS"
+
+
+def source_hash(path, size=None, repeat=False):
+    """Calcula o hash que identifica o conteúdo da imagem e os parâmetros do pré-processamento."""
+    digest = hashlib.sha1(f"{CACHE_VERSION}:{MAX_SIZE}:{size}:{repeat}:".encode("utf-8"))
+    with open(path, "rb") as source:
+        digest.update(source.read())
+    return digest.hexdigest()
+
+
+def power_of_two(size):
+    """Potência de dois mais próxima (em escala logarítmica), limitada a MAX_SIZE."""
+    return min(MAX_SIZE, 1 << max(0, round(math.log2(max(size, 1)))))
+
+
+def decode_rgba(path):
+    """
+    Decodifica uma imagem em RGBA, com a primeira linha embaixo como o OpenGL espera.
+
+    Returns:
+        numpy.ndarray: Array uint8 (altura, largura, 4)
+    """
+    surface = pygame.image.load(path)
+    data = pygame.image.tostring(surface, "RGBA", True)
+    return np.frombuffer(data, dtype=np.uint8).reshape(surface.get_height(), surface.get_width(), 4)
+
+
+def _resample_axis(image, size, axis, repeat=False):
+    """
+    Reamostra um eixo com interpolação linear (centros de pixel alinhados).
+
+    Com repeat, as bordas são interpoladas com o lado oposto, como a textura
+    é amostrada com GL_REPEAT; sem ele, os pixels da borda são estendidos.
+    """
+    old_size = image.shape[axis]
+    if old_size == size:
+        return image
+
+    positions = (np.arange(size) + 0.5) * old_size / size - 0.5
+    if repeat:
+        lower = np.floor(positions).astype(np.intp)
+        weight = (positions - lower).astype(np.float32)
+        upper = (lower + 1) % old_size
+        lower = lower % old_size
+    else:
+        positions = np.clip(positions, 0, old_size - 1)
+        lower = np.floor(positions).astype(np.intp)
+        upper = np.minimum(lower + 1, old_size - 1)
+        weight = (positions - lower).astype(np.float32)
+
+    shape = [1] * image.ndim
+    shape[axis] = size
+    weight = weight.reshape(shape)
+    return np.take(image, lower, axis=axis) * (1 - weight) + np.take(image, upper, axis=axis) * weight
+
+
+def _premultiply(rgba):
+    """Converte RGBA uint8 em float32 com cor multiplicada pelo alfa."""
+    image = rgba.astype(np.float32) / 255.0
+    image[..., :3] *= image[..., 3:4]
+    return image
+
+
+def _unpremultiply(image):
+    """Converte de volta para RGBA uint8 com alfa direto."""
+    alpha = image[..., 3:4]
+    color = np.divide(image[..., :3], alpha, out=np.zeros_like(image[..., :3]), where=alpha > 1e-6)
+    result = np.concatenate([color, alpha], axis=-1)
+    return np.clip(result * 255.0 + 0.5, 0, 255).astype(np.uint8)
+
+
+def build_mip_chain(rgba, size=None, repeat=False):
+    """
+    Redimensiona para potências de dois e gera todos os níveis de mipmap.
+
+    A média é feita com cor pré-multiplicada pelo alfa, para que pixels
+    transparentes não escureçam as bordas dos sprites.
+
+    Args:
+        rgba: Array uint8 (altura, largura, 4)
+        size: (largura, altura) opcional do nível 0, em potências de dois;
+              por padrão, a potência de dois mais próxima de cada lado
+        repeat: Se True, a imagem é tratada como ladrilho (GL_REPEAT) ao
+                redimensionar, sem costura nas bordas entre repetições
+
+    Returns:
+        list: Arrays uint8 (altura, largura, 4), do nível 0 até 1x1
+    """
+    height, width = rgba.shape[:2]
+    width, height = size or (power_of_two(width), power_of_two(height))
+    image = _premultiply(rgba)
+    image = _resample_axis(image, height, 0, repeat)
+    image = _resample_axis(image, width, 1, repeat)
+
+    levels = [_unpremultiply(image)]
+    while image.shape[0] > 1 or image.shape[1] > 1:
+        # Filtro de caixa 2x2 (2x1 ou 1x2 quando um dos lados já é 1)
+        if image.shape[0] > 1:
+            image = (image[0::2] + image[1::2]) / 2
+        if image.shape[1] > 1:
+            image = (image[:, 0::2] + image[:, 1::2]) / 2
+        levels.append(_unpremultiply(image))
+    return levels
+
+
+class MipChain:
+    """Níveis de mipmap prontos para envio, possivelmente mapeados de um arquivo."""
+
+    def __init__(self, levels):
+        """
+        Inicializa a cadeia.
+
+        Args:
+            levels: Arrays uint8 (altura, largura, 4), do nível 0 até 1x1
+        """
+        self.levels = levels
+        self.width = levels[0].shape[1]
+        self.height = levels[0].shape[0]
+
+    def save(self, path):
+        """Grava o cabeçalho e os níveis em sequência em um arquivo binário cru."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = path + ".tmp"
+        with open(temporary, "wb") as output:
+            output.write(_HEADER.pack(_MAGIC, CACHE_VERSION, self.width, self.height, len(self.levels)))
+            for level in self.levels:
+                output.write(np.ascontiguousarray(level).tobytes())
+        os.replace(temporary, path)
+
+    @classmethod
+    def open(cls, path):
+        """
+        Mapeia um arquivo salvo com save() sem copiá-lo para a memória.
+
+        Returns:
+            MipChain: Cadeia cujos níveis são visões do arquivo mapeado
+        """
+        with open(path, "rb") as source:
+            magic, version, width, height, count = _HEADER.unpack(source.read(_HEADER.size))
+        if magic != _MAGIC or version != CACHE_VERSION:
+            raise ValueError(f"{path} is not a version {CACHE_VERSION} mip cache")
+
+        data = np.memmap(path, dtype=np.uint8, mode="r", offset=_HEADER.size)
+        levels = []
+        offset = 0
+        for _ in range(count):
+            size = height * width * 4
+            levels.append(data[offset:offset + size].reshape(height, width, 4))
+            offset += size
+            width = max(1, width // 2)
+            height = max(1, height // 2)
+        if offset != len(data):
+            raise ValueError(f"{path} has an unexpected size")
+        return cls(levels)
+
+
+def load_or_build(path, cache_dir=None, size=None, repeat=False):
+    """
+    Obtém a cadeia de mipmaps de uma imagem, do cache ou pré-processando-a.
+
+    Args:
+        path: Caminho da imagem de origem
+        cache_dir: Diretório do cache (padrão CACHE_DIR)
+        size: (largura, altura) opcional do nível 0 (ver build_mip_chain)
+        repeat: Se True, redimensiona como ladrilho (texturas com GL_REPEAT)
+
+    Returns:
+        MipChain: Cadeia pronta para envio, ou None se a imagem não puder ser lida
+    """
+    try:
+        cache_path = os.path.join(cache_dir or CACHE_DIR, source_hash(path, size, repeat) + ".mip")
+    except OSError as e:
+        print(f"Could not read texture {path}: {e}")
+        return None
+
+    if os.path.exists(cache_path):
+        try:
+            return MipChain.open(cache_path)
+        except Exception as e:
+            print(f"Could not load texture cache {cache_path}: {e}")
+
+    try:
+        chain = MipChain(build_mip_chain(decode_rgba(path), size, repeat))
+    except Exception as e:
+        print(f"Could not preprocess texture {path}: {e}")
+        return None
+
+    try:
+        chain.save(cache_path)
+    except Exception as e:
+        print(f"Could not save texture cache: {e}")
+    return chain
+
+
+if __name__ == "__main__":
+    # Texturas do cenário são repetidas (GL_REPEAT, o padrão de texture_cache.acquire)
+    for image_path in sys.argv[1:]:
+        mip_chain = load_or_build(image_path, repeat=True)
+        if mip_chain is not None:
+            print(f"{image_path}: {mip_chain.width}x{mip_chain.height}, {len(mip_chain.levels)} levels")
@@ -0,0 +1,50 @@
+class FixedTimestep:
+    """
+    Acumulador de tempo para uma simulação em passos fixos.
+
+    Cada quadro soma o tempo real decorrido e executa quantos passos fixos
+    couberem; a sobra vira o fator de interpolação usado na renderização
+    entre os dois últimos estados simulados. Após um travamento, no máximo
+    max_steps passos são executados e o atraso restante é descartado (o jogo
+    desacelera em vez de entrar em uma espiral de passos de recuperação).
+    """
+
+    def __init__(self, rate=60, max_steps=5):
+        """
+        Inicializa o acumulador vazio.
+
+        Args:
+            rate: Passos de simulação por segundo (Hz)
+            max_steps: Máximo de passos executados em um único quadro
+        """
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_time):
+        """
+        Soma o tempo de um quadro e calcula quantos passos executar.
+
+        Args:
+            frame_time: Tempo real decorrido desde o último quadro em segundos
+
+        Returns:
+            int: Número de passos de duração self.step a executar agora
+        """
+        self.accumulator += max(frame_time, 0.0)
+        steps = min(int(self.accumulator / self.step), self.max_steps)
+        self.accumulator -= steps * self.step
+        if self.accumulator >= self.step:
+            # Atraso além do limite de recuperação: descarta
+            self.accumulator %= self.step
+        return steps
+
+    @property
+    def alpha(self):
+        """Fração do próximo passo já decorrida (0 = último estado anterior, 1 = atual)."""
+        return min(self.accumulator / self.step, 1.0)
+
+
+def lerp(previous, current, alpha):
+    """Interpola linearmente entre dois estados (números ou arrays NumPy)."""
+    return previous + (current - previous) * alpha
@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+import pygame
+
+
+def wait_for_events(timeout=None):
+    """
+    Bloqueia até chegar um evento ou o tempo acabar, sem girar a CPU.
+
+    Args:
+        timeout: Tempo máximo de espera em segundos (None espera indefinidamente)
+
+    Returns:
+        list: Eventos pendentes (vazia se o tempo acabou)
+    """
+    if timeout is None:
+        event = pygame.event.wait()
+    else:
+        event = pygame.event.wait(max(1, int(timeout * 1000)))
+
+    events = [] if event.type == pygame.NOEVENT else [event]
+    events.extend(pygame.event.get())
+    return events
+
+
+class RetainedScreen(ABC):
+    """
+    Base para telas 2D redesenhadas apenas onde mudaram.
+
+    Cada tela descreve suas regiões em regions() como {nome: (retângulo,
+    estado)}. present() compara o estado de cada região com o do último
+    desenho e redesenha (com recorte) só as regiões que mudaram, enviando
+    à janela apenas esses retângulos.
+    """
+
+    def __init__(self, width, height):
+        """
+        Inicializa a tela com redesenho completo pendente.
+
+        Args:
+            width: Largura da tela
+            height: Altura da tela
+        """
+        self.width = width
+        self.height = height
+        self._drawn_regions = {}
+        self._full_redraw = True
+
+    def regions(self):
+        """
+        Descreve as partes da tela que podem mudar.
+
+        Returns:
+            dict: nome -> (pygame.Rect, estado comparável); quando o estado
+            muda, o retângulo antigo e o novo são redesenhados
+        """
+        return {}
+
+    @abstractmethod
+    def render(self, screen):
+        """Desenha a tela inteira (o recorte limita o trabalho em present())."""
+        pass
+
+    def animation_interval(self):
+        """
+        Intervalo entre quadros de animação.
+
+        Returns:
+            float: Segundos até o próximo quadro, ou None se a tela está parada
+        """
+        return None
+
+    def invalidate(self):
+        """Força um redesenho completo (janela exposta, tela recriada)."""
+        self._full_redraw = True
+
+    def handle_window_event(self, event):
+        """Redesenha tudo quando a janela volta a ser exibida."""
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            self.invalidate()
+
+    def dirty_rects(self):
+        """
+        Calcula as áreas que mudaram desde o último desenho.
+
+        Returns:
+            list: Retângulos a redesenhar (a tela inteira no primeiro desenho)
+        """
+        regions = self.regions()
+        screen_rect = pygame.Rect(0, 0, self.width, self.height)
+
+        if self._full_redraw:
+            self._full_redraw = False
+            self._drawn_regions = regions
+            return [screen_rect]
+
+        rects = []
+        for name, (rect, state) in regions.items():
+            previous = self._drawn_regions.get(name)
+            if previous is None:
+                rects.append(rect)
+            elif previous[1] != state:
+                # Posição antiga e nova; sobrepostas, viram um único retângulo
+                if previous[0].colliderect(rect):
+                    rects.append(rect.union(previous[0]))
+                else:
+                    rects.extend([previous[0], rect])
+        self._drawn_regions = regions
+
+        rects = [rect.clip(screen_rect) for rect in rects]
+        return [rect for rect in rects if rect.width > 0 and rect.height > 0]
+
+    def present(self, screen):
+        """
+        Redesenha as áreas sujas e as envia para a janela.
+
+        Args:
+            screen: Superfície da janela
+
+        Returns:
+            list: Retângulos atualizados (vazia se nada mudou)
+        """
+        rects = self.dirty_rects()
+        for rect in rects:
+            screen.set_clip(rect)
+            self.render(screen)
+        screen.set_clip(None)
+
+        if rects:
+            pygame.display.update(rects)
+        return rects
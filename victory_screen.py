@@ -1,8 +1,10 @@
 import pygame
 import os
+from render.text import text_renderer
+from ui_screen import RetainedScreen
 
 
-class VictoryScreen:
+class VictoryScreen(RetainedScreen):
     """Tela de vitória com créditos que aparece quando o jogador vence."""
 
     OUTRO_MUSIC_PATH = "assets/audio/outro.mp3"
@@ -15,19 +17,18 @@ class VictoryScreen:
             width: Largura da tela
             height: Altura da tela
         """
-        self.width = width
-        self.height = height
+        super().__init__(width, height)
 
         # Cores
         self.bg_color = (10, 10, 20)
         self.title_color = (255, 215, 0)  # Dourado
         self.credit_color = (200, 200, 200)
 
-        # Fontes
-        pygame.font.init()
-        self.title_font = pygame.font.Font(None, 100)
-        self.credit_font = pygame.font.Font(None, 50)
-        self.name_font = pygame.font.Font(None, 40)
+        # Tamanhos de fonte (textos rasterizados uma vez pelo text_renderer)
+        self.title_size = 100
+        self.credit_size = 50
+        self.name_size = 40
+        self.instruction_size = 30
 
         # Créditos
         self.credits = [
@@ -80,6 +81,38 @@ class VictoryScreen:
 
         return None
 
+    def _credit_lines(self):
+        """
+        Posiciona as linhas dos créditos na rolagem atual.
+
+        Returns:
+            list: (superfície, x, y, visível) de cada função e nome
+        """
+        lines = []
+        current_y = self.scroll_y
+        for role, name in self.credits:
+            for text, size, color, spacing in ((role, self.credit_size, self.credit_color, 60),
+                                               (name, self.name_size, self.title_color, 80)):
+                surface = text_renderer.render(text, size, color)
+                x = self.width // 2 - surface.get_width() // 2
+                visible = -50 < current_y < self.height + 50  # Só renderiza se visível
+                lines.append((surface, x, current_y, visible))
+                current_y += spacing
+        return lines
+
+    def regions(self):
+        """Cada linha dos créditos é redesenhada quando sua posição inteira muda."""
+        regions = {}
+        for i, (surface, x, y, visible) in enumerate(self._credit_lines()):
+            rect = pygame.Rect(x, int(y), surface.get_width(), surface.get_height())
+            regions[f'credit_{i}'] = (rect, (int(y), visible))
+        return regions
+
+    def animation_interval(self):
+        """Um pixel de rolagem por quadro, até os créditos saírem pelo topo."""
+        last_y = self.scroll_y + len(self.credits) * 140
+        return 1.0 / self.scroll_speed if last_y > -50 else None
+
     def render(self, screen):
         """
         Renderiza a tela de vitória.
@@ -91,29 +124,16 @@ class VictoryScreen:
         screen.fill(self.bg_color)
 
         # Título de vitória
-        title_text = self.title_font.render("VICTORY!", True, self.title_color)
+        title_text = text_renderer.render("VICTORY!", self.title_size, self.title_color)
         title_x = self.width // 2 - title_text.get_width() // 2
         screen.blit(title_text, (title_x, 100))
 
         # Créditos (rolagem)
-        current_y = self.scroll_y
-
-        for role, name in self.credits:
-            # Função
-            role_text = self.credit_font.render(role, True, self.credit_color)
-            role_x = self.width // 2 - role_text.get_width() // 2
-            if -50 < current_y < self.height + 50:  # Só renderiza se visível
-                screen.blit(role_text, (role_x, current_y))
-            current_y += 60
-
-            # Nome
-            name_text = self.name_font.render(name, True, self.title_color)
-            name_x = self.width // 2 - name_text.get_width() // 2
-            if -50 < current_y < self.height + 50:  # Só renderiza se visível
-                screen.blit(name_text, (name_x, current_y))
-            current_y += 80
+        for surface, x, y, visible in self._credit_lines():
+            if visible:
+                screen.blit(surface, (x, y))
 
         # Instruções na parte inferior
-        inst_font = pygame.font.Font(None, 30)
-        inst_text = inst_font.render("Press ESC or click to return to menu", True, self.credit_color)
+        inst_text = text_renderer.render("Press ESC or click to return to menu", self.instruction_size,
+                                         self.credit_color)
         screen.blit(inst_text, (self.width // 2 - inst_text.get_width() // 2, self.height - 50))
@@ -0,0 +1,82 @@
+import threading
+from concurrent.futures import Future
+from config import game_config
+from place.place import Place
+
+
+class WorldLoader:
+    """
+    Monta cenários (Place) em uma thread de fundo.
+
+    A montagem não usa o OpenGL (geração do labirinto, malhas, colisão,
+    tabelas de visibilidade e inimigos), então pode começar enquanto o menu
+    ainda está na tela. Os recursos de GPU são enviados depois, na thread
+    principal, com Place.upload_steps().
+    """
+
+    def __init__(self):
+        """Inicializa sem nenhuma montagem em andamento."""
+        self._future = None
+        self._settings = None  # Configuração usada pela montagem em andamento
+
+    @staticmethod
+    def _current_settings():
+        """Parâmetros da configuração que mudam o cenário montado."""
+        return (game_config.maze_size, game_config.enemy_count)
+
+    @staticmethod
+    def _build(future):
+        """Monta o cenário na thread de fundo e publica o resultado."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(Place())
+        except Exception as e:
+            future.set_exception(e)
+
+    def prefetch(self):
+        """
+        Começa a montar um cenário com a configuração atual, se ainda não há
+        um pronto (ou em andamento) para ela. Uma montagem com configuração
+        antiga é descartada.
+        """
+        settings = self._current_settings()
+        if self._future is not None and self._settings == settings:
+            return
+
+        if self._future is not None:
+            self._future.cancel()  # Sem efeito se já está rodando; o resultado é ignorado
+        self._future = Future()
+        self._settings = settings
+        # Thread daemon: sair do jogo não espera uma montagem descartada
+        threading.Thread(target=self._build, args=(self._future,), name="world-builder",
+                         daemon=True).start()
+
+    def ready(self):
+        """
+        Verifica se o cenário da configuração atual já está montado.
+
+        Returns:
+            bool: True se take() não vai bloquear
+        """
+        return (self._future is not None and self._settings == self._current_settings()
+                and self._future.done())
+
+    def take(self):
+        """
+        Obtém o cenário montado, esperando a thread se necessário.
+
+        Se a montagem falhou, monta o cenário na thread atual.
+
+        Returns:
+            Place: Cenário pronto para upload_steps()
+        """
+        self.prefetch()
+        future = self._future
+        self._future = None
+        self._settings = None
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Background world build failed, building in place: {e}")
+            return Place()